@@ -0,0 +1,48 @@
+"""
+Module: transform_plan benchmark
+Purpose: Compares per-cell cleaning with compiled conversion plans in 
+BaseTransformer on a synthetic wide table.
+
+Usage:
+    python -m benchmarks.transform_plan --rows 50000 --columns 40
+"""
+
+import argparse
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from src.python.transformers.base import BaseTransformer
+
+def make_rows(rows: int, columns: int):
+    """
+    Builds rows cycling through int, str, Decimal, datetime and null columns.
+    """
+    values = [7, "text", Decimal("19.99"), datetime(2024, 1, 1, 12, 30), None]
+    return [
+        {f"c{c}": values[c % len(values)] for c in range(columns)}
+        for _ in range(rows)
+    ]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--columns", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.columns)
+    transformer = BaseTransformer({"index_name": "bench"})
+    plan = transformer.compile_plan(rows)
+
+    for label, current in (("per-cell", None), ("plan", plan)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for row in rows:
+                transformer.transform(row, current)
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:>8}: {args.rows / best:,.0f} rows/s ({args.columns} columns)")
+
+if __name__ == "__main__":
+    main()
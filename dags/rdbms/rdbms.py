@@ -5,6 +5,8 @@ Purpose: Orchestrates RDBMS extraction, JSON transformation, and Elasticsearch l
 
 import warnings
 import logging
+import shutil
+from pathlib import Path
 
 # Warnings and Logging setup
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -15,14 +17,18 @@ from datetime import datetime
 from airflow import DAG
 from airflow.providers.standard.operators.python import PythonOperator
 from airflow.models import Variable
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 # Internal imports
 from src.python.credentials.factory import CredentialFactory
 from src.python.connectors.factory import ConnectorFactory
 from src.python.extractors.factory import ExtractorFactory
+from src.python.extractors.watermarks import WatermarkStoreFactory
 from src.python.transformers.factory import TransformerFactory
+from src.python.transformers.registry import reflect_schemas
 from src.python.loaders.factory import LoaderFactory
+from src.python.fingerprints import FingerprintFilter, SQLiteFingerprintStore
+from src.python.staging import SegmentWriter
 from src.python.utils.reader import load_yml
 
 logger = logging.getLogger(__name__)
@@ -62,12 +68,18 @@ def extraction_task(ti: Any, **kwargs: Any) -> Dict[str, Any]:
     CONFIG_PATH = Variable.get("college_db_config")
 
     creds = ti.xcom_pull(task_ids='psql_creds')
-    config = load_yml(CONFIG_PATH).get("postgres", {}).get("extraction", {})
+    postgres = load_yml(CONFIG_PATH).get("postgres", {})
+    config = postgres.get("extraction", {})
+    reflection = postgres.get("transformation", {}).get("schemas", {}).get("reflection")
 
     connector = ConnectorFactory.get_connector(connector_type="rdbms", config=creds)
     connection = connector() # Established SQLAlchemy connection
 
     try:
+        # Reflect the schemas of new tables once; later runs reuse the cache
+        if reflection:
+            reflect_schemas(connection, config.get("tables", []), reflection["path"])
+
         extractor = ExtractorFactory.get_extractor(
             extractor_type="rdbms", 
             connection=connection, 
@@ -77,32 +89,50 @@ def extraction_task(ti: Any, **kwargs: Any) -> Dict[str, Any]:
     finally:
         connection.close()
 
-def transformation_task(ti: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+def transformation_task(ti: Any, **kwargs: Any) -> Union[List[Dict[str, Any]], str]:
     """
     Transforms raw RDBMS rows into Elasticsearch-ready JSON actions.
     args:
     ti: Airflow Task Instance for XCom access.
     returns:
-    List[Dict[str, Any]]: List of transformed actions for bulk loading.
+    List[Dict[str, Any]] | str: List of transformed actions for bulk loading, 
+    or the staging directory they were written to when staging is configured.
     """
     CONFIG_PATH = Variable.get("college_db_config")
 
     raw_data = ti.xcom_pull(task_ids='extract_college_data')
     # Load configuration for indexing logic
-    config = load_yml(CONFIG_PATH).get("elasticsearch", {}).get("load", {})
+    full_config = load_yml(CONFIG_PATH)
+    config = full_config.get("elasticsearch", {}).get("load", {})
+    transformation = full_config.get("postgres", {}).get("transformation", {})
+
+    # Drop rows whose content did not change since the last successful load
+    fingerprint_config = full_config.get("postgres", {}).get("fingerprint")
+    if fingerprint_config:
+        raw_data = FingerprintFilter(data=raw_data, config=fingerprint_config)()
 
     transformer = TransformerFactory.get_transformer(
         transformer_type="json",
         data=raw_data,
-        config=config
+        # Schemas, process pool and document ids come from the transformation section
+        config={**config, **transformation}
     )
     
+    # Stage the actions on disk so a failed load can be retried on its own
+    staging = full_config.get("staging")
+    if staging:
+        directory = Path(staging["path"]) / kwargs["ts_nodash"]
+        SegmentWriter(directory, staging)(transformer())
+        return str(directory)
+
     # We convert the generator to a list to pass through XCom
     return list(transformer())
 
 def loading_task(ti: Any, **kwargs: Any) -> None:
     """
     Ingests transformed JSON data into Elasticsearch via Bulk API.
+    Incremental watermarks and row fingerprints are committed only after 
+    the load succeeded.
     args:
     ti: Airflow Task Instance for XCom access.
     returns:
@@ -112,13 +142,18 @@ def loading_task(ti: Any, **kwargs: Any) -> None:
     
     transformed_data = ti.xcom_pull(task_ids='transform_college_data')
     es_creds = ti.xcom_pull(task_ids='es_creds')
-    config = load_yml(CONFIG_PATH).get("elasticsearch", {}).get("load", {})
+    full_config = load_yml(CONFIG_PATH)
+    config = full_config.get("elasticsearch", {}).get("load", {})
+    watermarks = full_config.get("postgres", {}).get("extraction", {}).get("watermarks")
+    fingerprint_config = full_config.get("postgres", {}).get("fingerprint")
 
     connector = ConnectorFactory.get_connector(connector_type="elasticsearch", config=es_creds)
     es_connection = connector()
 
+    # A staging directory resumes from its checkpoint when the task is retried
+    staged = isinstance(transformed_data, str)
     loader = LoaderFactory.get_loader(
-        load_type="elasticsearch",
+        load_type="elasticsearch_staged" if staged else "elasticsearch",
         connection=es_connection,
         config=config
     )
@@ -126,6 +161,13 @@ def loading_task(ti: Any, **kwargs: Any) -> None:
     loader(data=transformed_data)
     logger.info("Health data ingestion successful.")
 
+    if watermarks:
+        WatermarkStoreFactory.get_store(watermarks).commit()
+    if fingerprint_config:
+        SQLiteFingerprintStore(fingerprint_config.get("path", "fingerprints.db")).commit()
+    if staged:
+        shutil.rmtree(transformed_data, ignore_errors=True)
+
 # --- DAG Definition ---
 
 default_args = {
@@ -163,9 +205,11 @@ with DAG(
         python_callable=transformation_task
     )
 
+    # Staged loads resume from their checkpoint, so retrying is cheap
     load_to_es = PythonOperator(
         task_id='load_to_es',
-        python_callable=loading_task
+        python_callable=loading_task,
+        retries=2
     )
 
     # Dependency Flow
@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from .base import API 
+from ..connectors.elasticsearch import close_async_clients
 
 def get():
     """ 
@@ -41,6 +42,9 @@ async def lifespan(application: FastAPI):
 
     print("server shutting down...")
 
+    # Release the async Elasticsearch clients shared by request handlers
+    await close_async_clients()
+
 def start():
     """ 
     Starts the lifespan handler.
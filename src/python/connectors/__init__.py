@@ -4,14 +4,23 @@ A unified interface for connecting to various data sources.
 
 import logging
 
-# Import the Factory and Connectors for easy external access
+from ..utils.registry import lazy_exports
+
+# Import the Factory for easy external access; connectors load on first access
 from .factory import ConnectorFactory
-from .rdbms import RDBMSConnector
+
+__getattr__ = lazy_exports(__name__, {
+    "RDBMSConnector": ".rdbms",
+    "ElasticsearchConnector": ".elasticsearch",
+    "AsyncElasticsearchConnector": ".elasticsearch",
+})
 
 # Define the public API for the package
 __all__ = [
     "ConnectorFactory",
     "RDBMSConnector",
+    "ElasticsearchConnector",
+    "AsyncElasticsearchConnector",
 ]
 
 # Set a default logger for the package to prevent "No handler found" warnings
@@ -2,17 +2,48 @@
 This file defines the ESConnector class, which simplifies the process 
 of establishing a connection to an Elasticsearch cluster.
 
-It handles URL construction, SSL verification settings, and connection 
-verification via ping.
+It handles URL construction, SSL verification settings, transport tuning 
+and connection verification via ping. Clients are cached per configuration, 
+so repeated calls reuse the same connection pool.
 """
 
+import asyncio
 import logging
-from elasticsearch import Elasticsearch
+import threading
+import weakref
+from typing import Any, Dict
+from elasticsearch import AsyncElasticsearch, Elasticsearch
 from .schemas import ElasticsearchConfig
 
 # --- Logger Setup ---
 logger = logging.getLogger(__name__)
 
+# Process-wide client cache keyed by the serialised configuration
+_CLIENTS: Dict[str, Elasticsearch] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Async clients are bound to the event loop that created them
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncElasticsearch]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def close_clients() -> None:
+    """
+    Closes every cached client and empties the cache.
+    """
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
+
+async def close_async_clients() -> None:
+    """
+    Closes the async clients cached for the running event loop.
+    """
+    clients = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
 class ElasticsearchConnector:
     """
     The ESConnector class acts as a wrapper around the official Elasticsearch client.
@@ -27,7 +58,9 @@ class ElasticsearchConnector:
         Args:
             config (dict): A dictionary containing connection parameters.
                            Expected keys: 'schema', 'host', 'port'.
-                           Optional keys: 'verify_certs'.
+                           Optional keys: 'verify_certs', 'hosts', 'connections_per_node',
+                           'http_compress', 'request_timeout', 'retry_on_timeout',
+                           'max_retries' and the sniffing options.
         """
         self.config = ElasticsearchConfig(**config)
         self._client = None
@@ -45,10 +78,35 @@ class ElasticsearchConnector:
         self.connect()
         return self._client
 
+    def _hosts(self) -> list:
+        """
+        Returns the primary node URL followed by any additional nodes.
+        """
+        es_host = f"{self.config.schema}://{self.config.host}:{self.config.port}"
+        return [es_host] + [host for host in (self.config.hosts or []) if host != es_host]
+
+    def _client_options(self) -> Dict[str, Any]:
+        """
+        Returns the client constructor arguments derived from the config.
+        """
+        return dict(
+            hosts=self._hosts(),
+            verify_certs=self.config.verify_certs,
+            connections_per_node=self.config.connections_per_node,
+            http_compress=self.config.http_compress,
+            request_timeout=self.config.request_timeout,
+            retry_on_timeout=self.config.retry_on_timeout,
+            max_retries=self.config.max_retries,
+            sniff_on_start=self.config.sniff_on_start,
+            sniff_on_node_failure=self.config.sniff_on_node_failure,
+            sniff_timeout=self.config.sniff_timeout,
+            min_delay_between_sniffing=self.config.min_delay_between_sniffing,
+        )
+
     def connect(self) -> None:
         """
-        Constructs the connection URL, initializes the Elasticsearch client,
-        and verifies the connection by pinging the server.
+        Reuses the cached client for this configuration, or initializes a new 
+        Elasticsearch client and verifies it by pinging the server.
 
         Args:
             None
@@ -59,24 +117,24 @@ class ElasticsearchConnector:
         Raises:
             ConnectionError: If the client fails to ping the Elasticsearch host.
         """
-        protocol = self.config.schema
-        host = self.config.host
-        port = self.config.port
+        cache_key = self.config.model_dump_json()
 
-        es_host = f"{protocol}://{host}:{port}"
-        verify_certs = self.config.verify_certs
+        with _CLIENTS_LOCK:
+            cached = _CLIENTS.get(cache_key)
+        if cached is not None:
+            logger.debug("Reusing cached Elasticsearch client.")
+            self._client = cached
+            return
 
-        logger.info(f"Attempting to connect to Elasticsearch at: {es_host}")
+        hosts = self._hosts()
+        logger.info(f"Attempting to connect to Elasticsearch at: {hosts}")
 
         try:
-            self._client = Elasticsearch(
-                hosts=[es_host],
-                verify_certs=verify_certs
-            )
+            client = Elasticsearch(**self._client_options())
             
             # Verify connection
-            if not self._client.ping():
-                error_msg = f"Could not connect to Elasticsearch at {es_host}. Ping failed."
+            if not client.ping():
+                error_msg = f"Could not connect to Elasticsearch at {hosts}. Ping failed."
                 logger.error(error_msg)
                 raise ConnectionError(error_msg)
             
@@ -84,4 +142,64 @@ class ElasticsearchConnector:
 
         except Exception as e:
             logger.exception(f"An error occurred while initializing Elasticsearch client: {e}")
-            raise
\ No newline at end of file
+            raise
+
+        with _CLIENTS_LOCK:
+            # Another thread may have connected meanwhile; keep the first client
+            self._client = _CLIENTS.setdefault(cache_key, client)
+        if self._client is not client:
+            client.close()
+
+
+class AsyncElasticsearchConnector(ElasticsearchConnector):
+    """
+    Non-blocking variant built on AsyncElasticsearch. Both connect() and 
+    calling the instance are coroutines. Clients are cached per event loop 
+    and configuration, so an application running on one loop (e.g. the 
+    FastAPI app) shares a single client.
+    """
+
+    async def __call__(self) -> AsyncElasticsearch:
+        """
+        Returns:
+            AsyncElasticsearch: An active async client instance.
+        """
+        logger.info("AsyncESConnector invoked. Ensuring connection is established.")
+        await self.connect()
+        return self._client
+
+    async def connect(self) -> None:
+        """
+        Reuses the cached client of the running loop, or creates a new one 
+        and verifies it by pinging the server.
+
+        Raises:
+            ConnectionError: If the client fails to ping the Elasticsearch host.
+        """
+        cache_key = self.config.model_dump_json()
+        clients = _ASYNC_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+
+        if cache_key in clients:
+            logger.debug("Reusing cached async Elasticsearch client.")
+            self._client = clients[cache_key]
+            return
+
+        hosts = self._hosts()
+        logger.info(f"Attempting async connection to Elasticsearch at: {hosts}")
+
+        client = AsyncElasticsearch(**self._client_options())
+        try:
+            if not await client.ping():
+                error_msg = f"Could not connect to Elasticsearch at {hosts}. Ping failed."
+                logger.error(error_msg)
+                raise ConnectionError(error_msg)
+        except Exception as e:
+            logger.exception(f"An error occurred while initializing async Elasticsearch client: {e}")
+            await client.close()
+            raise
+
+        logger.info("Successfully connected to Elasticsearch (async).")
+        # Another task may have connected while we awaited the ping
+        self._client = clients.setdefault(cache_key, client)
+        if self._client is not client:
+            await client.close()
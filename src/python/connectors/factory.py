@@ -6,11 +6,17 @@ connector classes based on a string identifier.
 import logging
 from typing import Any
 
-from .rdbms import RDBMSConnector
-from .elasticsearch import ElasticsearchConnector
+from ..utils.registry import LazyRegistry
 
 logger = logging.getLogger(__name__)
 
+# Implementations are imported on first use (SQLAlchemy, elasticsearch)
+CONNECTORS = LazyRegistry("water_bottle.connectors", __package__, {
+    "rdbms": ".rdbms:RDBMSConnector",
+    "elasticsearch": ".elasticsearch:ElasticsearchConnector",
+    "elasticsearch_async": ".elasticsearch:AsyncElasticsearchConnector",
+})
+
 class ConnectorFactory:
     """
     The Orchestrator class that selects the appropriate connector 
@@ -23,7 +29,8 @@ class ConnectorFactory:
         Instantiates the requested connector class using the provided config.
 
         Args:
-            connector_type (str): The type identifier ('rdbms').
+            connector_type (str): The type identifier ('rdbms', 'elasticsearch',
+                                  'elasticsearch_async').
             config (Any): Configuration data required by the chosen connector.
 
         Returns:
@@ -36,10 +43,8 @@ class ConnectorFactory:
         
         connector_type = connector_type.lower()
         
-        if connector_type == "rdbms":
-            return RDBMSConnector(config=config)
-        elif connector_type == "elasticsearch":
-            return ElasticsearchConnector(config=config)
+        if connector_type in CONNECTORS:
+            return CONNECTORS.get(connector_type)(config=config)
         else:
             error_msg = f"Unsupported connector type: {connector_type}"
             logger.error(error_msg)
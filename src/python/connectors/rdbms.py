@@ -1,15 +1,85 @@
 """
 Provides a connector for Relational Database Management Systems using SQLAlchemy.
 Supports dynamic URL generation based on the provided database type/driver.
+
+Engines are kept in a process-wide registry keyed by the normalised URL and 
+the pool options, so every connector, extractor and task in a worker that 
+asks for the same pool shares it.
 """
 
 import logging
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import URL
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, Connection, Engine
 from .schemas import RDBMSConfig
 
 logger = logging.getLogger(__name__)
 
+# Process-wide engine registry
+_ENGINES: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+def get_engine(url: URL, **pool_options) -> Engine:
+    """
+    Returns the registered engine for a URL and pool options, creating it 
+    on first use.
+
+    Args:
+        url (URL): The SQLAlchemy connection URL.
+        **pool_options: create_engine() pool arguments. Callers asking for 
+            different options get their own engine (and pool).
+
+    Returns:
+        Engine: The shared engine.
+    """
+    key = (url.render_as_string(hide_password=False), tuple(sorted(pool_options.items())))
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(key)
+        if engine is None:
+            engine = create_engine(url, **pool_options)
+            if any(existing[0] == key[0] for existing in _ENGINES):
+                logger.warning(
+                    f"Created another engine for {url.render_as_string()} because its pool options "
+                    f"differ from the registered one's: {pool_options}"
+                )
+            _ENGINES[key] = engine
+            logger.info(f"Created engine for {url.render_as_string()} with pool options: {pool_options}")
+        return engine
+
+def pool_capacity(engine: Any) -> Optional[int]:
+    """
+    Returns how many connections a registered engine hands out at once 
+    (pool_size + max_overflow), from the options it was created with.
+
+    Args:
+        engine (Any): An engine returned by get_engine().
+
+    Returns:
+        Optional[int]: The capacity, or None if the pool is unbounded 
+        (pool_size 0 or max_overflow -1) or the engine is not registered.
+    """
+    with _ENGINES_LOCK:
+        options = next((dict(key[1]) for key, registered in _ENGINES.items() if registered is engine), None)
+    if options is None:
+        return None
+    # create_engine() defaults for options that were not passed
+    size, overflow = options.get("pool_size", 5), options.get("max_overflow", 10)
+    if size == 0 or overflow < 0:
+        return None
+    return size + overflow
+
+def dispose_engines() -> None:
+    """
+    Closes all pooled connections and empties the registry.
+    """
+    with _ENGINES_LOCK:
+        for engine in _ENGINES.values():
+            engine.dispose()
+        _ENGINES.clear()
+
 class RDBMSConnector:
     """
     Manages the lifecycle of a SQLAlchemy engine and connection.
@@ -23,35 +93,45 @@ class RDBMSConnector:
         Args:
             config (dict): Database parameters including 'type', 'login', 
                           'password', 'host', 'port', and 'database'.
+                          Optional pool keys: 'pool_size', 'max_overflow',
+                          'pool_pre_ping', 'pool_recycle', 'pool_timeout'.
         """
         self.config = RDBMSConfig(**config)
         self._engine = None
         self._connection = None
         logger.debug("RDBMSConnector initialized for host: %s", self.config.host)
 
-    def __call__(self):
+    def __call__(self) -> Connection:
         """
         Enables the instance to be called to establish and return a connection.
+        The connection is checked out from the shared pool; closing it 
+        returns it to the pool.
 
         Returns:
             sqlalchemy.engine.Connection: An active database connection.
+
+        Raises:
+            Exception: If no connection can be checked out.
         """
         self.connect()
+        try:
+            self._connection = self._engine.connect()
+        except Exception:
+            logger.exception("Failed to establish RDBMS connection.")
+            raise
         return self._connection
 
     def connect(self) -> None:
         """
-        Constructs a SQLAlchemy URL, creates the engine, and verifies 
-        the connectivity by executing a 'SELECT 1' test query.
+        Constructs a SQLAlchemy URL and looks up (or creates) its shared 
+        engine. No round trip happens here: connections are validated by 
+        'pool_pre_ping' when they are checked out.
 
         Args:
             None
 
         Returns:
             None
-
-        Raises:
-            Exception: If the database connection or test query fails.
         """
         url_params = {
             "drivername": self.config.type,
@@ -66,15 +146,33 @@ class RDBMSConnector:
         
         logger.info(f"Connecting to database: {url_params['database']} at {url_params['host']}")
         
-        try:
-            self._engine = create_engine(connection_url)
-            
-            # Test Connection
-            with self._engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-            
-            self._connection = self._engine.connect()
-            logger.info("RDBMS connection established and verified.")
-        except Exception as e:
-            logger.exception("Failed to establish RDBMS connection.")
-            raise
\ No newline at end of file
+        self._engine = get_engine(
+            connection_url,
+            pool_size=self.config.pool_size,
+            max_overflow=self.config.max_overflow,
+            pool_pre_ping=self.config.pool_pre_ping,
+            pool_recycle=self.config.pool_recycle,
+            pool_timeout=self.config.pool_timeout,
+        )
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        """
+        Checks a connection out of the shared pool for the duration of a 
+        'with' block and returns it afterwards.
+
+        Yields:
+            sqlalchemy.engine.Connection: A pooled database connection.
+        """
+        if self._engine is None:
+            self.connect()
+        with self._engine.connect() as conn:
+            yield conn
+
+    def close(self) -> None:
+        """
+        Returns the connection handed out by __call__ to the pool.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional
 
 class ElasticsearchConfig(BaseModel):
     """
@@ -10,4 +11,21 @@ class ElasticsearchConfig(BaseModel):
     schema: str
     host: str
     port: int
-    verify_certs: bool
\ No newline at end of file
+    verify_certs: bool
+
+    # Additional nodes (e.g. 'https://es-2:9200') so bulk traffic spreads 
+    # over every coordinating node
+    hosts: Optional[List[str]] = None
+
+    # Transport tuning
+    connections_per_node: int = Field(default=10, gt=0)
+    http_compress: bool = False
+    request_timeout: float = Field(default=10.0, gt=0)
+    retry_on_timeout: bool = False
+    max_retries: int = Field(default=3, ge=0)
+
+    # Node discovery
+    sniff_on_start: bool = False
+    sniff_on_node_failure: bool = False
+    sniff_timeout: float = Field(default=0.5, gt=0)
+    min_delay_between_sniffing: float = Field(default=10.0, ge=0)
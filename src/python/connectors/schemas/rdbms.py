@@ -14,4 +14,13 @@ class RDBMSConfig(BaseModel):
 
     # This tells Pydantic: "Try to find 'database' first. 
     # If it's not there, look for 'schema'."
-    database: str = Field(validation_alias=AliasChoices('database', 'schema'))
\ No newline at end of file
+    database: str = Field(validation_alias=AliasChoices('database', 'schema'))
+
+    # Connection pool settings, shared by every user of the same engine
+    pool_size: int = Field(default=5, ge=0)
+    max_overflow: int = Field(default=10, ge=0)
+    # Checks a connection with a lightweight ping on checkout
+    pool_pre_ping: bool = True
+    # Seconds after which a connection is replaced (-1 disables)
+    pool_recycle: int = 1800
+    pool_timeout: float = Field(default=30, gt=0)
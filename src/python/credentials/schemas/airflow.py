@@ -6,12 +6,20 @@ class AirflowConnectionSchema(BaseModel):
     Validates and masks sensitive data fetched from Airflow.
     """
     # This tells Pydantic it's okay if we use names that might overlap with internal protected names.
+    # Other extras (e.g. Elasticsearch transport tuning) are passed through as-is.
 
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = ConfigDict(protected_namespaces=(), extra="allow")
     host: Optional[str] = None
     port: Optional[int] = None
     login: Optional[str] = None
     password: Optional[str] = None
     schema: Optional[str] = None  # Airflow DB name or ES Protocol
     type: Optional[str] = None    # SQLAlchemy dialect+driver
-    verify_certs: Optional[bool] = None
\ No newline at end of file
+    verify_certs: Optional[bool] = None
+
+    # Optional RDBMS pool tuning from the connection extras
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    pool_pre_ping: Optional[bool] = None
+    pool_recycle: Optional[int] = None
+    pool_timeout: Optional[float] = None
\ No newline at end of file
@@ -1,9 +1,14 @@
 import logging
 
+from ..utils.registry import lazy_exports
 from .factory import EmbedderFactory
-from .txtai import TxtaiEmbeddings
 from .schemas import EmbeddingsConfig
 
+# txtai pulls in torch, so load it on first access
+__getattr__ = lazy_exports(__name__, {
+    "TxtaiEmbeddings": ".txtai",
+})
+
 # Define the public API for the package
 __all__ = [
     "EmbedderFactory",
@@ -6,10 +6,15 @@ embedder classes based on a string identifier.
 import logging
 from typing import Any
 
-from .txtai import TxtaiEmbeddings
+from ..utils.registry import LazyRegistry
 
 logger = logging.getLogger(__name__)
 
+# Implementations are imported on first use (txtai, torch)
+EMBEDDERS = LazyRegistry("water_bottle.embedders", __package__, {
+    "txtai": ".txtai:TxtaiEmbeddings",
+})
+
 class EmbedderFactory:
     """
     The Orchestrator class that selects the appropriate embedder 
@@ -36,8 +41,8 @@ class EmbedderFactory:
         
         embedder_type = embedder_type.lower()
         
-        if embedder_type == "txtai":
-            return TxtaiEmbeddings(data=data, config=config)
+        if embedder_type in EMBEDDERS:
+            return EMBEDDERS.get(embedder_type)(data=data, config=config)
         else:
             error_msg = f"Unsupported embedder type: {embedder_type}"
             logger.error(error_msg)
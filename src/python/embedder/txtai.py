@@ -59,7 +59,8 @@ class TxtaiEmbeddings:
             Dict[str, Any]: Records updated with vector embeddings.
         """
         for record in self.data:
-            source_data = record.get("_source", {})
+            # Partial updates carry the document under 'doc'
+            source_data = record.get("_source") or record.get("doc") or {}
             text = source_data.get("text", "")
             
             if text:
@@ -5,7 +5,12 @@ Purpose:
     Handles logic for pulling and normalizing data from various sources.
 """
 
-from .rdbms import RDBMSExtractor
+from ..utils.registry import lazy_exports
+
+# Imported on first access so that e.g. `extractors.watermarks` stays light
+__getattr__ = lazy_exports(__name__, {
+    "RDBMSExtractor": ".rdbms",
+})
 
 __all__ = [
     "RDBMSExtractor",
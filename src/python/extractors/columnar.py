@@ -0,0 +1,73 @@
+"""
+columnar.py
+====================================
+Purpose:
+    Builds Arrow record batches straight from cursor tuples, so columnar 
+    extraction never allocates a dict per row.
+"""
+
+import logging
+from typing import Any, Dict, List, Sequence
+
+# Module-level Conditional Import
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+def require_pyarrow() -> None:
+    """
+    Purpose: Guards columnar output when pyarrow is missing.
+
+    Raises:
+        ImportError: If pyarrow is not installed in the environment.
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "pyarrow is not installed. Please install it with 'pip install pyarrow' "
+            "to use the 'arrow' output format."
+        )
+
+def to_record_batch(names: Sequence[str], rows: Sequence[Sequence[Any]]) -> "pa.RecordBatch":
+    """
+    Purpose: Transposes row tuples into typed Arrow columns.
+
+    Args:
+        names (Sequence[str]): Column names in cursor order.
+        rows (Sequence[Sequence[Any]]): Row tuples from the cursor.
+
+    Returns:
+        pa.RecordBatch: One column per name, types inferred by Arrow.
+    """
+    columns = zip(*rows) if rows else ([] for _ in names)
+    return pa.RecordBatch.from_arrays([pa.array(column) for column in columns], names=list(names))
+
+def from_dicts(rows: List[Dict[str, Any]]) -> "pa.RecordBatch":
+    """
+    Purpose: Converts already materialised dict rows into a record batch.
+
+    Args:
+        rows (List[Dict[str, Any]]): Rows keyed by column name.
+
+    Returns:
+        pa.RecordBatch: The same data in columnar form.
+    """
+    return pa.RecordBatch.from_pylist(rows)
+
+def combine(batches: List["pa.RecordBatch"]) -> "pa.Table":
+    """
+    Purpose: Joins a table's batches. Types inferred differently per batch 
+    (an all-null column, int vs float) are promoted to a common type.
+
+    Args:
+        batches (List[pa.RecordBatch]): Batches of one table.
+
+    Returns:
+        pa.Table: All rows of the table.
+    """
+    if not batches:
+        return pa.table({})
+    return pa.concat_tables([pa.Table.from_batches([batch]) for batch in batches], promote_options="permissive")
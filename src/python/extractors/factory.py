@@ -1,9 +1,14 @@
 import logging
 from typing import Any, Dict
-from .rdbms import RDBMSExtractor
+from ..utils.registry import LazyRegistry
 
 logger = logging.getLogger(__name__)
 
+# Implementations are imported on first use
+EXTRACTORS = LazyRegistry("water_bottle.extractors", __package__, {
+    "rdbms": ".rdbms:RDBMSExtractor",
+})
+
 """
 factory.py
 ====================================
@@ -38,8 +43,8 @@ class ExtractorFactory:
         logger.info(f"ExtractorFactory generating '{extractor_type}' extractor.")
         extractor_type = extractor_type.lower().strip()
 
-        if extractor_type == "rdbms":
-            return RDBMSExtractor(connection=connection, config=config)
+        if extractor_type in EXTRACTORS:
+            return EXTRACTORS.get(extractor_type)(connection=connection, config=config)
         else:
             error_msg = f"Unknown extractor type: {extractor_type}"
             logger.error(error_msg)
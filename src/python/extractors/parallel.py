@@ -0,0 +1,99 @@
+"""
+parallel.py
+====================================
+Purpose:
+    Runs several batch producers on a thread pool and merges their output 
+    into one stream with bounded buffering.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of one producer in the shared queue
+_DONE = object()
+
+class _Failure:
+    """Wraps an exception raised inside a producer thread."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+def _reraise(label: str, error: BaseException) -> None:
+    raise error
+
+def merge_streams(
+    tasks: List[Tuple[str, Callable[[], Iterator[Any]]]],
+    max_workers: int,
+    queue_size: Optional[int] = None,
+    on_error: Callable[[str, BaseException], None] = _reraise
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Purpose: Consumes every producer concurrently and yields their items 
+    as they arrive. Producers block once 'queue_size' items are waiting, 
+    so memory stays bounded by the consumer's pace.
+
+    Args:
+        tasks (List[Tuple[str, Callable]]): (label, producer) pairs. Each 
+            producer is called in a worker thread and must return an iterator.
+        max_workers (int): Number of producers running at the same time.
+        queue_size (Optional[int]): Items buffered ahead of the consumer.
+            Defaults to twice the number of workers.
+        on_error (Callable[[str, BaseException], None]): Called with the label 
+            and the exception of a failed producer. The default re-raises.
+
+    Yields:
+        Tuple[str, Any]: The producer label and one produced item.
+    """
+    results = queue.Queue(maxsize=queue_size or max_workers * 2)
+    stop = threading.Event()
+
+    def put(entry: Tuple[str, Any]) -> bool:
+        # Retry in short slices so a stopped consumer never deadlocks a worker
+        while not stop.is_set():
+            try:
+                results.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(label: str, task: Callable[[], Iterator[Any]]) -> None:
+        if stop.is_set():
+            return
+        iterator = None
+        try:
+            iterator = task()
+            for item in iterator:
+                if not put((label, item)):
+                    return
+            put((label, _DONE))
+        except BaseException as e:
+            put((label, _Failure(e)))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for label, task in tasks:
+            pool.submit(run, label, task)
+
+        pending = len(tasks)
+        while pending:
+            label, item = results.get()
+            if item is _DONE:
+                pending -= 1
+            elif isinstance(item, _Failure):
+                pending -= 1
+                on_error(label, item.error)
+            else:
+                yield label, item
+    finally:
+        stop.set()
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,185 @@
+"""
+pgcopy.py
+====================================
+Purpose:
+    Fast path for PostgreSQL (psycopg2) that streams query results through 
+    'COPY (SELECT ...) TO STDOUT' instead of fetching rows via a cursor.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy import text
+
+# Module-level Conditional Import
+try:
+    from psycopg2 import extensions as pg_extensions
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+from .columnar import to_record_batch
+
+logger = logging.getLogger(__name__)
+
+# COPY text format escapes (backslash followed by one character)
+_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v", "\\": "\\"}
+_ESCAPE_RE = re.compile(r"\\(x[0-9a-fA-F]{1,2}|[0-7]{1,3}|.)")
+
+def _unescape(match: "re.Match") -> str:
+    code = match.group(1)
+    if code in _ESCAPES:
+        return _ESCAPES[code]
+    if code[0] == "x":
+        return chr(int(code[1:], 16))
+    if code[0].isdigit():
+        return chr(int(code, 8))
+    return code
+
+# PostgreSQL type OIDs -> fast decoder from COPY text output; other types 
+# go through psycopg2's own typecasters (see _converter)
+_CONVERTERS: Dict[int, Callable[[str], Any]] = {
+    16: lambda raw: raw == "t",                # bool
+    20: int, 21: int, 23: int, 26: int,        # int8, int2, int4, oid
+    700: float, 701: float,                    # float4, float8
+    1700: Decimal,                             # numeric (NaN/Infinity included)
+    114: json.loads, 3802: json.loads,         # json, jsonb
+}
+
+def _converter(oid: int, cursor: Any) -> Optional[Callable[[str], Any]]:
+    """
+    Purpose: Picks the decoder of a column so COPY yields the same values as 
+    the cursor path: the fast decoders above, else the typecaster psycopg2 
+    would apply (dates, times, intervals, arrays, bytea, uuid once registered, 
+    ...), looked up on the cursor, its connection, then globally. Types 
+    without a typecaster are strings on both paths.
+
+    Args:
+        oid (int): The column's type OID.
+        cursor (Any): The psycopg2 cursor running the COPY.
+
+    Returns:
+        Optional[Callable[[str], Any]]: The decoder, or None to keep strings.
+    """
+    if oid in _CONVERTERS:
+        return _CONVERTERS[oid]
+    registries = [
+        getattr(cursor, "string_types", None),
+        getattr(getattr(cursor, "connection", None), "string_types", None),
+        pg_extensions.string_types if PSYCOPG2_AVAILABLE else None,
+    ]
+    for registry in registries:
+        if isinstance(registry, dict) and oid in registry:
+            caster = registry[oid]
+            return lambda raw: caster(raw, cursor)
+    return None
+
+def supports_copy(connection: Any) -> bool:
+    """
+    Purpose: Tells whether the connection's dialect can use the COPY fast path.
+
+    Args:
+        connection (Any): SQLAlchemy connection.
+
+    Returns:
+        bool: True for the 'postgresql+psycopg2' dialect.
+    """
+    dialect = getattr(connection, "dialect", None)
+    return getattr(dialect, "name", None) == "postgresql" and getattr(dialect, "driver", None) == "psycopg2"
+
+def decode_line(line: str, converters: List[Optional[Callable[[str], Any]]]) -> List[Any]:
+    """
+    Purpose: Decodes one line of COPY text format into Python values.
+
+    Args:
+        line (str): A line without its trailing newline.
+        converters (List[Optional[Callable]]): One decoder per column, or 
+            None to keep the value as a string.
+
+    Returns:
+        List[Any]: The column values.
+    """
+    values = []
+    for raw, convert in zip(line.split("\t"), converters):
+        if raw == "\\N":
+            values.append(None)
+            continue
+        if "\\" in raw:
+            raw = _ESCAPE_RE.sub(_unescape, raw)
+        values.append(convert(raw) if convert else raw)
+    return values
+
+def copy_batches(
+    connection: Any,
+    query: str,
+    params: Dict[str, Any],
+    batch_size: int,
+    columnar: bool = False
+) -> Iterator[Any]:
+    """
+    Purpose: Runs a SELECT through COPY and yields row batches shaped like 
+    the cursor path. The COPY output is piped from a background thread, so 
+    only one batch is decoded and held at a time.
+
+    Args:
+        connection (Any): SQLAlchemy connection on a psycopg2 engine.
+        query (str): SELECT statement using ':name' bind parameters.
+        params (Dict[str, Any]): Bind parameter values.
+        batch_size (int): Rows per yielded batch.
+        columnar (bool): Yield pyarrow record batches instead of dict rows.
+
+    Yields:
+        List[Dict[str, Any]] | pa.RecordBatch: A batch of rows.
+
+    Raises:
+        Exception: Any error raised by the COPY command.
+    """
+    # COPY takes no parameters, so let the driver inline them safely
+    compiled = text(query).bindparams(**params).compile(dialect=connection.dialect)
+    cursor = connection.connection.cursor()
+    select_sql = cursor.mogrify(str(compiled), compiled.params).decode()
+
+    # A zero-row probe gives column names and type OIDs for decoding
+    cursor.execute(f"SELECT * FROM ({select_sql}) AS probe LIMIT 0")
+    names = [column[0] for column in cursor.description]
+    converters = [_converter(column[1], cursor) for column in cursor.description]
+
+    read_fd, write_fd = os.pipe()
+    errors: List[BaseException] = []
+
+    def produce() -> None:
+        try:
+            with os.fdopen(write_fd, "wb") as sink:
+                cursor.copy_expert(f"COPY ({select_sql}) TO STDOUT", sink)
+        except BaseException as e:
+            errors.append(e)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    def shape(values: List[List[Any]]) -> Any:
+        if columnar:
+            return to_record_batch(names, values)
+        return [dict(zip(names, row)) for row in values]
+
+    try:
+        with os.fdopen(read_fd, "r", encoding="utf-8", newline="\n") as source:
+            batch = []
+            for line in source:
+                batch.append(decode_line(line.rstrip("\n"), converters))
+                if len(batch) >= batch_size:
+                    yield shape(batch)
+                    batch = []
+            if batch:
+                yield shape(batch)
+    finally:
+        producer.join()
+        cursor.close()
+
+    if errors:
+        raise errors[0]
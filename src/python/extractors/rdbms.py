@@ -1,8 +1,16 @@
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from sqlalchemy import text
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+from ..connectors.rdbms import pool_capacity
 from .base import BaseExtractor
-from .schemas import RDBMSExtractorConfig
+from . import columnar
+from .parallel import merge_streams
+from .pgcopy import copy_batches, supports_copy
+from .schemas import RDBMSExtractorConfig, RDBMSTableConfig
+from .watermarks import WatermarkStoreFactory
 
 logger = logging.getLogger(__name__)
 
@@ -30,45 +38,599 @@ class RDBMSExtractor(BaseExtractor):
         """
         self.connection = connection
         self.config = RDBMSExtractorConfig(**config)
+        self.watermarks = None
+        if self.config.watermarks is not None:
+            self.watermarks = WatermarkStoreFactory.get_store(self.config.watermarks.model_dump())
+        # Per-table row counts and timings of the last run
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        # Pooled connections the workers of a run may hold besides the 
+        # caller's; None when the pool is unbounded or unknown
+        self._budget: Optional[threading.BoundedSemaphore] = None
+        self._budget_size: Optional[int] = None
 
-    def __call__(self) -> Dict[str, List[Dict[str, Any]]]:
+        self.use_arrow = self.config.output_format == "arrow"
+        if self.use_arrow:
+            columnar.require_pyarrow()
+
+        self.use_copy = self.config.read_method == "copy" and supports_copy(connection)
+        if self.config.read_method == "copy" and not self.use_copy:
+            logger.warning("COPY extraction needs postgresql+psycopg2; falling back to cursor reads.")
+
+    def __call__(self) -> Union[Dict[str, List[Dict[str, Any]]], Iterator[Tuple[str, List[Dict[str, Any]]]]]:
         """
-        Purpose: Executes the extract method.
+        Purpose: Executes the extract method, or the stream method when 
+        'stream' is enabled in the config.
 
         Returns:
-            Dict[str, List[Dict[str, Any]]]: Results keyed by table name.
+            Dict[str, List[Dict[str, Any]]]: Results keyed by table name, or
+            Iterator[Tuple[str, List[Dict[str, Any]]]]: (table_name, rows) batches.
         """
+        if self.config.stream:
+            return self.stream()
         return self.extract()
 
+    def _columns(self, table: RDBMSTableConfig) -> str:
+        """
+        Purpose: Builds the column list, making sure incremental tables 
+        always select the columns their watermark is built from.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+
+        Returns:
+            str: The column list for the SELECT clause.
+        """
+        cols = list(table.columns or [])
+        if not cols:
+            return "*"
+        if table.extraction_mode == "incremental":
+            for required in (table.incremental_column, table.primary_key):
+                if required not in cols:
+                    cols.append(required)
+        return ", ".join(cols)
+
+    def _source(self, table: RDBMSTableConfig) -> str:
+        """
+        Purpose: Builds the FROM clause: the table with its joins, or the 
+        configured raw query as a derived table.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+
+        Returns:
+            str: The FROM clause without the FROM keyword.
+        """
+        if table.query:
+            return f"({table.query.strip()}) AS {table.alias or 'src'}"
+
+        source = f"{table.schema}.{table.table_name}"
+        if table.alias:
+            source += f" AS {table.alias}"
+        for join in table.joins:
+            target = f"{join.schema}.{join.table_name}"
+            if join.alias:
+                target += f" AS {join.alias}"
+            source += f" {join.type.upper()} JOIN {target} ON {join.on}"
+        return source
+
+    def _where(self, table: RDBMSTableConfig, conditions: Tuple[str, ...] = ()) -> str:
+        """
+        Purpose: Combines the configured 'where' with extra conditions.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+            conditions (Tuple[str, ...]): Conditions added by the read strategy.
+
+        Returns:
+            str: The WHERE clause with a leading space, or an empty string.
+        """
+        conditions = [condition for condition in (table.where, *conditions) if condition]
+        if not conditions:
+            return ""
+        if len(conditions) == 1:
+            return f" WHERE {conditions[0]}"
+        return " WHERE " + " AND ".join(f"({condition})" for condition in conditions)
+
+    def _build_query(self, table: RDBMSTableConfig, conditions: Tuple[str, ...] = ()) -> str:
+        """
+        Purpose: Builds the SELECT statement for a single table entry.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+            conditions (Tuple[str, ...]): Conditions added by the read strategy.
+
+        Returns:
+            str: The SQL query string.
+        """
+        return f"SELECT {self._columns(table)} FROM {self._source(table)}{self._where(table, conditions)}"
+
+    def _build_full_query(self, table: RDBMSTableConfig) -> Tuple[str, Dict[str, Any]]:
+        """
+        Purpose: Builds a plain full read, including 'order_by' and 'limit'.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: The SQL query string and its bind parameters.
+        """
+        query = self._build_query(table)
+        params = dict(table.params)
+        if table.order_by:
+            query += " ORDER BY " + ", ".join(table.order_by)
+        if table.limit:
+            query += " LIMIT :row_limit"
+            params["row_limit"] = table.limit
+        return query, params
+
+    def _build_keyset_query(self, table: RDBMSTableConfig, has_mark: bool) -> str:
+        """
+        Purpose: Builds one keyset page of an incremental read. Rows are ordered 
+        by (incremental_column, primary_key) so pages never skip or repeat rows 
+        that share an incremental value.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+            has_mark (bool): Whether a previous mark is bound as ':last_value'/':last_key'.
+
+        Returns:
+            str: The SQL query string.
+        """
+        inc, pk = table.incremental_column, table.primary_key
+        if has_mark:
+            condition = f"{inc} > :last_value OR ({inc} = :last_value AND {pk} > :last_key)"
+        else:
+            condition = f"{inc} IS NOT NULL"
+        return f"{self._build_query(table, (condition,))} ORDER BY {inc}, {pk} LIMIT :batch_size"
+
+    def _watermark_key(self, table: RDBMSTableConfig) -> str:
+        """
+        Purpose: Returns the key a table's mark is stored under.
+        """
+        key = f"{table.schema}.{table.table_name}"
+        return f"{self.config.source_name}.{key}" if self.config.source_name else key
+
+    def _read_table(self, table: RDBMSTableConfig, stream: bool, connection: Any) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Purpose: Yields the rows of one table as batches.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+            stream (bool): Whether to use a server-side cursor for full reads.
+            connection (Any): The connection to read through.
+
+        Yields:
+            List[Dict[str, Any]]: A batch of rows.
+        """
+        if table.extraction_mode == "incremental":
+            for rows in self._read_incremental(table, connection):
+                # Keyset pages need dict rows to read the watermark
+                yield columnar.from_dicts(rows) if self.use_arrow else rows
+        elif table.partition_column and table.num_partitions > 1:
+            yield from self._read_partitioned(table, connection)
+        elif stream or self.use_copy or self.use_arrow:
+            yield from self._fetch(connection, *self._build_full_query(table), table.batch_size)
+        else:
+            query, params = self._build_full_query(table)
+            result_proxy = connection.execute(text(query), params)
+            # mappings() allows dict-like access to row columns
+            yield [dict(row) for row in result_proxy.mappings()]
+
+    def _fetch(self, connection: Any, query: str, params: Dict[str, Any], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Purpose: Streams a query as row batches, through COPY when enabled 
+        and supported, otherwise through a server-side cursor.
+
+        Args:
+            connection (Any): The connection to read through.
+            query (str): The SQL query string.
+            params (Dict[str, Any]): Bind parameters.
+            batch_size (int): Rows per batch.
+
+        Yields:
+            List[Dict[str, Any]] | pa.RecordBatch: A batch of rows.
+        """
+        if self.use_copy:
+            yield from copy_batches(connection, query, params, batch_size, columnar=self.use_arrow)
+            return
+
+        # yield_per implies stream_results, i.e. a server-side cursor. The 
+        # options apply to this statement only: Connection.execution_options() 
+        # would switch the caller's connection for every later statement
+        result_proxy = connection.execute(
+            text(query),
+            params,
+            execution_options={"stream_results": True, "yield_per": batch_size}
+        )
+
+        if self.use_arrow:
+            names = list(result_proxy.keys())
+            for partition in result_proxy.partitions(batch_size):
+                yield columnar.to_record_batch(names, partition)
+            return
+
+        for partition in result_proxy.mappings().partitions(batch_size):
+            yield [dict(row) for row in partition]
+
+    def _read_incremental(self, table: RDBMSTableConfig, connection: Any) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Purpose: Pages through rows newer than the committed watermark and 
+        stages the new mark once the table has been read completely. Rows 
+        with a NULL incremental value cannot be ordered against a mark: the 
+        initial run (no mark yet) reads them after the others, later runs 
+        only log how many are skipped.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+            connection (Any): The connection to read through.
+
+        Yields:
+            List[Dict[str, Any]]: One keyset page of rows.
+        """
+        key = self._watermark_key(table)
+        # Qualified names like 'u.updated_at' come back as 'updated_at'
+        inc, pk = (name.split(".")[-1] for name in (table.incremental_column, table.primary_key))
+
+        # Drop leftovers from a run whose load never completed
+        self.watermarks.stage(key, None)
+        mark: Optional[Dict[str, Any]] = self.watermarks.get(key)
+        logger.info(f"Incremental read of {key} starting after: {mark}")
+
+        initial = mark is None
+        new_mark = None
+        while True:
+            params = {**table.params, "batch_size": table.batch_size}
+            if mark is not None:
+                params.update(last_value=mark["value"], last_key=mark["key"])
+
+            query = self._build_keyset_query(table, has_mark=mark is not None)
+            result_proxy = connection.execute(text(query), params)
+            rows = [dict(row) for row in result_proxy.mappings()]
+
+            if rows:
+                mark = new_mark = {"value": rows[-1][inc], "key": rows[-1][pk]}
+                yield rows
+
+            if len(rows) < table.batch_size:
+                break
+
+        if initial:
+            yield from self._read_null_marks(table, connection)
+        else:
+            query = f"SELECT COUNT(*) FROM {self._source(table)}{self._where(table, (f'{table.incremental_column} IS NULL',))}"
+            skipped = connection.execute(text(query), dict(table.params)).scalar()
+            if skipped:
+                logger.warning(
+                    f"{skipped} row(s) of {key} have a NULL {table.incremental_column} "
+                    "and are only read by a full (initial) extraction."
+                )
+
+        if new_mark is not None:
+            self.watermarks.stage(key, new_mark)
+
+    def _read_null_marks(self, table: RDBMSTableConfig, connection: Any) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Purpose: Pages by primary key through the rows whose incremental 
+        value is NULL.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+            connection (Any): The connection to read through.
+
+        Yields:
+            List[Dict[str, Any]]: One keyset page of rows.
+        """
+        inc, pk = table.incremental_column, table.primary_key
+        last_key = None
+        while True:
+            params = {**table.params, "batch_size": table.batch_size}
+            conditions = [f"{inc} IS NULL"]
+            if last_key is not None:
+                conditions.append(f"{pk} > :last_key")
+                params["last_key"] = last_key
+            query = f"{self._build_query(table, tuple(conditions))} ORDER BY {pk} LIMIT :batch_size"
+            rows = [dict(row) for row in connection.execute(text(query), params).mappings()]
+
+            if rows:
+                last_key = rows[-1][pk.split(".")[-1]]
+                logger.info(f"Read {len(rows)} row(s) of {table.table_name} with a NULL {inc}.")
+                yield rows
+
+            if len(rows) < table.batch_size:
+                break
+
+    def _partition_bounds(self, table: RDBMSTableConfig, connection: Any) -> List[Any]:
+        """
+        Purpose: Computes the sorted, distinct upper bounds of each partition.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+            connection (Any): The connection to query the bounds on.
+
+        Returns:
+            List[Any]: Upper bounds; the last one equals the column maximum.
+            Empty when the table has no non-null partition values.
+
+        Raises:
+            ValueError: If 'range' is used on a column that is not numeric or temporal.
+        """
+        col, n = table.partition_column, table.num_partitions
+        # Bounds are computed over the filtered, joined source
+        source = self._source(table)
+
+        if table.partition_strategy == "ntile":
+            query = (
+                f"SELECT MAX(partition_key) FROM ("
+                f"SELECT {col} AS partition_key, NTILE(:num_partitions) OVER (ORDER BY {col}) AS bucket "
+                f"FROM {source}{self._where(table, (f'{col} IS NOT NULL',))}"
+                f") AS tiles GROUP BY bucket ORDER BY 1"
+            )
+            params = {**table.params, "num_partitions": n}
+            uppers = [row[0] for row in connection.execute(text(query), params)]
+        else:
+            query = f"SELECT MIN({col}), MAX({col}) FROM {source}{self._where(table)}"
+            lower, upper = connection.execute(text(query), dict(table.params)).one()
+            if lower is None:
+                return []
+            try:
+                if isinstance(lower, int):
+                    uppers = [lower + (upper - lower) * i // n for i in range(1, n)]
+                else:
+                    uppers = [lower + (upper - lower) * i / n for i in range(1, n)]
+            except TypeError:
+                raise ValueError(
+                    f"Column '{col}' of {table.table_name} cannot be range-partitioned; use partition_strategy 'ntile'."
+                )
+            uppers.append(upper)
+
+        # Small ranges or heavy duplicates collapse into fewer partitions
+        return sorted(set(uppers))
+
+    def _read_partitioned(self, table: RDBMSTableConfig, connection: Any) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Purpose: Reads disjoint ranges of 'partition_column' concurrently, each 
+        on its own pooled connection, and merges them into one batch stream.
+
+        Args:
+            table (RDBMSTableConfig): The table configuration.
+            connection (Any): The connection used to compute the bounds.
+
+        Yields:
+            List[Dict[str, Any]]: A batch of rows from any of the partitions.
+        """
+        col = table.partition_column
+        uppers = self._partition_bounds(table, connection)
+
+        predicates = []
+        for i, upper in enumerate(uppers):
+            if i == 0:
+                # NULL keys belong to no range, so the first partition picks them up
+                predicates.append((f"{col} <= :upper OR {col} IS NULL", {"upper": upper}))
+            else:
+                predicates.append((f"{col} > :lower AND {col} <= :upper", {"lower": uppers[i - 1], "upper": upper}))
+        if not predicates:
+            predicates.append((f"{col} IS NULL", {}))
+
+        logger.info(f"Reading {table.schema}.{table.table_name} in {len(predicates)} partitions on '{col}'")
+
+        # Partitions only take connections that are free in the run's budget 
+        # right now, so tables read in parallel never wait on each other
+        workers = self._reserve(len(predicates))
+        if workers < 1:
+            logger.warning(
+                f"No pooled connections left for the partitions of {table.table_name}; "
+                "reading them one by one on the table's connection."
+            )
+            for where, params in predicates:
+                query = self._build_query(table, (where,))
+                yield from self._fetch(connection, query, {**table.params, **params}, table.batch_size)
+            return
+
+        def partition_task(where: str, params: Dict[str, Any]):
+            def task() -> Iterator[List[Dict[str, Any]]]:
+                with self.connection.engine.connect() as partition_connection:
+                    query = self._build_query(table, (where,))
+                    yield from self._fetch(partition_connection, query, {**table.params, **params}, table.batch_size)
+            return task
+
+        tasks = [(f"{table.table_name}[{i}]", partition_task(where, params)) for i, (where, params) in enumerate(predicates)]
+        try:
+            for _, rows in merge_streams(tasks, max_workers=workers):
+                yield rows
+        finally:
+            self._release(workers)
+
+    def _start_budget(self) -> None:
+        """
+        Purpose: Sizes the run's connection budget to the pool capacity 
+        minus the caller's connection, which stays checked out.
+        """
+        capacity = pool_capacity(getattr(self.connection, "engine", None))
+        self._budget_size = None if capacity is None else max(capacity - 1, 0)
+        self._budget = None if capacity is None else threading.BoundedSemaphore(self._budget_size)
+
+    def _reserve(self, n: int) -> int:
+        """
+        Purpose: Takes up to n connections that are free in the budget 
+        without waiting, and returns how many were taken.
+        """
+        if self._budget is None:
+            return n
+        taken = 0
+        while taken < n and self._budget.acquire(blocking=False):
+            taken += 1
+        return taken
+
+    def _release(self, n: int) -> None:
+        """
+        Purpose: Returns n reserved connections to the budget.
+        """
+        if self._budget is not None:
+            for _ in range(n):
+                self._budget.release()
+
+    @contextmanager
+    def _checkout(self) -> Iterator[Any]:
+        """
+        Purpose: Checks a connection out of the engine's pool once the 
+        budget has room for it.
+        """
+        if self._budget is not None:
+            self._budget.acquire()
+        try:
+            with self.connection.engine.connect() as connection:
+                yield connection
+        finally:
+            self._release(1)
+
+    def _table_workers(self) -> int:
+        """
+        Purpose: Caps 'max_workers' at the run's budget; more workers would 
+        only wait for a connection. Call after _start_budget().
+        """
+        workers = self.config.max_workers
+        if workers > 1 and self._budget_size is not None and workers > self._budget_size:
+            logger.warning(
+                f"max_workers={workers} exceeds the {self._budget_size} pooled connections "
+                f"left besides the caller's; using {self._budget_size} workers."
+            )
+            workers = self._budget_size
+        return workers
+
+    def _timed(self, table: RDBMSTableConfig, batches: Iterator[List[Dict[str, Any]]]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Purpose: Passes batches through while recording the table's row 
+        count and elapsed time in self.stats.
+        """
+        name = table.table_name
+        start = time.perf_counter()
+        total = 0
+        for rows in batches:
+            total += len(rows)
+            yield rows
+        elapsed = time.perf_counter() - start
+        self.stats[name] = {"rows": total, "seconds": elapsed}
+        logger.info(f"Extracted {total} rows from {table.schema}.{name} in {elapsed:.2f}s")
+
+    def _pooled_task(self, table: RDBMSTableConfig, stream: bool):
+        """
+        Purpose: Builds a producer that reads one table on its own 
+        connection checked out from the engine's pool.
+        """
+        def task() -> Iterator[List[Dict[str, Any]]]:
+            with self._checkout() as connection:
+                yield from self._timed(table, self._read_table(table, stream, connection))
+        return task
+
+    def _combine(self, batches: List[Any]) -> Any:
+        """
+        Purpose: Joins the batches of one table into the extract() result: 
+        a flat row list, or a pyarrow Table in 'arrow' mode.
+        """
+        if self.use_arrow:
+            return columnar.combine(batches)
+        return [row for batch in batches for row in batch]
+
+    def _handle_error(self, name: str, error: BaseException) -> None:
+        """
+        Purpose: Applies the 'on_error' policy to a failed table.
+
+        Raises:
+            Exception: The original error when 'on_error' is 'raise'.
+        """
+        if self.config.on_error == "raise":
+            raise error
+        logger.error(f"Skipping table {name} after extraction error: {error}")
+
+    def _parallel(self, stream: bool, workers: int, on_error=None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Purpose: Reads all tables concurrently and merges their batches. 
+        Failed tables go to on_error (default: the 'on_error' policy).
+        """
+        tasks = [(table.table_name, self._pooled_task(table, stream)) for table in self.config.tables]
+        logger.info(f"Extracting {len(tasks)} tables with {workers} workers")
+        return merge_streams(tasks, max_workers=workers, on_error=on_error or self._handle_error)
+
     def extract(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Purpose: Loops through tables in config and executes SELECT queries.
+        With 'max_workers' > 1 the tables are read concurrently.
 
         Returns:
-            Dict[str, List[Dict[str, Any]]]: A map of table names to rows.
+            Dict[str, List[Dict[str, Any]]]: A map of table names to rows 
+            (a pyarrow Table per name in 'arrow' mode).
         """
         results = {}
         tables = self.config.tables
 
+        self._start_budget()
+        workers = self._table_workers()
+        if workers > 1:
+            # Batches are buffered per table so that, like the serial path, 
+            # a table failing partway contributes no rows at all
+            collected: Dict[str, List[Any]] = {}
+            failed = set()
+
+            def on_error(name: str, error: BaseException) -> None:
+                self._handle_error(name, error)
+                failed.add(name)
+
+            for name, batch in self._parallel(False, workers, on_error):
+                collected.setdefault(name, []).append(batch)
+            return {name: self._combine(batches) for name, batches in collected.items() if name not in failed}
+
         for table in tables:
             name = table.table_name
             schema = table.schema
-            cols = table.columns
-
-            column_query = "*" if not cols else ", ".join(cols)
-            query = f"SELECT {column_query} FROM {schema}.{name}"
             
             logger.info(f"Extracting data from {schema}.{name}")
 
             try:
-                result_proxy = self.connection.execute(text(query))
-                # mappings() allows dict-like access to row columns
-                rows = [dict(row) for row in result_proxy.mappings()]
+                batches = self._timed(table, self._read_table(table, False, self.connection))
+                rows = self._combine(list(batches))
                 results[name] = rows
                 logger.debug(f"Successfully extracted {len(rows)} rows from {name}")
             
             except Exception as e:
                 logger.exception(f"Error extracting {schema}.{name}")
-                raise e
+                self._handle_error(name, e)
         
-        return results
\ No newline at end of file
+        return results
+
+    def stream(self) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Purpose: Reads every table through a server-side cursor and yields 
+        fixed-size row batches, so only one batch per table is held in memory.
+        With 'max_workers' > 1 batches of different tables are interleaved.
+
+        Yields:
+            Tuple[str, List[Dict[str, Any]]]: The table name and a batch of 
+            at most 'batch_size' rows (a pyarrow RecordBatch in 'arrow' mode).
+        """
+        self._start_budget()
+        workers = self._table_workers()
+        if workers > 1:
+            yield from self._parallel(True, workers)
+            return
+
+        for table in self.config.tables:
+            name = table.table_name
+            schema = table.schema
+
+            logger.info(f"Streaming data from {schema}.{name} in batches of {table.batch_size}")
+
+            try:
+                for rows in self._timed(table, self._read_table(table, True, self.connection)):
+                    yield name, rows
+
+            except Exception as e:
+                logger.exception(f"Error streaming {schema}.{name}")
+                self._handle_error(name, e)
+
+    def commit_watermarks(self) -> None:
+        """
+        Purpose: Commits the marks staged by the last extraction. Call only 
+        after the extracted rows were loaded successfully.
+        """
+        if self.watermarks is not None:
+            self.watermarks.commit()
@@ -1 +1 @@
-from .rdbms import RDBMSExtractorConfig, RDBMSTableConfig
\ No newline at end of file
+from .rdbms import RDBMSExtractorConfig, RDBMSJoinConfig, RDBMSTableConfig, WatermarkConfig
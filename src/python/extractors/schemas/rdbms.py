@@ -1,5 +1,45 @@
-from pydantic import BaseModel, ConfigDict
-from typing import List, Optional
+import re
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import Any, Dict, List, Literal, Optional
+
+# A plain or qualified name, e.g. 'name' or 'u.name'
+IDENTIFIER = re.compile(r"^[A-Za-z_][\w$]*(\.[A-Za-z_][\w$]*)?$")
+# A selected column with an optional alias, e.g. 'u.name AS user_name'
+COLUMN = re.compile(r"^[A-Za-z_][\w$]*(\.([A-Za-z_][\w$]*|\*))?(\s+AS\s+[A-Za-z_][\w$]*)?$", re.IGNORECASE)
+# An ORDER BY item, e.g. 'o.created_at DESC'
+ORDER_ITEM = re.compile(r"^[A-Za-z_][\w$]*(\.[A-Za-z_][\w$]*)?(\s+(ASC|DESC))?$", re.IGNORECASE)
+
+def check_fragment(value: Optional[str], field: str) -> Optional[str]:
+    """Rejects statement separators and comments in raw SQL fragments."""
+    if value is not None and re.search(r";|--|/\*", value):
+        raise ValueError(f"'{field}' must be a single SQL expression; pass values via 'params'.")
+    return value
+
+def check_identifier(value: Optional[str], field: str) -> Optional[str]:
+    if value is not None and not IDENTIFIER.match(value):
+        raise ValueError(f"'{field}' is not a valid identifier: {value}")
+    return value
+
+class RDBMSJoinConfig(BaseModel):
+    """Schema for a table joined onto an extraction"""
+
+    model_config = ConfigDict(protected_namespaces=())
+    table_name: str
+    schema: str
+    alias: Optional[str] = None
+    # Join condition, e.g. 'o.user_id = u.id'
+    on: str
+    type: Literal["inner", "left"] = "inner"
+
+    @field_validator("table_name", "schema", "alias")
+    @classmethod
+    def check_names(cls, value, info):
+        return check_identifier(value, info.field_name)
+
+    @field_validator("on")
+    @classmethod
+    def check_on(cls, value):
+        return check_fragment(value, "on")
 
 class RDBMSTableConfig(BaseModel):
     """Schema for a single table entry in RDBMS"""
@@ -9,7 +49,122 @@ class RDBMSTableConfig(BaseModel):
     schema: str
     columns: Optional[List[str]]
 
+    # Number of rows fetched per round trip (stream batch or keyset page)
+    batch_size: int = Field(default=1000, gt=0)
+
+    # 'incremental' reads only rows past the stored high-water mark
+    extraction_mode: Literal["full", "incremental"] = "full"
+    # Rows where it is NULL are read on the initial run only; later runs 
+    # log how many they skip
+    incremental_column: Optional[str] = None
+    # Tie-breaker for rows sharing the same incremental value
+    primary_key: Optional[str] = None
+
+    # Splits one table into disjoint ranges that are read concurrently.
+    # 'range' splits [min, max] evenly, 'ntile' uses equal-count buckets for skewed keys.
+    partition_column: Optional[str] = None
+    num_partitions: int = Field(default=1, gt=0)
+    partition_strategy: Literal["range", "ntile"] = "range"
+
+    # Pushed down to the database. 'where' and join conditions reference 
+    # values as ':name' bind parameters taken from 'params'.
+    alias: Optional[str] = None
+    joins: List[RDBMSJoinConfig] = Field(default_factory=list)
+    where: Optional[str] = None
+    params: Dict[str, Any] = Field(default_factory=dict)
+    order_by: Optional[List[str]] = None
+    limit: Optional[int] = Field(default=None, gt=0)
+
+    # A complete SELECT used instead of schema.table (plus joins)
+    query: Optional[str] = None
+
+    @field_validator("table_name", "schema", "alias", "incremental_column", "primary_key", "partition_column")
+    @classmethod
+    def check_names(cls, value, info):
+        return check_identifier(value, info.field_name)
+
+    @field_validator("columns")
+    @classmethod
+    def check_columns(cls, value):
+        for column in value or []:
+            if not COLUMN.match(column):
+                raise ValueError(f"Invalid column expression: {column}")
+        return value
+
+    @field_validator("order_by")
+    @classmethod
+    def check_order_by(cls, value):
+        for item in value or []:
+            if not ORDER_ITEM.match(item):
+                raise ValueError(f"Invalid order_by item: {item}")
+        return value
+
+    @field_validator("where")
+    @classmethod
+    def check_where(cls, value):
+        return check_fragment(value, "where")
+
+    @field_validator("query")
+    @classmethod
+    def check_query(cls, value):
+        if value is not None and not re.match(r"^\s*(SELECT|WITH)\b", value, re.IGNORECASE):
+            raise ValueError("'query' must be a SELECT statement.")
+        return check_fragment(value, "query")
+
+    @model_validator(mode="after")
+    def check_incremental(self):
+        if self.extraction_mode == "incremental" and not (self.incremental_column and self.primary_key):
+            raise ValueError(
+                f"Table '{self.table_name}' uses incremental extraction and needs "
+                "both 'incremental_column' and 'primary_key'."
+            )
+        if self.extraction_mode == "incremental" and self.partition_column:
+            raise ValueError(
+                f"Table '{self.table_name}' cannot combine incremental extraction with partitioning."
+            )
+        if (self.extraction_mode == "incremental" or self.partition_column) and (self.order_by or self.limit):
+            raise ValueError(
+                f"Table '{self.table_name}': 'order_by' and 'limit' only apply to plain full reads."
+            )
+        if self.query and self.joins:
+            raise ValueError(f"Table '{self.table_name}': put joins inside 'query' instead.")
+        return self
+
+class WatermarkConfig(BaseModel):
+    """Schema for the high-water mark store"""
+
+    backend: Literal["file", "airflow"] = "file"
+    # Used by the 'file' backend
+    path: str = "watermarks.json"
+    # Used by the 'airflow' backend
+    variable: str = "rdbms_watermarks"
+
 class RDBMSExtractorConfig(BaseModel):
     
+    source_name: Optional[str] = None
+
     # This validates that 'tables' is a list of RDBMSTableConfig objects
-    tables: List[RDBMSTableConfig]
\ No newline at end of file
+    tables: List[RDBMSTableConfig]
+
+    # When True, __call__ yields (table_name, rows) batches from a server-side cursor
+    stream: bool = False
+
+    watermarks: Optional[WatermarkConfig] = None
+
+    # 'copy' streams full reads through PostgreSQL COPY (psycopg2 only, 
+    # other dialects fall back to 'cursor')
+    read_method: Literal["cursor", "copy"] = "cursor"
+
+    # 'arrow' produces pyarrow record batches (stream) or tables (extract)
+    output_format: Literal["rows", "arrow"] = "rows"
+
+    # Tables read concurrently, each on its own pooled connection
+    max_workers: int = Field(default=1, gt=0)
+    # 'skip' logs a failed table and keeps the others, 'raise' aborts the run
+    on_error: Literal["raise", "skip"] = "raise"
+
+    @model_validator(mode="after")
+    def check_watermarks(self):
+        if self.watermarks is None and any(t.extraction_mode == "incremental" for t in self.tables):
+            raise ValueError("Incremental extraction requires a 'watermarks' store configuration.")
+        return self
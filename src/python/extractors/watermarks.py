@@ -0,0 +1,251 @@
+"""
+watermarks.py
+====================================
+Purpose:
+    Persists per-table high-water marks for incremental extraction.
+    Marks are staged by the extractor and only committed once the 
+    downstream load has succeeded.
+"""
+
+import base64
+import json
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from uuid import UUID
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .schemas import WatermarkConfig
+
+logger = logging.getLogger(__name__)
+
+def encode_mark(value: Any) -> Any:
+    """
+    Purpose: Converts a watermark value into a JSON-safe representation.
+
+    Args:
+        value (Any): A value read from the incremental or key column.
+
+    Returns:
+        Any: The value, tagged with its type when JSON cannot hold it natively.
+
+    Raises:
+        TypeError: If the value has no JSON representation here.
+    """
+    if isinstance(value, datetime):
+        return {"type": "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {"type": "date", "value": value.isoformat()}
+    if isinstance(value, time):
+        return {"type": "time", "value": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"type": "timedelta", "value": [value.days, value.seconds, value.microseconds]}
+    if isinstance(value, Decimal):
+        return {"type": "decimal", "value": str(value)}
+    if isinstance(value, UUID):
+        return {"type": "uuid", "value": str(value)}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"type": "bytes", "value": base64.b64encode(bytes(value)).decode("ascii")}
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    raise TypeError(f"Watermark values of type {type(value).__name__} cannot be stored.")
+
+def decode_mark(value: Any) -> Any:
+    """
+    Purpose: Reverses encode_mark so the value can be bound to a query.
+
+    Args:
+        value (Any): A stored watermark value.
+
+    Returns:
+        Any: The original Python value.
+    """
+    if isinstance(value, dict) and "type" in value:
+        kind, raw = value["type"], value["value"]
+        if kind == "datetime":
+            return datetime.fromisoformat(raw)
+        if kind == "date":
+            return date.fromisoformat(raw)
+        if kind == "time":
+            return time.fromisoformat(raw)
+        if kind == "timedelta":
+            return timedelta(days=raw[0], seconds=raw[1], microseconds=raw[2])
+        if kind == "decimal":
+            return Decimal(raw)
+        if kind == "uuid":
+            return UUID(raw)
+        if kind == "bytes":
+            return base64.b64decode(raw)
+    return value
+
+class WatermarkStore(ABC):
+    """
+    Purpose:
+        Abstract Base Class for watermark persistence. State is a dict with 
+        'committed' and 'pending' maps of table key -> mark.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Purpose: Loads the raw state from the backend.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        raise NotImplementedError("Subclasses must implement _read()")
+
+    @abstractmethod
+    def _write(self, state: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Purpose: Persists the raw state to the backend.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        raise NotImplementedError("Subclasses must implement _write()")
+
+    def _state(self) -> Dict[str, Dict[str, Any]]:
+        state = self._read() or {}
+        state.setdefault("committed", {})
+        state.setdefault("pending", {})
+        return state
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Purpose: Returns the last committed mark for a table.
+
+        Args:
+            key (str): The table key.
+
+        Returns:
+            Optional[Dict[str, Any]]: {'value': ..., 'key': ...} or None on first run.
+        """
+        mark = self._state()["committed"].get(key)
+        if mark is None:
+            return None
+        return {name: decode_mark(value) for name, value in mark.items()}
+
+    def stage(self, key: str, mark: Optional[Dict[str, Any]]) -> None:
+        """
+        Purpose: Records a mark that becomes effective on the next commit().
+        Passing None clears any pending mark for the table.
+
+        Args:
+            key (str): The table key.
+            mark (Optional[Dict[str, Any]]): {'value': ..., 'key': ...}.
+        """
+        with self._lock:
+            state = self._state()
+            if mark is None:
+                state["pending"].pop(key, None)
+            else:
+                state["pending"][key] = {name: encode_mark(value) for name, value in mark.items()}
+            self._write(state)
+
+    def commit(self) -> None:
+        """
+        Purpose: Promotes all pending marks to committed. Call this only 
+        after the extracted data has been loaded successfully.
+        """
+        with self._lock:
+            state = self._state()
+            if not state["pending"]:
+                logger.info("No pending watermarks to commit.")
+                return
+            state["committed"].update(state["pending"])
+            logger.info(f"Committing watermarks for: {list(state['pending'].keys())}")
+            state["pending"] = {}
+            self._write(state)
+
+class FileWatermarkStore(WatermarkStore):
+    """
+    Purpose:
+        Keeps watermarks in a local JSON state file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Location of the JSON state file.
+        """
+        super().__init__()
+        self.path = Path(path)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        with self.path.open("r") as f:
+            return json.load(f)
+
+    def _write(self, state: Dict[str, Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump(state, f)
+        # Atomic swap so a crash never leaves a half-written state file
+        os.replace(tmp_path, self.path)
+
+class AirflowVariableWatermarkStore(WatermarkStore):
+    """
+    Purpose:
+        Keeps watermarks in a JSON Airflow Variable, so they survive 
+        across workers.
+    """
+
+    def __init__(self, variable: str):
+        """
+        Args:
+            variable (str): The Airflow Variable key.
+        """
+        super().__init__()
+        # Imported here so the extractor does not require Airflow
+        from airflow.models import Variable
+
+        self._variable = Variable
+        self.variable = variable
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        return self._variable.get(self.variable, default_var={}, deserialize_json=True)
+
+    def _write(self, state: Dict[str, Dict[str, Any]]) -> None:
+        self._variable.set(self.variable, state, serialize_json=True)
+
+class WatermarkStoreFactory:
+    """
+    Purpose:
+        Factory class to route requests to the correct watermark backend.
+    """
+
+    @staticmethod
+    def get_store(config: Dict[str, Any]) -> WatermarkStore:
+        """
+        Purpose: Returns an initialized watermark store.
+
+        Args:
+            config (Dict[str, Any]): The 'watermarks' section of the extraction config.
+
+        Returns:
+            WatermarkStore: An instance of a specific store.
+
+        Raises:
+            ValueError: If the backend is not supported.
+        """
+        config = WatermarkConfig(**config)
+        logger.info(f"WatermarkStoreFactory generating '{config.backend}' store.")
+
+        if config.backend == "file":
+            return FileWatermarkStore(config.path)
+        elif config.backend == "airflow":
+            return AirflowVariableWatermarkStore(config.variable)
+        else:
+            error_msg = f"Unknown watermark backend: {config.backend}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
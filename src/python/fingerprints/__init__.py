@@ -0,0 +1,20 @@
+"""
+Detects unchanged rows between runs so they can skip transform, embed and load.
+"""
+
+import logging
+
+from .filter import FingerprintFilter, TOMBSTONE_FIELD, fingerprint
+from .store import SQLiteFingerprintStore
+from .schemas import FingerprintConfig
+
+__all__ = [
+    "FingerprintFilter",
+    "SQLiteFingerprintStore",
+    "FingerprintConfig",
+    "TOMBSTONE_FIELD",
+    "fingerprint",
+]
+
+# Set a default logger for the package
+logging.getLogger(__name__).addHandler(logging.NullHandler())
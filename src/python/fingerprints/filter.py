@@ -0,0 +1,117 @@
+"""
+Sits between the extractor and the transformer and drops rows whose 
+content did not change since the last successful load. Keys that 
+disappeared from the source are turned into tombstones.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+from ..utils.keys import compose_key
+from .schemas import FingerprintConfig
+from .store import SQLiteFingerprintStore
+
+logger = logging.getLogger(__name__)
+
+# Marks a row that stands for a deleted source key
+TOMBSTONE_FIELD = "_deleted"
+
+def fingerprint(row: Dict[str, Any]) -> str:
+    """
+    Hashes the normalised content of a row. Key order does not matter.
+
+    Args:
+        row (Dict[str, Any]): A raw row.
+
+    Returns:
+        str: A hex digest.
+    """
+    payload = json.dumps(row, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+class FingerprintFilter:
+    """
+    Filters (table_name, rows) data down to new or changed rows, plus 
+    tombstones ({'_deleted': True, '_id': key}) for deleted keys.
+    Tables without a fingerprint config pass through untouched.
+    """
+
+    def __init__(
+        self,
+        data: Union[Dict[str, List[Dict[str, Any]]], Iterable[Tuple[str, Any]]],
+        config: Dict[str, Any]
+    ):
+        """
+        Args:
+            data: Extracted rows keyed by table name, or a stream of 
+                  (table_name, rows) batches.
+            config (Dict[str, Any]): Store path and per-table key settings.
+        """
+        self.data = data
+        self.config = FingerprintConfig(**config)
+        self.store = SQLiteFingerprintStore(self.config.path)
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def __call__(self) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Yields:
+            Tuple[str, List[Dict[str, Any]]]: The table name and the rows 
+            that need to flow downstream.
+        """
+        self.store.reset_run()
+        batches = self.data.items() if isinstance(self.data, dict) else self.data
+
+        for table_name, rows in batches:
+            table = self.config.tables.get(table_name)
+            if table is None:
+                yield table_name, rows
+                continue
+            if hasattr(rows, "to_pylist"):
+                # Columnar batches are hashed row by row
+                rows = rows.to_pylist()
+
+            changed_rows = self._filter(table_name, table.primary_key, rows)
+            if changed_rows:
+                yield table_name, changed_rows
+
+        # Deletes are only known once every batch of a table has been seen
+        for table_name, table in self.config.tables.items():
+            if not table.detect_deletes or table_name not in self.stats:
+                continue
+            tombstones = [{TOMBSTONE_FIELD: True, "_id": key} for key in self.store.stage_deletes(table_name)]
+            self.stats[table_name]["deleted"] = len(tombstones)
+            if tombstones:
+                yield table_name, tombstones
+
+        for table_name, counts in self.stats.items():
+            logger.info(f"Fingerprints for {table_name}: {counts}")
+
+    def _filter(self, table_name: str, primary_key: List[str], rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Compares one batch against the store and stages its changes.
+        """
+        stats = self.stats.setdefault(table_name, {"new": 0, "changed": 0, "unchanged": 0, "deleted": 0})
+        keyed = [(compose_key(row, primary_key), fingerprint(row), row) for row in rows]
+        known = self.store.lookup(table_name, [key for key, _, _ in keyed])
+
+        changed, changed_rows = [], []
+        for key, digest, row in keyed:
+            previous = known.get(key)
+            if previous == digest:
+                stats["unchanged"] += 1
+                continue
+            stats["new" if previous is None else "changed"] += 1
+            changed.append((key, digest))
+            changed_rows.append(row)
+
+        self.store.stage(table_name, changed, (key for key, _, _ in keyed))
+        return changed_rows
+
+    def commit(self) -> None:
+        """
+        Makes this run's fingerprints the baseline. Call only after the 
+        filtered rows were loaded successfully.
+        """
+        self.store.commit()
@@ -0,0 +1,6 @@
+from .fingerprint import FingerprintConfig, FingerprintTableConfig
+
+__all__ = [
+    "FingerprintConfig",
+    "FingerprintTableConfig",
+]
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, field_validator
+from typing import Dict, List, Union
+
+class FingerprintTableConfig(BaseModel):
+    """Schema for a fingerprinted table"""
+
+    # Column(s) identifying a row across runs
+    primary_key: List[str]
+    # Emit tombstones for keys missing from this run; only valid for full reads
+    detect_deletes: bool = False
+
+    @field_validator("primary_key", mode="before")
+    @classmethod
+    def as_list(cls, value: Union[str, List[str]]):
+        return [value] if isinstance(value, str) else value
+
+class FingerprintConfig(BaseModel):
+    """Schema for the fingerprint stage"""
+
+    # SQLite file holding the fingerprints of the last loaded run
+    path: str = "fingerprints.db"
+    tables: Dict[str, FingerprintTableConfig]
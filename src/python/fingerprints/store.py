@@ -0,0 +1,142 @@
+"""
+Keeps content fingerprints of loaded rows in a local SQLite file.
+Fingerprints of a run are staged first and only replace the stored 
+ones on commit(), i.e. after the load has succeeded.
+"""
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# SQLite caps the number of bound variables per statement
+_LOOKUP_CHUNK = 500
+
+class SQLiteFingerprintStore:
+    """
+    Stores one digest per (table, key) plus the pending changes of the 
+    current run.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens (and if needed creates) the fingerprint database.
+
+        Args:
+            path (str): Location of the SQLite file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                tbl TEXT NOT NULL, key TEXT NOT NULL, digest TEXT NOT NULL,
+                PRIMARY KEY (tbl, key)
+            );
+            -- A NULL digest marks a deleted key
+            CREATE TABLE IF NOT EXISTS pending (
+                tbl TEXT NOT NULL, key TEXT NOT NULL, digest TEXT,
+                PRIMARY KEY (tbl, key)
+            );
+            CREATE TABLE IF NOT EXISTS seen (
+                tbl TEXT NOT NULL, key TEXT NOT NULL,
+                PRIMARY KEY (tbl, key)
+            );
+            """
+        )
+        logger.debug(f"Fingerprint store opened at: {self.path}")
+
+    def reset_run(self) -> None:
+        """
+        Forgets pending changes and seen keys of a previous, unfinished run.
+        """
+        with self._db:
+            self._db.execute("DELETE FROM pending")
+            self._db.execute("DELETE FROM seen")
+
+    def lookup(self, table: str, keys: List[str]) -> Dict[str, str]:
+        """
+        Returns the committed digests of the given keys.
+
+        Args:
+            table (str): Table name.
+            keys (List[str]): Row keys.
+
+        Returns:
+            Dict[str, str]: Key -> digest for keys that are already known.
+        """
+        found = {}
+        for start in range(0, len(keys), _LOOKUP_CHUNK):
+            chunk = keys[start:start + _LOOKUP_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = self._db.execute(
+                f"SELECT key, digest FROM fingerprints WHERE tbl = ? AND key IN ({placeholders})",
+                [table, *chunk]
+            )
+            found.update(cursor.fetchall())
+        return found
+
+    def stage(self, table: str, changed: Iterable[Tuple[str, str]], seen: Iterable[str]) -> None:
+        """
+        Records the changed digests and all keys seen in one batch.
+
+        Args:
+            table (str): Table name.
+            changed (Iterable[Tuple[str, str]]): (key, digest) of new or changed rows.
+            seen (Iterable[str]): Every key present in the batch.
+        """
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO pending (tbl, key, digest) VALUES (?, ?, ?)",
+                ((table, key, digest) for key, digest in changed)
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO seen (tbl, key) VALUES (?, ?)",
+                ((table, key) for key in seen)
+            )
+
+    def stage_deletes(self, table: str) -> Iterator[str]:
+        """
+        Stages and returns the stored keys that were not seen in this run.
+
+        Args:
+            table (str): Table name.
+
+        Yields:
+            str: A deleted key.
+        """
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pending (tbl, key, digest) "
+                "SELECT tbl, key, NULL FROM fingerprints WHERE tbl = ? "
+                "AND key NOT IN (SELECT key FROM seen WHERE tbl = ?)",
+                (table, table)
+            )
+        cursor = self._db.execute("SELECT key FROM pending WHERE tbl = ? AND digest IS NULL", (table,))
+        for (key,) in cursor:
+            yield key
+
+    def commit(self) -> None:
+        """
+        Applies the pending changes. Call only after a successful load.
+        """
+        with self._db:
+            count = self._db.execute("SELECT COUNT(*) FROM pending").fetchone()[0]
+            self._db.execute(
+                "INSERT OR REPLACE INTO fingerprints (tbl, key, digest) "
+                "SELECT tbl, key, digest FROM pending WHERE digest IS NOT NULL"
+            )
+            self._db.execute(
+                "DELETE FROM fingerprints WHERE EXISTS ("
+                "SELECT 1 FROM pending WHERE pending.digest IS NULL "
+                "AND pending.tbl = fingerprints.tbl AND pending.key = fingerprints.key)"
+            )
+            self._db.execute("DELETE FROM pending")
+            self._db.execute("DELETE FROM seen")
+        logger.info(f"Committed {count} fingerprint changes.")
+
+    def close(self) -> None:
+        self._db.close()
@@ -2,16 +2,29 @@
 Handles final data delivery to Elasticsearch/OpenSearch.
 """
 
+from ..utils.registry import lazy_exports
 from .factory import LoaderFactory
 from .base import BaseLoader
-from .elasticsearch import ElasticsearchIngestor, ElasticsearchSingleIngestor, ElasticsearchBulkIngestor
 from .schemas.ingestor import IngestorConfig
 
+# The ingestors import the elasticsearch client, so load them on first access
+__getattr__ = lazy_exports(__name__, {
+    "ElasticsearchIngestor": ".elasticsearch",
+    "ElasticsearchSingleIngestor": ".elasticsearch",
+    "ElasticsearchBulkIngestor": ".elasticsearch",
+    "BulkReport": ".elasticsearch",
+    "AsyncElasticsearchBulkIngestor": ".elasticsearch",
+    "StagedElasticsearchIngestor": ".staged",
+})
+
 __all__ = [
     "LoaderFactory",
     "BaseLoader",
     "ElasticsearchIngestor",
     "ElasticsearchSingleIngestor",
     "ElasticsearchBulkIngestor",
+    "BulkReport",
+    "AsyncElasticsearchBulkIngestor",
+    "StagedElasticsearchIngestor",
     "IngestorConfig"
 ]
\ No newline at end of file
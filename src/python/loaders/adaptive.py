@@ -0,0 +1,179 @@
+"""
+Bulk loading that adapts to cluster pressure. The chunk size grows while
+requests are fast and clean and shrinks on slow requests or rejections;
+only rejected documents are retried, with jittered exponential backoff.
+"""
+
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from elasticsearch import ApiError, ConnectionError as ESConnectionError, ConnectionTimeout
+
+from ..utils.ndjson import dumps
+from .schemas import IngestorConfig
+
+logger = logging.getLogger(__name__)
+
+class AdaptiveChunkSize:
+    """
+    Additive-increase / multiplicative-decrease control of the chunk size.
+    """
+    def __init__(self, initial: int, minimum: int, maximum: int, target_latency: float):
+        self.size = max(minimum, min(initial, maximum))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+
+    def update(self, latency: float, sent: int, rejected: int) -> int:
+        """
+        Adjusts the size after a request and returns the next one.
+
+        Args:
+            latency (float): Seconds the request took.
+            sent (int): Documents in the request.
+            rejected (int): Documents rejected with a retryable status.
+        """
+        if rejected or latency > self.target_latency * 1.5:
+            # Halve on pressure
+            self.size = max(self.minimum, self.size // 2)
+        elif latency < self.target_latency and sent >= self.size:
+            # Grow by a tenth while there is headroom
+            self.size = min(self.maximum, self.size + max(1, self.size // 10))
+        return self.size
+
+class AdaptiveBulkLoader:
+    """
+    Sends bulk requests sized by AdaptiveChunkSize and re-sends only the
+    documents rejected with a retryable status (429 by default).
+    """
+    def __init__(self, connection: Any, config: IngestorConfig, report: Any, index: Optional[str] = None):
+        """
+        Args:
+            connection (Elasticsearch): The active ES client.
+            config (IngestorConfig): Loader config; see its 'adaptive' section.
+            report (BulkReport): Collects per-document results.
+            index (str): Target index; defaults to config.index_name.
+        """
+        self.connection = connection
+        self.config = config
+        self.index = index or config.index_name
+        self.settings = config.adaptive
+        self.report = report
+        self.chunks = AdaptiveChunkSize(
+            config.chunk_size, self.settings.min_chunk_size, self.settings.max_chunk_size, self.settings.target_latency
+        )
+        self.stats: Dict[str, Any] = {}
+
+    def load(self, actions: Iterable[Tuple[Any, Any]]) -> Dict[str, Any]:
+        """
+        Loads every action and returns the throughput numbers.
+
+        Args:
+            actions (Iterable[Tuple[Any, Any]]): Expanded (action, source) pairs.
+
+        Returns:
+            Dict[str, Any]: Documents, failures, retries, requests, seconds,
+            docs_per_second, bytes_per_second and the final chunk_size.
+        """
+        source: Iterator[Tuple[Any, Any]] = iter(actions)
+        retry: Deque[Tuple[List[bytes], int]] = deque()
+        exhausted = False
+        requests = retried = sent_bytes = pressure = 0
+        start = time.perf_counter()
+
+        while True:
+            # Rejected documents go first, then fresh ones up to the current size
+            chunk: List[Tuple[List[bytes], int]] = []
+            size = 0
+            while retry and len(chunk) < self.chunks.size and size < self.config.max_chunk_bytes:
+                chunk.append(retry.popleft())
+                size += sum(len(line) + 1 for line in chunk[-1][0])
+            while not exhausted and len(chunk) < self.chunks.size and size < self.config.max_chunk_bytes:
+                try:
+                    chunk.append((self._encode(next(source)), 0))
+                    size += sum(len(line) + 1 for line in chunk[-1][0])
+                except StopIteration:
+                    exhausted = True
+            if not chunk:
+                break
+
+            body = [line for lines, _ in chunk for line in lines]
+            requests += 1
+            sent_bytes += size
+            began = time.perf_counter()
+            rejected = self._send(body, chunk, retry)
+            latency = time.perf_counter() - began
+            retried += rejected
+
+            next_size = self.chunks.update(latency, len(chunk), rejected)
+            self.report.flush()
+            logger.debug(f"Bulk request {requests}: {len(chunk)} docs in {latency:.2f}s, {rejected} rejected, next size {next_size}.")
+
+            # Back off while the cluster keeps rejecting
+            pressure = pressure + 1 if rejected else 0
+            if pressure:
+                time.sleep(self._backoff(pressure))
+
+        seconds = time.perf_counter() - start
+        self.stats = {
+            "documents": self.report.success,
+            "failed": self.report.failed,
+            "retried": retried,
+            "requests": requests,
+            "seconds": round(seconds, 3),
+            "docs_per_second": round(self.report.success / seconds, 1) if seconds else 0.0,
+            "bytes_per_second": round(sent_bytes / seconds, 1) if seconds else 0.0,
+            "chunk_size": self.chunks.size,
+        }
+        logger.info(f"Adaptive bulk throughput: {self.stats}")
+        return self.stats
+
+    def _send(self, body: List[bytes], chunk: List[Tuple[List[bytes], int]], retry: Deque) -> int:
+        """
+        Sends one request, records the final results and queues the
+        retryable rejections. Returns the number of rejected documents.
+        """
+        retry_on = set(self.settings.retry_on_status)
+        try:
+            response = self.connection.bulk(operations=body, index=self.index)
+            items = response["items"]
+        except (ApiError, ESConnectionError, ConnectionTimeout) as e:
+            status = getattr(e, "status_code", None) if isinstance(e, ApiError) else None
+            if isinstance(e, ApiError) and status not in retry_on:
+                raise
+            # The whole request was rejected or lost; every document is retryable
+            logger.warning(f"Bulk request failed ({status or type(e).__name__}); retrying {len(chunk)} documents.")
+            items = [{"index": {"status": status or 503, "error": str(e)}}] * len(chunk)
+
+        rejected = 0
+        for (lines, attempts), item in zip(chunk, items):
+            status = next(iter(item.values()), {}).get("status", 500)
+            if status in retry_on:
+                if attempts < self.settings.max_retries:
+                    retry.append((lines, attempts + 1))
+                    rejected += 1
+                    continue
+            self.report.add(200 <= status < 300, item)
+        return rejected
+
+    def _backoff(self, attempt: int) -> float:
+        """
+        Full-jitter exponential backoff: a random wait up to the capped delay.
+        """
+        cap = min(self.settings.max_backoff, self.settings.initial_backoff * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    @staticmethod
+    def _encode(expanded: Tuple[Any, Any]) -> List[bytes]:
+        """
+        Encodes an expanded (action, source) pair into NDJSON lines once,
+        so retries resend the same bytes.
+        """
+        action, source = expanded
+        lines = [action if isinstance(action, bytes) else dumps(action)]
+        if source is not None:
+            lines.append(source if isinstance(source, bytes) else dumps(source))
+        return lines
@@ -3,13 +3,34 @@ Contains the logic for sending data to Elasticsearch using
 either single-index or bulk-index strategies.
 """
 
+import asyncio
+import itertools
+import json
 import logging
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from elasticsearch import helpers
+from .adaptive import AdaptiveBulkLoader
 from .base import BaseLoader
-from .schemas import IngestorConfig
+from .schemas import BulkLoadModeConfig, IngestorConfig
 
 logger = logging.getLogger(__name__)
 
+# Index settings suspended by bulk_load_mode
+BULK_LOAD_SETTINGS = ("index.refresh_interval", "index.number_of_replicas")
+
+def expand_action(data: Union[Dict[str, Any], bytes]) -> Tuple[Any, Any]:
+    """
+    Splits a pre-encoded NDJSON action (see utils.ndjson) into its action 
+    and source lines, which the bulk helpers send without re-encoding. 
+    Dict actions take the helpers' usual path.
+    """
+    if isinstance(data, bytes):
+        action, _, source = data.partition(b"\n")
+        return action, source.rstrip(b"\n") or None
+    return helpers.expand_action(data)
+
 class ElasticsearchIngestor(BaseLoader):
     """
     Parent class to handle common connection management and index 
@@ -25,6 +46,10 @@ class ElasticsearchIngestor(BaseLoader):
         """
         self.connection = connection
         self.config = IngestorConfig(**config)
+        # The index written to; a new generation while reindexing
+        self.index_name = self.config.index_name
+        # Dimension of the dense_vector field, configured or detected
+        self.dims = self.config.vectors.dims if self.config.vectors else None
 
     def create(self) -> None:
         """
@@ -33,10 +58,10 @@ class ElasticsearchIngestor(BaseLoader):
         Returns:
             None
         """
-        name = self.config.index_name
+        name = self.index_name
         body = {
             "settings": self.config.settings,
-            "mappings": self.config.mappings
+            "mappings": self.mappings()
         }
         if not self.connection.indices.exists(index=name):
             logger.info(f"Index '{name}' does not exist. Creating with provided mappings.")
@@ -44,15 +69,168 @@ class ElasticsearchIngestor(BaseLoader):
         else:
             logger.debug(f"Index '{name}' already exists.")
 
-    def __call__(self, data):
+    def __call__(self, data, full_reload: bool = False):
         """
         The entry point for loading. Ensures index setup before ingestion.
 
         Args:
             data (Any): Data to be loaded.
+            full_reload (bool): Whether `data` holds every document, as 
+                                required by a configured reindex.
         """
+        data = self.detect_vectors(data)
+        if self.config.reindex is not None:
+            return self.reindex(data, full_reload)
         self.create()
-        return self.load(data)
+        if self.config.bulk_load_mode is None:
+            return self.load(data)
+        with self.bulk_load_mode():
+            return self.load(data)
+
+    def mappings(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: The configured mappings plus, once its dims are 
+            known, the dense_vector field.
+        """
+        vectors = self.config.vectors
+        if vectors is None or not self.dims:
+            return self.config.mappings
+        return _vector_mappings(self.config.mappings, vectors, self.dims)
+
+    def detect_vectors(self, data):
+        """
+        Takes the vector dims from the first record that carries a vector, 
+        unless they are configured. Re-iterable data (lists, staged runs) is 
+        peeked separately; records peeked from an iterator are put back.
+
+        Returns:
+            The data to load.
+        """
+        vectors = self.config.vectors
+        if vectors is None or self.dims:
+            return data
+        iterator = iter(data)
+        peeked = []
+        for record in itertools.islice(iterator, vectors.sample_size):
+            peeked.append(record)
+            self.dims = _vector_dims(record, vectors.field)
+            if self.dims:
+                break
+        self._log_dims()
+        return data if iterator is not data else itertools.chain(peeked, iterator)
+
+    def _log_dims(self) -> None:
+        if self.dims:
+            logger.info(f"Mapping '{self.config.vectors.field}' as a {self.dims}-dim dense_vector.")
+        else:
+            logger.warning(f"No '{self.config.vectors.field}' vectors found; leaving the mappings as configured.")
+
+    def reindex(self, data, full_reload: bool = False):
+        """
+        Blue/green full reload: loads into a new '<index_name>_v<version>' 
+        generation with bulk settings, checks its document count, points 
+        the 'index_name' alias at it in one atomic update and deletes the 
+        generations beyond `keep`. The serving index is never written to.
+
+        A generation only holds what `data` holds, so incremental or 
+        fingerprint-filtered (delta) input would replace the whole index 
+        with the changed rows; the caller must vouch for a full reload.
+
+        Args:
+            data (Any): Data to be loaded.
+            full_reload (bool): Whether `data` holds every document.
+
+        Raises:
+            ValueError: If this is not a full reload, or the new generation 
+                        fails the count check.
+        """
+        alias = self.config.index_name
+        _require_full_reload(alias, full_reload)
+        self.index_name = self.new_generation(alias)
+        logger.info(f"Reindexing '{alias}' into '{self.index_name}'.")
+        try:
+            self.create()
+            with self.bulk_load_mode(self.config.bulk_load_mode or BulkLoadModeConfig()):
+                result = self.load(self.retarget(data))
+            self.swap(alias)
+        except Exception:
+            if self.config.reindex.delete_on_failure:
+                logger.error(f"Reindex failed; deleting '{self.index_name}'.")
+                self.connection.indices.delete(index=self.index_name, ignore_unavailable=True)
+            raise
+        self.collect_generations(alias)
+        return result
+
+    def new_generation(self, alias: str) -> str:
+        """
+        Returns:
+            str: The name of the generation to build.
+        """
+        return _generation_name(alias, self.config.reindex)
+
+    def retarget(self, data):
+        """
+        Points dict actions at the generation being built.
+        """
+        return _retarget(data, self.index_name)
+
+    def swap(self, alias: str) -> None:
+        """
+        Validates the new generation against the serving one and moves 
+        the alias to it. A concrete index still named like the alias is 
+        removed in the same atomic update.
+        """
+        indices = self.connection.indices
+        current: List[str] = []
+        previous = None
+        if indices.exists_alias(name=alias):
+            current = list(indices.get_alias(name=alias))
+        legacy = not current and bool(indices.exists(index=alias))
+        if current or legacy:
+            previous = self.connection.count(index=alias)["count"]
+        count = self.connection.count(index=self.index_name)["count"]
+        _check_counts(self.index_name, count, previous, self.config.reindex)
+
+        indices.update_aliases(actions=_alias_actions(alias, self.index_name, current, legacy))
+        logger.info(f"Alias '{alias}' now points to '{self.index_name}' ({count} documents).")
+
+    def collect_generations(self, alias: str) -> None:
+        """
+        Deletes the generations of `alias` beyond the newest `keep` 
+        previous ones.
+        """
+        generations = self.connection.indices.get_alias(index=f"{alias}_v*")
+        stale = _stale_generations(alias, self.index_name, generations, self.config.reindex)
+        if stale:
+            logger.info(f"Deleting old generations of '{alias}': {stale}")
+            self.connection.indices.delete(index=",".join(stale))
+
+    @contextmanager
+    def bulk_load_mode(self, mode: Optional[BulkLoadModeConfig] = None):
+        """
+        Suspends refreshes and replicas for the duration of the load, 
+        force-merges after a successful load and restores the original 
+        settings in every case.
+
+        Args:
+            mode (BulkLoadModeConfig): Defaults to config.bulk_load_mode.
+        """
+        mode = mode or self.config.bulk_load_mode
+        name = self.index_name
+        original = self.connection.indices.get_settings(index=name, name=list(BULK_LOAD_SETTINGS), flat_settings=True)
+        logger.info(f"Bulk load mode on '{name}': refresh_interval={mode.refresh_interval}, replicas={mode.number_of_replicas}.")
+        self.connection.indices.put_settings(index=name, settings=_bulk_load_settings(mode))
+        try:
+            yield
+            self.connection.indices.refresh(index=name)
+            if mode.force_merge_segments:
+                logger.info(f"Force-merging '{name}' to {mode.force_merge_segments} segment(s).")
+                self.connection.indices.forcemerge(index=name, max_num_segments=mode.force_merge_segments)
+        finally:
+            for index, settings in _restore_settings(original):
+                self.connection.indices.put_settings(index=index, settings=settings)
+            logger.info(f"Restored the settings of '{name}'.")
 
 class ElasticsearchSingleIngestor(ElasticsearchIngestor):
     """
@@ -73,6 +251,48 @@ class ElasticsearchSingleIngestor(ElasticsearchIngestor):
             count += 1
         logger.info(f"Successfully indexed {count} documents individually.")
 
+class BulkReport:
+    """
+    Tallies per-document bulk results as they stream in. Only counts and a 
+    few sample failures are kept, so memory does not grow with the errors.
+    """
+    def __init__(self, chunk_size: Optional[int], ignore_status: Iterable[int] = (), samples: int = 3):
+        self.chunk_size = chunk_size
+        self.ignore_status = set(ignore_status)
+        self.max_samples = samples
+        self.success = 0
+        self.failed = 0
+        self.samples: List[Dict[str, Any]] = []
+        self._chunk = [0, 0]
+        self._chunks = 0
+
+    def add(self, ok: bool, item: Dict[str, Any]) -> None:
+        """
+        Records one result and logs a summary at every chunk boundary. 
+        Without a chunk_size the caller flushes after each request.
+        """
+        status = next(iter(item.values()), {}).get("status")
+        if ok or status in self.ignore_status:
+            self.success += 1
+            self._chunk[0] += 1
+        else:
+            self.failed += 1
+            self._chunk[1] += 1
+            if len(self.samples) < self.max_samples:
+                self.samples.append(item)
+                logger.error(f"Sample Failure: {item}")
+        if self.chunk_size and sum(self._chunk) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Logs the results of the current chunk, if any.
+        """
+        if sum(self._chunk):
+            self._chunks += 1
+            logger.info(f"Bulk chunk {self._chunks}: {self._chunk[0]} ok, {self._chunk[1]} failed.")
+            self._chunk = [0, 0]
+
 class ElasticsearchBulkIngestor(ElasticsearchIngestor):
     """
     Loads data in efficient batches using the Elasticsearch helpers.
@@ -82,10 +302,22 @@ class ElasticsearchBulkIngestor(ElasticsearchIngestor):
         Args:
             data (Iterator): Stream of records.
         """
+        if self.config.mode == "adaptive":
+            return self.load_adaptive(data)
+        if self.config.mode != "bulk":
+            return self.load_streaming(data)
+
         logger.info("Starting bulk ingestion.")
         try:
             # Set stats_only=False to get the full list of errors
-            success, failed = helpers.bulk(self.connection, data, stats_only=False)
+            success, failed = helpers.bulk(
+                self.connection,
+                data,
+                stats_only=False,
+                index=self.index_name,
+                expand_action_callback=expand_action,
+                ignore_status=self.config.ignore_status
+            )
             logger.info(f"Bulk indexing complete. Success: {success}, Failed: {len(failed)}")
         except helpers.BulkIndexError as e:
             # THIS IS CRITICAL: Loop through errors to see the REAL cause
@@ -93,4 +325,432 @@ class ElasticsearchBulkIngestor(ElasticsearchIngestor):
                 # Just show the first few to avoid log spam
                 if i < 3:
                     logger.error(f"Sample Failure: {item}")
-            raise  # Re-raise so Airflow knows the task failed
\ No newline at end of file
+            raise  # Re-raise so Airflow knows the task failed
+
+    def load_streaming(self, data):
+        """
+        Sends chunks with streaming_bulk, or from `thread_count` threads with 
+        parallel_bulk, and reports the results chunk by chunk.
+
+        Args:
+            data (Iterator): Stream of records.
+
+        Returns:
+            tuple: Number of indexed and of failed documents.
+
+        Raises:
+            BulkIndexError: If any document failed, with sample failures.
+        """
+        config = self.config
+        logger.info(f"Starting {config.mode} bulk ingestion (chunk_size={config.chunk_size}).")
+        options = dict(
+            chunk_size=config.chunk_size,
+            max_chunk_bytes=config.max_chunk_bytes,
+            index=self.index_name,
+            expand_action_callback=expand_action,
+            ignore_status=config.ignore_status,
+            raise_on_error=False,
+        )
+        if config.mode == "parallel":
+            results = helpers.parallel_bulk(
+                self.connection, data, thread_count=config.thread_count, queue_size=config.queue_size, **options
+            )
+        else:
+            results = helpers.streaming_bulk(self.connection, data, **options)
+
+        report = BulkReport(config.chunk_size, config.ignore_status)
+        for ok, item in results:
+            report.add(ok, item)
+        report.flush()
+
+        logger.info(f"Bulk indexing complete. Success: {report.success}, Failed: {report.failed}")
+        if report.failed:
+            raise helpers.BulkIndexError(f"{report.failed} document(s) failed to index.", report.samples)
+        return report.success, report.failed
+
+    def load_adaptive(self, data):
+        """
+        Sends chunks sized to the cluster's response times, re-sending only 
+        the documents rejected with a retryable status (e.g. 429). The 
+        throughput numbers are kept on `self.stats`.
+
+        Args:
+            data (Iterator): Stream of records.
+
+        Returns:
+            tuple: Number of indexed and of failed documents.
+
+        Raises:
+            BulkIndexError: If any document failed, with sample failures.
+        """
+        config = self.config
+        logger.info(f"Starting adaptive bulk ingestion (chunk_size={config.chunk_size}).")
+        report = BulkReport(None, config.ignore_status)
+        loader = AdaptiveBulkLoader(self.connection, config, report, index=self.index_name)
+        self.stats = loader.load(map(expand_action, data))
+
+        logger.info(f"Bulk indexing complete. Success: {report.success}, Failed: {report.failed}")
+        if report.failed:
+            raise helpers.BulkIndexError(f"{report.failed} document(s) failed to index.", report.samples)
+        return report.success, report.failed
+
+class AsyncElasticsearchBulkIngestor(ElasticsearchIngestor):
+    """
+    Loads data through AsyncElasticsearch. Records are grouped into chunks 
+    of `chunk_size` and up to `concurrency` bulk requests are in flight at 
+    once. create(), load() and calling the instance are coroutines.
+    """
+    async def create(self) -> None:
+        """
+        Ensures the target index exists with proper mappings.
+        """
+        name = self.index_name
+        body = {
+            "settings": self.config.settings,
+            "mappings": self.mappings()
+        }
+        if not await self.connection.indices.exists(index=name):
+            logger.info(f"Index '{name}' does not exist. Creating with provided mappings.")
+            await self.connection.indices.create(index=name, body=body)
+        else:
+            logger.debug(f"Index '{name}' already exists.")
+
+    async def __call__(self, data, full_reload: bool = False):
+        """
+        The entry point for loading. Ensures index setup before ingestion.
+
+        Args:
+            data (Iterable | AsyncIterable): Data to be loaded.
+            full_reload (bool): Whether `data` holds every document.
+        """
+        data = await self.detect_vectors(data)
+        if self.config.reindex is not None:
+            return await self.reindex(data, full_reload)
+        await self.create()
+        if self.config.bulk_load_mode is None:
+            return await self.load(data)
+        async with self.bulk_load_mode():
+            return await self.load(data)
+
+    async def detect_vectors(self, data):
+        """
+        Async counterpart of ElasticsearchIngestor.detect_vectors() that 
+        also peeks async iterables.
+        """
+        vectors = self.config.vectors
+        if vectors is None or self.dims or not hasattr(data, "__aiter__"):
+            return super().detect_vectors(data)
+        iterator = data.__aiter__()
+        peeked = []
+        while len(peeked) < vectors.sample_size:
+            try:
+                record = await iterator.__anext__()
+            except StopAsyncIteration:
+                break
+            peeked.append(record)
+            self.dims = _vector_dims(record, vectors.field)
+            if self.dims:
+                break
+        self._log_dims()
+        return _achain(peeked, iterator)
+
+    async def reindex(self, data, full_reload: bool = False):
+        """
+        Async counterpart of ElasticsearchIngestor.reindex().
+        """
+        alias = self.config.index_name
+        _require_full_reload(alias, full_reload)
+        self.index_name = _generation_name(alias, self.config.reindex)
+        logger.info(f"Reindexing '{alias}' into '{self.index_name}'.")
+        try:
+            await self.create()
+            async with self.bulk_load_mode(self.config.bulk_load_mode or BulkLoadModeConfig()):
+                result = await self.load(_aretarget(data, self.index_name))
+            await self.swap(alias)
+        except Exception:
+            if self.config.reindex.delete_on_failure:
+                logger.error(f"Reindex failed; deleting '{self.index_name}'.")
+                await self.connection.indices.delete(index=self.index_name, ignore_unavailable=True)
+            raise
+        await self.collect_generations(alias)
+        return result
+
+    async def swap(self, alias: str) -> None:
+        """
+        Async counterpart of ElasticsearchIngestor.swap().
+        """
+        indices = self.connection.indices
+        current: List[str] = []
+        previous = None
+        if await indices.exists_alias(name=alias):
+            current = list(await indices.get_alias(name=alias))
+        legacy = not current and bool(await indices.exists(index=alias))
+        if current or legacy:
+            previous = (await self.connection.count(index=alias))["count"]
+        count = (await self.connection.count(index=self.index_name))["count"]
+        _check_counts(self.index_name, count, previous, self.config.reindex)
+
+        await indices.update_aliases(actions=_alias_actions(alias, self.index_name, current, legacy))
+        logger.info(f"Alias '{alias}' now points to '{self.index_name}' ({count} documents).")
+
+    async def collect_generations(self, alias: str) -> None:
+        """
+        Async counterpart of ElasticsearchIngestor.collect_generations().
+        """
+        generations = await self.connection.indices.get_alias(index=f"{alias}_v*")
+        stale = _stale_generations(alias, self.index_name, generations, self.config.reindex)
+        if stale:
+            logger.info(f"Deleting old generations of '{alias}': {stale}")
+            await self.connection.indices.delete(index=",".join(stale))
+
+    @asynccontextmanager
+    async def bulk_load_mode(self, mode: Optional[BulkLoadModeConfig] = None):
+        """
+        Async counterpart of ElasticsearchIngestor.bulk_load_mode().
+        """
+        mode = mode or self.config.bulk_load_mode
+        name = self.index_name
+        original = await self.connection.indices.get_settings(index=name, name=list(BULK_LOAD_SETTINGS), flat_settings=True)
+        logger.info(f"Bulk load mode on '{name}': refresh_interval={mode.refresh_interval}, replicas={mode.number_of_replicas}.")
+        await self.connection.indices.put_settings(index=name, settings=_bulk_load_settings(mode))
+        try:
+            yield
+            await self.connection.indices.refresh(index=name)
+            if mode.force_merge_segments:
+                logger.info(f"Force-merging '{name}' to {mode.force_merge_segments} segment(s).")
+                await self.connection.indices.forcemerge(index=name, max_num_segments=mode.force_merge_segments)
+        finally:
+            for index, settings in _restore_settings(original):
+                await self.connection.indices.put_settings(index=index, settings=settings)
+            logger.info(f"Restored the settings of '{name}'.")
+
+    async def _produce(self, data: Union[Iterable, AsyncIterable], queue: asyncio.Queue) -> None:
+        """
+        Splits the records into chunks and feeds them to the workers, 
+        followed by one stop marker per worker.
+        """
+        chunk = []
+        async for action in _aiter(data):
+            chunk.append(action)
+            if len(chunk) >= self.config.chunk_size:
+                await queue.put(chunk)
+                chunk = []
+        if chunk:
+            await queue.put(chunk)
+        for _ in range(self.config.concurrency):
+            await queue.put(None)
+
+    async def _consume(self, queue: asyncio.Queue, report: BulkReport) -> None:
+        """
+        Sends queued chunks as bulk requests until a stop marker arrives.
+        """
+        while (chunk := await queue.get()) is not None:
+            async for ok, item in helpers.async_streaming_bulk(
+                self.connection,
+                chunk,
+                index=self.index_name,
+                expand_action_callback=expand_action,
+                ignore_status=self.config.ignore_status,
+                chunk_size=self.config.chunk_size,
+                raise_on_error=False,
+                raise_on_exception=False,
+            ):
+                report.add(ok, item)
+
+    async def load(self, data):
+        """
+        Args:
+            data (Iterable | AsyncIterable): Stream of records.
+
+        Returns:
+            tuple: Number of indexed and of failed documents.
+
+        Raises:
+            BulkIndexError: If any document failed, with sample failures.
+        """
+        logger.info(f"Starting async bulk ingestion (concurrency={self.config.concurrency}).")
+        report = BulkReport(self.config.chunk_size, self.config.ignore_status)
+        # Bounded so the producer cannot run far ahead of the workers
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.concurrency * 2)
+
+        tasks = [asyncio.create_task(self._produce(data, queue))] + [
+            asyncio.create_task(self._consume(queue, report))
+            for _ in range(self.config.concurrency)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed worker would otherwise leave the producer blocked on the queue
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        report.flush()
+
+        logger.info(f"Async bulk indexing complete. Success: {report.success}, Failed: {report.failed}")
+        if report.failed:
+            raise helpers.BulkIndexError(f"{report.failed} document(s) failed to index.", report.samples)
+        return report.success, report.failed
+
+async def _aiter(data: Union[Iterable, AsyncIterable]):
+    """
+    Iterates sync and async iterables alike.
+    """
+    if hasattr(data, "__aiter__"):
+        async for item in data:
+            yield item
+    else:
+        for item in data:
+            yield item
+
+def _bulk_load_settings(mode) -> Dict[str, Any]:
+    """
+    The settings applied while bulk_load_mode is active.
+    """
+    return {
+        "index.refresh_interval": mode.refresh_interval,
+        "index.number_of_replicas": mode.number_of_replicas,
+    }
+
+def _restore_settings(response: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Turns a flat get_settings() response into per-index put_settings 
+    bodies. Settings that were not set explicitly are reset to their 
+    defaults with None.
+    """
+    for index, body in response.items():
+        current = body.get("settings", {})
+        yield index, {key: current.get(key) for key in BULK_LOAD_SETTINGS}
+
+def _generation_name(alias: str, reindex) -> str:
+    """
+    Names a new generation of `alias` after the current UTC time.
+    """
+    return f"{alias}_v{datetime.now(timezone.utc).strftime(reindex.version_format)}"
+
+def _retarget(data: Iterable, index: str) -> Iterator:
+    """
+    Points dict actions at `index`; NDJSON actions carry no '_index' and 
+    follow the request's index.
+    """
+    for action in data:
+        if isinstance(action, dict):
+            action["_index"] = index
+        yield action
+
+async def _aretarget(data: Union[Iterable, AsyncIterable], index: str):
+    """
+    Async counterpart of _retarget() for sync and async iterables.
+    """
+    async for action in _aiter(data):
+        if isinstance(action, dict):
+            action["_index"] = index
+        yield action
+
+def _require_full_reload(alias: str, full_reload: bool) -> None:
+    """
+    Rejects reindexing from input that may be incremental or a delta.
+
+    Raises:
+        ValueError: If the caller did not flag the input as a full reload.
+    """
+    if not full_reload:
+        raise ValueError(
+            f"Reindexing '{alias}' replaces the whole index, so it needs every document; "
+            "load with full_reload=True, or drop 'reindex' for incremental pipelines."
+        )
+
+def _check_counts(name: str, count: int, previous: Optional[int], reindex) -> None:
+    """
+    Rejects an empty generation, or one much smaller than the serving one.
+
+    Raises:
+        ValueError: If the counts fail the configured checks.
+    """
+    if not count and not reindex.allow_empty:
+        raise ValueError(f"'{name}' is empty; refusing to swap (set allow_empty to permit it).")
+    if previous and count < previous * reindex.min_doc_ratio:
+        raise ValueError(
+            f"'{name}' holds {count} documents, fewer than {reindex.min_doc_ratio:.0%} "
+            f"of the {previous} currently served; refusing to swap."
+        )
+
+def _alias_actions(alias: str, index: str, current: List[str], legacy: bool) -> List[Dict[str, Any]]:
+    """
+    The update_aliases actions that move `alias` to `index` atomically.
+    """
+    actions: List[Dict[str, Any]] = [{"remove": {"index": old, "alias": alias}} for old in current]
+    if legacy:
+        # A concrete index holds the alias name; it must go in the same update
+        actions.append({"remove_index": {"index": alias}})
+    actions.append({"add": {"index": index, "alias": alias}})
+    return actions
+
+def _stale_generations(alias: str, index: str, generations: Dict[str, Any], reindex) -> List[str]:
+    """
+    Returns the generations of `alias` other than `index` beyond the 
+    newest `keep`. Only names whose suffix parses as a version count, so 
+    e.g. '<alias>_vectors' is never touched.
+    """
+    prefix = f"{alias}_v"
+    versions = {}
+    for name in generations:
+        if name == index or not name.startswith(prefix):
+            continue
+        try:
+            versions[name] = datetime.strptime(name[len(prefix):], reindex.version_format)
+        except ValueError:
+            continue
+    return sorted(versions, key=versions.get, reverse=True)[reindex.keep:]
+
+async def _achain(peeked: List[Any], iterator):
+    """
+    Yields the peeked records, then the rest of the async iterator.
+    """
+    for record in peeked:
+        yield record
+    async for record in iterator:
+        yield record
+
+def _vector_dims(record: Union[Dict[str, Any], bytes], field: str) -> Optional[int]:
+    """
+    Returns the length of the vector in a dict or NDJSON action, if any.
+    """
+    if isinstance(record, bytes):
+        _, _, line = record.partition(b"\n")
+        if field.encode("utf-8") not in line:
+            return None
+        source = json.loads(line)
+        source = source.get("doc", source)
+    else:
+        source = record.get("_source") or record.get("doc") or {}
+    vector = source.get(field)
+    return len(vector) if isinstance(vector, list) and vector else None
+
+def _vector_mappings(mappings: Dict[str, Any], vectors, dims: int) -> Dict[str, Any]:
+    """
+    Adds the dense_vector field (and the _source exclusion) to a copy of 
+    the configured mappings. A field mapped by hand is left alone.
+    """
+    options = {"type": vectors.index_options.type}
+    if vectors.index_options.type.endswith("hnsw"):
+        options.update(m=vectors.index_options.m, ef_construction=vectors.index_options.ef_construction)
+    if vectors.index_options.confidence_interval is not None and vectors.index_options.type.startswith(("int8_", "int4_")):
+        options["confidence_interval"] = vectors.index_options.confidence_interval
+
+    mappings = dict(mappings)
+    properties = dict(mappings.get("properties", {}))
+    properties.setdefault(vectors.field, {
+        "type": "dense_vector",
+        "dims": dims,
+        "index": True,
+        "similarity": vectors.similarity,
+        "index_options": options,
+    })
+    mappings["properties"] = properties
+    if vectors.exclude_from_source:
+        source = dict(mappings.get("_source", {}))
+        source["excludes"] = sorted(set(source.get("excludes", [])) | {vectors.field})
+        mappings["_source"] = source
+    return mappings
@@ -3,10 +3,17 @@ Factory class to generate the appropriate Elasticsearch ingestor.
 """
 
 import logging
-from .elasticsearch import ElasticsearchBulkIngestor
+from ..utils.registry import LazyRegistry
 
 logger = logging.getLogger(__name__)
 
+# Implementations are imported on first use (elasticsearch)
+LOADERS = LazyRegistry("water_bottle.loaders", __package__, {
+    "elasticsearch": ".elasticsearch:ElasticsearchBulkIngestor",
+    "elasticsearch_async": ".elasticsearch:AsyncElasticsearchBulkIngestor",
+    "elasticsearch_staged": ".staged:StagedElasticsearchIngestor",
+})
+
 class LoaderFactory:
     """
     Orchestrates the selection of the loading strategy.
@@ -17,12 +24,14 @@ class LoaderFactory:
         Returns an instance of a specific ingestor.
 
         Args:
-            load_type (str): 'elasticsearch'.
-            connection (Elasticsearch): The established ES client.
+            load_type (str): 'elasticsearch', 'elasticsearch_async' or 
+                             'elasticsearch_staged' (data is a staging directory).
+            connection (Elasticsearch): The established ES client (an 
+                                        AsyncElasticsearch for 'elasticsearch_async').
             config (dict): Configuration for index settings and mappings.
 
         Returns:
-            ElasticsearchBulkIngestor: An initialized BulkIngestor.
+            ElasticsearchIngestor: An initialized bulk ingestor.
 
         Raises:
             ValueError: If the load_type is unsupported.
@@ -30,8 +39,8 @@ class LoaderFactory:
         logger.info(f"LoaderFactory creating '{load_type}' loader.")
         load_type = load_type.lower().strip()
 
-        if load_type == "elasticsearch":
-            return ElasticsearchBulkIngestor(connection=connection, config=config)
+        if load_type in LOADERS:
+            return LOADERS.get(load_type)(connection=connection, config=config)
         else:
             error_msg = f"Loader type '{load_type}' is not supported."
             logger.error(error_msg)
@@ -1,5 +1,17 @@
-from .ingestor import IngestorConfig   
+from .ingestor import (
+    AdaptiveBulkConfig,
+    BulkLoadModeConfig,
+    IngestorConfig,
+    ReindexConfig,
+    VectorIndexOptions,
+    VectorMappingConfig,
+)
 
 __all__ = [
-    "IngestorConfig"
-]
\ No newline at end of file
+    "AdaptiveBulkConfig",
+    "BulkLoadModeConfig",
+    "IngestorConfig",
+    "ReindexConfig",
+    "VectorIndexOptions",
+    "VectorMappingConfig"
+]
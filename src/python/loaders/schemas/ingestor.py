@@ -1,8 +1,98 @@
-from pydantic import BaseModel
-from typing import Dict, Any
+from pydantic import BaseModel, NonNegativeFloat, NonNegativeInt, PositiveFloat, PositiveInt, model_validator
+from typing import Dict, Any, List, Literal, Optional, Union
+
+class AdaptiveBulkConfig(BaseModel):
+    """Schema for the adaptive bulk mode"""
+
+    # Bounds of the chunk size; 'chunk_size' is the starting point
+    min_chunk_size: PositiveInt = 50
+    max_chunk_size: PositiveInt = 5000
+    # Requests faster than this grow the chunk; 1.5x slower shrink it
+    target_latency: PositiveFloat = 1.0
+    # Item or request statuses retried with backoff
+    retry_on_status: List[int] = [429, 502, 503, 504]
+    max_retries: int = 8
+    initial_backoff: PositiveFloat = 0.5
+    max_backoff: PositiveFloat = 30.0
+
+class BulkLoadModeConfig(BaseModel):
+    """Schema for the index settings applied while loading"""
+
+    # Applied before the load and restored afterwards, even on failure
+    refresh_interval: Union[str, int] = -1
+    number_of_replicas: int = 0
+    # Force-merge to this many segments after a successful load; only for 
+    # indices that are read-only afterwards, e.g. reindexed generations
+    force_merge_segments: Optional[PositiveInt] = None
+
+class ReindexConfig(BaseModel):
+    """Schema for blue/green reloads behind the 'index_name' alias"""
+
+    # Generations are named '<index_name>_v<now formatted with this>'
+    version_format: str = "%Y%m%d%H%M%S"
+    # The new generation must hold at least this share of the serving one's documents
+    min_doc_ratio: NonNegativeFloat = 0.9
+    allow_empty: bool = False
+    # Previous generations kept for rollback
+    keep: NonNegativeInt = 1
+    # Drop the new generation when the load or the validation fails
+    delete_on_failure: bool = True
+
+class VectorIndexOptions(BaseModel):
+    """Schema for the dense_vector 'index_options'"""
+
+    # int8_hnsw quantizes to a quarter of the float32 memory
+    type: Literal["hnsw", "int8_hnsw", "int4_hnsw", "bbq_hnsw", "flat", "int8_flat", "int4_flat", "bbq_flat"] = "int8_hnsw"
+    # HNSW graph only: neighbours per node and candidates while building
+    m: PositiveInt = 16
+    ef_construction: PositiveInt = 100
+    # Quantile used to quantize; int8_* and int4_* types only
+    confidence_interval: Optional[float] = None
+
+    @model_validator(mode="after")
+    def check_confidence_interval(self):
+        if self.confidence_interval is not None and not self.type.startswith(("int8_", "int4_")):
+            raise ValueError(f"'confidence_interval' only applies to int8_* and int4_* types, not '{self.type}'.")
+        return self
+
+class VectorMappingConfig(BaseModel):
+    """Schema for the dense_vector field added to the mappings"""
+
+    # The field the embedder writes
+    field: str = "vector"
+    # Taken from the first record with a vector when unset
+    dims: Optional[PositiveInt] = None
+    similarity: Literal["cosine", "dot_product", "l2_norm", "max_inner_product"] = "cosine"
+    index_options: VectorIndexOptions = VectorIndexOptions()
+    # Keeps vectors out of stored documents; they stay searchable. Updates 
+    # must then always carry the vector again
+    exclude_from_source: bool = False
+    # Records searched for a vector before giving up on the mapping
+    sample_size: PositiveInt = 1000
 
 class IngestorConfig(BaseModel):
 
     index_name: str
     settings: Dict[str, Any]
-    mappings: Dict[str, Any]
\ No newline at end of file
+    mappings: Dict[str, Any]
+    # 'bulk' sends everything through helpers.bulk; 'streaming' and 'parallel' 
+    # report results chunk by chunk without collecting every error; 'adaptive' 
+    # also resizes chunks under pressure and retries rejected documents
+    mode: Literal["bulk", "streaming", "parallel", "adaptive"] = "bulk"
+    # Documents and bytes per bulk request
+    chunk_size: PositiveInt = 500
+    max_chunk_bytes: PositiveInt = 100 * 1024 * 1024
+    # 'parallel': sender threads and chunks queued ahead of them
+    thread_count: PositiveInt = 4
+    queue_size: PositiveInt = 4
+    # Async bulk: bulk requests in flight at once
+    concurrency: PositiveInt = 4
+    adaptive: AdaptiveBulkConfig = AdaptiveBulkConfig()
+    # Set (even to {}) to suspend refreshes and replicas during the load
+    bulk_load_mode: Optional[BulkLoadModeConfig] = None
+    # Set (even to {}) to load into a new generation and swap the alias
+    reindex: Optional[ReindexConfig] = None
+    # Maps the embedder's vector field as a dense_vector
+    vectors: Optional[VectorMappingConfig] = None
+    # Item statuses that are not failures, e.g. [404] for idempotent deletes
+    ignore_status: List[int] = []
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+Loads a run staged on disk (see staging.SegmentWriter) and checkpoints 
+what Elasticsearch acknowledged, so a retried task resumes where the 
+previous attempt stopped instead of starting over.
+"""
+
+import logging
+from pathlib import Path
+from typing import Union
+
+from elasticsearch import helpers
+
+from ..staging import Checkpoint, Segment, SegmentReader
+from .adaptive import AdaptiveBulkLoader
+from .elasticsearch import BulkReport, ElasticsearchBulkIngestor, expand_action
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT = "checkpoint.json"
+
+class StagedElasticsearchIngestor(ElasticsearchBulkIngestor):
+    """
+    Streams the segments of a staged run in order. Results come back in 
+    request order ('parallel' mode uses parallel_bulk, 'bulk' and 
+    'streaming' streaming_bulk), so the checkpoint can advance over every 
+    leading document that was indexed; a failure pins it until the next 
+    attempt. 'adaptive' mode checkpoints whole segments instead.
+    """
+    def __call__(self, data: Union[str, Path, SegmentReader], full_reload: bool = False):
+        """
+        Args:
+            data (str | Path | SegmentReader): The run's staging directory.
+            full_reload (bool): Whether the run holds every document.
+        """
+        reader = self.open(data)
+        if self.config.reindex is None and self.checkpoint.index != self.index_name:
+            self.checkpoint.reset(self.index_name)
+        return super().__call__(reader, full_reload)
+
+    def open(self, data: Union[str, Path, SegmentReader]) -> SegmentReader:
+        """
+        Opens the staged run and its checkpoint.
+        """
+        reader = data if isinstance(data, SegmentReader) else SegmentReader(data)
+        if getattr(self, "checkpoint", None) is None or self.checkpoint.run_id != reader.run_id:
+            self.checkpoint = Checkpoint(reader.directory / CHECKPOINT, reader.run_id)
+        return reader
+
+    def new_generation(self, alias: str) -> str:
+        """
+        Resumes into the generation of the interrupted attempt when it still 
+        exists (set reindex.delete_on_failure to false to keep it).
+        """
+        index = self.checkpoint.index
+        if index and index.startswith(f"{alias}_v") and self.connection.indices.exists(index=index):
+            logger.info(f"Resuming into generation '{index}'.")
+            return index
+        index = super().new_generation(alias)
+        self.checkpoint.reset(index)
+        return index
+
+    def retarget(self, data):
+        # Staged actions carry no '_index'; they follow the request's index
+        return data
+
+    def load(self, data: Union[str, Path, SegmentReader]):
+        """
+        Args:
+            data (str | Path | SegmentReader): The run's staging directory.
+
+        Returns:
+            tuple: Number of indexed and of failed documents in this attempt.
+
+        Raises:
+            BulkIndexError: If any document failed, with sample failures.
+        """
+        reader = self.open(data)
+        config = self.config
+        adaptive = config.mode == "adaptive"
+        # The adaptive loader flushes the report after every request
+        report = BulkReport(None if adaptive else config.chunk_size, config.ignore_status)
+        if adaptive:
+            loader = AdaptiveBulkLoader(self.connection, config, report, index=self.index_name)
+            self.stats = {"retried": 0, "requests": 0, "seconds": 0.0}
+
+        for segment in reader.segments:
+            start = self.checkpoint.offset(segment.name)
+            if start >= segment.documents:
+                logger.debug(f"Skipping '{segment.name}': already loaded.")
+                continue
+            logger.info(f"Loading '{segment.name}' from document {start} of {segment.documents}.")
+            if adaptive:
+                self._load_adaptive(loader, reader, segment, start, report)
+            else:
+                self._load_ordered(reader, segment, start, report)
+        report.flush()
+
+        logger.info(f"Staged load complete. Success: {report.success}, Failed: {report.failed}")
+        if report.failed:
+            raise helpers.BulkIndexError(f"{report.failed} document(s) failed to index.", report.samples)
+        return report.success, report.failed
+
+    def _load_ordered(self, reader: SegmentReader, segment: Segment, start: int, report: BulkReport) -> None:
+        """
+        Sends a segment with streaming_bulk or parallel_bulk and advances 
+        the checkpoint every chunk over the leading indexed documents.
+        """
+        config = self.config
+        ignore_status = set(config.ignore_status)
+        options = dict(
+            chunk_size=config.chunk_size,
+            max_chunk_bytes=config.max_chunk_bytes,
+            index=self.index_name,
+            expand_action_callback=expand_action,
+            ignore_status=config.ignore_status,
+            raise_on_error=False,
+        )
+        actions = reader.read(segment, start)
+        if config.mode == "parallel":
+            results = helpers.parallel_bulk(
+                self.connection, actions, thread_count=config.thread_count, queue_size=config.queue_size, **options
+            )
+        else:
+            results = helpers.streaming_bulk(self.connection, actions, **options)
+
+        acknowledged, clean = start, True
+        for ok, item in results:
+            report.add(ok, item)
+            indexed = ok or next(iter(item.values()), {}).get("status") in ignore_status
+            if not indexed:
+                clean = False
+            elif clean:
+                acknowledged += 1
+            if clean and (acknowledged - start) % config.chunk_size == 0:
+                self.checkpoint.update(segment.name, acknowledged)
+        self.checkpoint.update(segment.name, acknowledged)
+
+    def _load_adaptive(self, loader: AdaptiveBulkLoader, reader: SegmentReader, segment: Segment, start: int, report: BulkReport) -> None:
+        """
+        Sends a segment through the adaptive loader. Its retries re-order 
+        the results, so the checkpoint only moves once the whole segment 
+        has been indexed.
+        """
+        failed = report.failed
+        stats = loader.load(map(expand_action, reader.read(segment, start)))
+        for key in ("retried", "requests", "seconds"):
+            self.stats[key] += stats[key]
+        self.stats.update(documents=report.success, failed=report.failed, chunk_size=stats["chunk_size"])
+        if report.failed == failed:
+            self.checkpoint.update(segment.name, segment.documents)
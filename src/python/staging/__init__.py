@@ -0,0 +1,20 @@
+"""
+Stages transformed actions on disk so loads can resume after a failure.
+"""
+
+import logging
+
+from .segments import Segment, SegmentReader, SegmentWriter
+from .checkpoint import Checkpoint
+from .schemas import StagingConfig
+
+__all__ = [
+    "Segment",
+    "SegmentReader",
+    "SegmentWriter",
+    "Checkpoint",
+    "StagingConfig",
+]
+
+# Set a default logger for the package
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -0,0 +1,63 @@
+"""
+Records how far a staged run has been loaded: per segment, the number of 
+leading documents Elasticsearch acknowledged. A retried load skips them.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from .segments import _atomic_write
+
+logger = logging.getLogger(__name__)
+
+class Checkpoint:
+    """
+    A small JSON file next to the segments. A checkpoint of another run 
+    (the staging was rewritten) is discarded.
+    """
+
+    def __init__(self, path: Union[str, Path], run_id: str):
+        """
+        Args:
+            path (str | Path): Location of the checkpoint file.
+            run_id (str): The staged run being loaded.
+        """
+        self.path = Path(path)
+        self.run_id = run_id
+        self.index: Optional[str] = None
+        self.offsets: Dict[str, int] = {}
+        if self.path.exists():
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+            if state.get("run_id") == run_id:
+                self.index = state.get("index")
+                self.offsets = state.get("offsets", {})
+                logger.info(f"Resuming run {run_id} from checkpoint: {self.offsets}")
+
+    def offset(self, segment: str) -> int:
+        """
+        Returns:
+            int: Leading documents of `segment` already acknowledged.
+        """
+        return self.offsets.get(segment, 0)
+
+    def update(self, segment: str, offset: int) -> None:
+        """
+        Records that the first `offset` documents of `segment` are loaded.
+        """
+        if offset != self.offsets.get(segment):
+            self.offsets[segment] = offset
+            self.save()
+
+    def reset(self, index: Optional[str] = None) -> None:
+        """
+        Starts over, e.g. because the target index no longer exists.
+        """
+        self.index = index
+        self.offsets = {}
+        self.save()
+
+    def save(self) -> None:
+        state = {"run_id": self.run_id, "index": self.index, "offsets": self.offsets}
+        _atomic_write(self.path, json.dumps(state).encode("utf-8"))
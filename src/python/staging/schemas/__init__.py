@@ -0,0 +1,5 @@
+from .staging import StagingConfig
+
+__all__ = [
+    "StagingConfig",
+]
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field, PositiveInt
+from typing import Literal
+
+class StagingConfig(BaseModel):
+    """Schema for the on-disk NDJSON staging area"""
+
+    # Each run writes its segments to a sub-directory of this path
+    path: str
+    # Documents per segment file; the unit of checkpoint bookkeeping
+    segment_size: PositiveInt = 10000
+    compression: Literal["gzip", "none"] = "gzip"
+    # Low levels keep the transform fast; staging is short-lived
+    compresslevel: int = Field(3, ge=1, le=9)
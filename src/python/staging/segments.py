@@ -0,0 +1,160 @@
+"""
+Spills bulk actions to compressed NDJSON segment files and streams them 
+back with memory-mapped reads, so the load task can be retried without 
+re-running extraction and transformation.
+"""
+
+import gzip
+import json
+import logging
+import mmap
+import os
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+from ..utils.ndjson import encode_action
+from .schemas import StagingConfig
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+
+@dataclass(frozen=True)
+class Segment:
+    """
+    A staged segment file, the number of documents it holds and the 
+    positions of the documents that are a single line (deletes); every 
+    other document is an action line plus a source line.
+    """
+    name: str
+    documents: int
+    bytes: int
+    single: Tuple[int, ...] = ()
+
+class SegmentWriter:
+    """
+    Writes actions (dicts or pre-encoded NDJSON bytes) into numbered 
+    segment files and finishes with a manifest. A directory without a 
+    manifest is an incomplete run and is not readable.
+    """
+
+    def __init__(self, directory: Union[str, Path], config: Dict[str, Any]):
+        """
+        Args:
+            directory (str | Path): The run's staging directory.
+            config (Dict[str, Any]): StagingConfig fields.
+        """
+        self.directory = Path(directory)
+        self.config = StagingConfig(**config)
+
+    def __call__(self, actions: Iterable[Union[Dict[str, Any], bytes]]) -> Dict[str, Any]:
+        """
+        Stages every action and writes the manifest.
+
+        Returns:
+            Dict[str, Any]: The manifest (run_id, compression, segments).
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # A rerun replaces the previous staging of this directory
+        (self.directory / MANIFEST).unlink(missing_ok=True)
+
+        segments: List[Segment] = []
+        batch: List[bytes] = []
+        for action in actions:
+            batch.append(_frame(action) if isinstance(action, bytes) else encode_action(action))
+            if len(batch) >= self.config.segment_size:
+                segments.append(self._write(len(segments), batch))
+                batch = []
+        if batch:
+            segments.append(self._write(len(segments), batch))
+
+        manifest = {
+            "run_id": uuid.uuid4().hex,
+            "compression": self.config.compression,
+            "segments": [{**segment.__dict__, "single": list(segment.single)} for segment in segments],
+        }
+        _atomic_write(self.directory / MANIFEST, json.dumps(manifest, indent=2).encode("utf-8"))
+        documents = sum(segment.documents for segment in segments)
+        logger.info(f"Staged {documents} actions in {len(segments)} segment(s) at '{self.directory}'.")
+        return manifest
+
+    def _write(self, number: int, batch: List[bytes]) -> Segment:
+        """
+        Writes one segment file atomically.
+        """
+        single = tuple(i for i, action in enumerate(batch) if action.count(b"\n") == 1)
+        data = b"".join(batch)
+        suffix = ".ndjson.gz" if self.config.compression == "gzip" else ".ndjson"
+        name = f"segment-{number:05d}{suffix}"
+        if self.config.compression == "gzip":
+            data = gzip.compress(data, compresslevel=self.config.compresslevel)
+        _atomic_write(self.directory / name, data)
+        return Segment(name=name, documents=len(batch), bytes=len(data), single=single)
+
+class SegmentReader:
+    """
+    Reads a staged run back as pre-encoded actions, one segment at a time.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Args:
+            directory (str | Path): A staging directory written by SegmentWriter.
+
+        Raises:
+            FileNotFoundError: If the run has no manifest (it never finished).
+        """
+        self.directory = Path(directory)
+        manifest = json.loads((self.directory / MANIFEST).read_text(encoding="utf-8"))
+        self.run_id: str = manifest["run_id"]
+        self.compression: str = manifest["compression"]
+        self.segments: List[Segment] = [
+            Segment(**{**segment, "single": tuple(segment.get("single", ()))}) for segment in manifest["segments"]
+        ]
+
+    def __iter__(self) -> Iterator[bytes]:
+        for segment in self.segments:
+            yield from self.read(segment)
+
+    def read(self, segment: Segment, start: int = 0) -> Iterator[bytes]:
+        """
+        Yields the actions of a segment from document `start` on, each as 
+        its action line plus, except for deletes, its source line.
+        """
+        with open(self.directory / segment.name, "rb") as handle:
+            if segment.bytes == 0:
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                stream = gzip.GzipFile(fileobj=mapped) if self.compression == "gzip" else mapped
+                lines = iter(stream.readline, b"")
+                single = set(segment.single)
+                for index, line in enumerate(lines):
+                    action = line if index in single else line + next(lines)
+                    if index >= start:
+                        yield action
+
+def _frame(action: bytes) -> bytes:
+    """
+    Checks that a pre-encoded action is one or two newline-terminated lines.
+
+    Raises:
+        ValueError: If it is empty or has more than two lines.
+    """
+    if not action.endswith(b"\n"):
+        action += b"\n"
+    if not 1 <= action.count(b"\n") <= 2:
+        raise ValueError(f"A staged action must be one or two NDJSON lines, got: {action[:200]!r}")
+    return action
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Writes `data` next to `path` and renames it into place.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, path)
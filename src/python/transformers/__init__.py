@@ -6,11 +6,18 @@ Purpose:
     of raw data into search-ready formats.
 """
 
+from ..utils.registry import lazy_exports
 from .factory import TransformerFactory
-from .base import BaseTransformer
 from .schemas import *
 
+# base imports pyarrow when available, so load it on first access
+__getattr__ = lazy_exports(__name__, {
+    "BaseTransformer": ".base",
+    "TextChunkTransformer": ".text_chunker",
+})
+
 __all__ = [
     "TransformerFactory",
     "BaseTransformer",
+    "TextChunkTransformer",
 ]
\ No newline at end of file
@@ -5,11 +5,30 @@ the shared logic for data type cleaning and Elasticsearch-style formatting.
 
 import logging
 from datetime import datetime, date
+from operator import methodcaller
 from decimal import Decimal
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+# Module-level Conditional Import
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# A conversion plan: (column, converter) for each column that needs one
+Plan = Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+# Types that are already JSON-compatible and need no converter
+_PASSTHROUGH = (str, int, float, bool, list, dict)
+
+# Dispatches on the value, so a date in a datetime column (or vice versa) 
+# keeps its own format
+_ISOFORMAT = methodcaller("isoformat")
+
 class BaseTransformer:
     """
     Acts as the parent class for all transformers to ensure 
@@ -27,32 +46,174 @@ class BaseTransformer:
         self.index_name = config.get("index_name")
         logger.debug(f"BaseTransformer initialized for index: {self.index_name}")
 
-    def transform(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def transform(
+        self,
+        data: Dict[str, Any],
+        plan: Optional[Plan] = None,
+        doc_id: Optional[str] = None,
+        op_type: str = "index"
+    ) -> Dict[str, Any]:
         """
         Converts a raw dictionary into a standardized, index-ready format.
         It cleans data types and wraps the result in an '_index' and '_source' structure.
         
         Args:
             data (Dict[str, Any]): The raw dictionary to be cleaned.
+            plan (Plan): A plan from compile_plan(). Without one every 
+                         value goes through clean_value().
+            doc_id (str): The document '_id'; Elasticsearch assigns one if None.
+            op_type (str): The bulk operation, see wrap().
             
         Returns:
             Dict[str, Any]: A dictionary formatted for the indexing script.
         """
-        clean_row = {}
-        
-        for key, value in data.items():
-            # Standardizing Data Types for JSON serialization
-            if isinstance(value, (datetime, date)):
-                clean_row[key] = value.isoformat()
-            elif isinstance(value, Decimal):
-                clean_row[key] = float(value)
-            # Handle non-standard types by stringifying
-            elif value is not None and not isinstance(value, (str, int, float, bool, list, dict)):
-                clean_row[key] = str(value)
-            else:
-                clean_row[key] = value
-
-        return {
-            "_index": self.index_name,
-            "_source": clean_row
-        }
\ No newline at end of file
+        if plan is None:
+            clean_row = {key: self.clean_value(value) for key, value in data.items()}
+        else:
+            clean_row = dict(data)
+            for key, convert in plan:
+                value = clean_row.get(key)
+                if value is not None:
+                    clean_row[key] = convert(value)
+
+        return self.wrap(clean_row, doc_id, op_type)
+
+    def wrap(self, source: Dict[str, Any], doc_id: Optional[str] = None, op_type: str = "index") -> Dict[str, Any]:
+        """
+        Builds the bulk action for a document.
+
+        Args:
+            source (Dict[str, Any]): The document body.
+            doc_id (str): The document '_id', if any.
+            op_type (str): 'index', 'create', 'update' (a partial document 
+                           with doc_as_upsert) or 'delete'.
+
+        Returns:
+            Dict[str, Any]: An action for the bulk helpers.
+        """
+        action = {"_index": self.index_name}
+        if doc_id is not None:
+            action["_id"] = doc_id
+        if op_type == "index":
+            action["_source"] = source
+        elif op_type == "create":
+            action.update(_op_type="create", _source=source)
+        elif op_type == "update":
+            action.update(_op_type="update", doc=source, doc_as_upsert=True)
+        elif op_type == "delete":
+            action["_op_type"] = "delete"
+        else:
+            raise ValueError(f"Unsupported op_type: {op_type}")
+        return action
+
+    @staticmethod
+    def clean_value(value: Any) -> Any:
+        """
+        Standardizes a single value for JSON serialization.
+
+        Args:
+            value (Any): A raw cell value.
+
+        Returns:
+            Any: A JSON-compatible value.
+        """
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        elif isinstance(value, Decimal):
+            return float(value)
+        # Handle non-standard types by stringifying
+        elif value is not None and not isinstance(value, (str, int, float, bool, list, dict)):
+            return str(value)
+        return value
+
+    @classmethod
+    def compile_plan(cls, rows: Iterable[Dict[str, Any]]) -> Plan:
+        """
+        Inspects the column types of a table once and picks a converter per 
+        column, so rows no longer go through the clean_value() isinstance 
+        chain cell by cell. Columns that are already JSON-compatible are 
+        left out of the plan. A column's type is taken from its first 
+        non-null value, as RDBMS result columns keep one type per table; 
+        columns that are null throughout the sample fall back to clean_value(). 
+        Rows of a table are expected to share their columns, so columns first 
+        seen after the sample are left as they are.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): Sample rows, e.g. the first batch.
+
+        Returns:
+            Plan: (column, converter) pairs for the columns that need one.
+        """
+        kinds: Dict[str, Optional[type]] = {}
+        for row in rows:
+            for key, value in row.items():
+                if kinds.get(key) is None:
+                    kinds[key] = None if value is None else type(value)
+
+        plan = []
+        for key, kind in kinds.items():
+            if kind is None:
+                plan.append((key, cls.clean_value))
+            elif issubclass(kind, (datetime, date)):
+                plan.append((key, _ISOFORMAT))
+            elif issubclass(kind, Decimal):
+                plan.append((key, float))
+            elif not issubclass(kind, _PASSTHROUGH):
+                plan.append((key, str))
+        return tuple(plan)
+
+    @staticmethod
+    def is_columnar(data: Any) -> bool:
+        """
+        Tells whether a batch is a pyarrow RecordBatch or Table.
+        """
+        return PYARROW_AVAILABLE and isinstance(data, (pa.RecordBatch, pa.Table))
+
+    def _clean_column(self, column: Any) -> Any:
+        """
+        Applies the clean_value rules to a whole Arrow column at once.
+
+        Args:
+            column (pa.Array | pa.ChunkedArray): A column of a batch.
+
+        Returns:
+            pa.Array | pa.ChunkedArray: The JSON-compatible column.
+        """
+        kind = column.type
+        if pa.types.is_decimal(kind):
+            # Going through the decimal string keeps float(Decimal) rounding
+            return column.cast(pa.string()).cast(pa.float64())
+        if pa.types.is_timestamp(kind):
+            fmt = "%Y-%m-%dT%H:%M:%S%z" if kind.tz else "%Y-%m-%dT%H:%M:%S"
+            text = pc.strftime(column, format=fmt)
+            # Match datetime.isoformat(): no zero fraction, '+HH:MM' offsets
+            text = pc.replace_substring_regex(text, pattern=r"\.0+([+-]|$)", replacement=r"\1")
+            return pc.replace_substring_regex(text, pattern=r"([+-]\d\d)(\d\d)$", replacement=r"\1:\2")
+        if pa.types.is_date(kind):
+            return column.cast(pa.string())
+        if (pa.types.is_integer(kind) or pa.types.is_floating(kind) or pa.types.is_boolean(kind)
+                or pa.types.is_string(kind) or pa.types.is_large_string(kind) or pa.types.is_null(kind)
+                or pa.types.is_nested(kind)):
+            return column
+        # Rare types (time, binary, ...) take the per-value path
+        return pa.array([self.clean_value(value) for value in column.to_pylist()])
+
+    def transform_columnar(self, batch: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Columnar counterpart of transform(). Type conversions run once per 
+        column instead of once per cell; dicts are only built at the end.
+
+        Args:
+            batch (pa.RecordBatch | pa.Table): Raw columnar data.
+
+        Yields:
+            Dict[str, Any]: A dictionary formatted for the indexing script.
+        """
+        columns = [self._clean_column(column) for column in batch.columns]
+        clean_batch = type(batch).from_arrays(columns, names=batch.schema.names)
+
+        for clean_row in clean_batch.to_pylist():
+            yield {
+                "_index": self.index_name,
+                "_source": clean_row
+            }
\ No newline at end of file
@@ -5,10 +5,16 @@ Provides a universal entry point for creating specific transformer instances.
 import logging
 from typing import Any, Dict
 
-from .json_transformer import JsonTransformer
+from ..utils.registry import LazyRegistry
 
 logger = logging.getLogger(__name__)
 
+# Implementations are imported on first use
+TRANSFORMERS = LazyRegistry("water_bottle.transformers", __package__, {
+    "json": ".json_transformer:JsonTransformer",
+    "text_chunks": ".text_chunker:TextChunkTransformer",
+})
+
 class TransformerFactory:
     """
     Factory class to route data to the correct transformer implementation.
@@ -20,7 +26,7 @@ class TransformerFactory:
         Instantiates the requested transformer based on type.
 
         Args:
-            transformer_type (str): Type of transformation ('json').
+            transformer_type (str): Type of transformation ('json', 'text_chunks').
             data (Any): The dataset to be transformed.
             config (Dict[str, Any]): Parameters for the transformer.
 
@@ -33,8 +39,8 @@ class TransformerFactory:
         logger.info(f"TransformerFactory creating transformer for type: {transformer_type}")
         transformer_type = transformer_type.lower().strip()
 
-        if transformer_type == "json":
-            return JsonTransformer(data, config)
+        if transformer_type in TRANSFORMERS:
+            return TRANSFORMERS.get(transformer_type)(data, config)
              
         else:
             error_msg = f"Unknown transformer type: {transformer_type}"
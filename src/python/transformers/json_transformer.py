@@ -1,12 +1,19 @@
-# Note: need to modify the model_name finding (.rstrip('s'))
 """
 Specialized transformer for structured data (like RDBMS results). 
 Standardizes records for bulk indexing.
 """
 import logging
-from typing import Dict, Any, Iterator, List
-from .base import BaseTransformer
-from . import schemas 
+import random
+import re
+from typing import Dict, Any, Iterable, Iterator, List, Tuple, Type, Union
+from pydantic import BaseModel, ValidationError
+from .base import BaseTransformer, Plan
+from .registry import SchemaRegistry, batch_adapter, dump_options
+from .processes import transform_in_processes
+from .schemas import DocumentTableConfig, ProcessPoolConfig
+from ..utils.keys import compose_key, hash_key
+from ..utils.ndjson import encode_action
+from ..fingerprints import TOMBSTONE_FIELD, fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -16,18 +23,47 @@ class JsonTransformer(BaseTransformer):
     for bulk indexing using shared base logic.
     """
 
-    def __init__(self, data: Dict[str, List[Dict[str, Any]]], config: Dict[str, Any]):
+    def __init__(
+        self,
+        data: Union[Dict[str, List[Dict[str, Any]]], Iterable[Tuple[str, List[Dict[str, Any]]]]],
+        config: Dict[str, Any]
+    ):
         """
         Initializes the transformer with the dataset and configuration.
 
         Args:
-            data (Dict[str, List[Dict[str, Any]]]): Raw data organized by table names.
-            config (Dict[str, Any]): Configuration containing 'index_name'.
+            data: Raw data organized by table names, or a stream of 
+                  (table_name, rows) batches from a streaming extractor.
+            config (Dict[str, Any]): Configuration containing 'index_name', an optional 
+                                     'schemas' section for the SchemaRegistry (table to 
+                                     model mapping, reflection) and an optional 
+                                     'validation' policy: 'full' (default), 
+                                     'sample(N)' to validate N random rows per batch 
+                                     and fall back to the whole batch if any fails, 
+                                     or 'off' for trusted sources. Rows that are not 
+                                     fully validated are formatted as extracted. 
+                                     An optional 'processes' section (ProcessPoolConfig) 
+                                     runs batches on a process pool. 'output_format' 
+                                     'ndjson' yields each action as ready-to-send 
+                                     NDJSON bytes instead of a dict. 'documents' maps 
+                                     tables to their id derivation and bulk operation 
+                                     (DocumentTableConfig).
         """
         super().__init__(config)
+        self.validation, self.sample_size = parse_validation(config.get("validation", "full"))
         self.data = data
-        # We import the schema module to look up models by name dynamically
-        self.schema_module = schemas
+        # Resolves each table's model once, from config or reflected specs
+        self.registry = SchemaRegistry(config.get("schemas"))
+        # Conversion plans, compiled once per table
+        self.plans: Dict[str, Plan] = {}
+        self.processes = ProcessPoolConfig(**(config.get("processes") or {}))
+        self.documents = {
+            table: DocumentTableConfig(**document)
+            for table, document in (config.get("documents") or {}).items()
+        }
+        self.output_format = config.get("output_format", "dicts")
+        if self.output_format not in ("dicts", "ndjson"):
+            raise ValueError(f"Invalid output_format '{self.output_format}'. Use 'dicts' or 'ndjson'.")
 
     def __call__(self) -> Iterator[Dict[str, Any]]:
         # 1. Safety Check
@@ -35,37 +71,185 @@ class JsonTransformer(BaseTransformer):
             logger.warning("JsonTransformer received empty data.")
             return
 
-        # 2. Table Loop: The input 'self.data' is a dict where keys are table names
+        # 2. Table Loop: The input 'self.data' is a dict where keys are table names,
+        # or a stream of (table_name, rows) batches where a table may repeat.
         # Example: table_name = "users", rows = [{row1}, {row2}]
-        for table_name, rows in self.data.items():
-        
-            # 3. Dynamic Naming: Converts "users" -> "UserRecord"
-            # .capitalize() makes "users" -> "Users"
-            # .rstrip('s') makes "Users" -> "User"
-            model_name = f"{table_name.capitalize().rstrip('s')}Record"
-            
-            # 4. Lookup: Searches schemas.py for a class named "UserRecord"
-            model_class = getattr(self.schema_module, model_name, None)
-            
-            # 5. Row Loop: Process every record inside the table
-            for row in rows:
+        batches = self.data.items() if isinstance(self.data, dict) else self.data
+
+        # Batches are independent, so they can be spread over processes
+        if self.processes.workers > 1:
+            yield from transform_in_processes(batches, self.config, self.processes)
+            return
+
+        for table_name, rows in batches:
+            yield from self.transform_batch(table_name, rows)
+
+    def transform_batch(self, table_name: str, rows: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Validates and formats one (table_name, rows) batch.
+
+        Args:
+            table_name (str): The table the rows come from.
+            rows (List[Dict] | pa.RecordBatch | pa.Table): The batch.
+
+        Yields:
+            Dict[str, Any] | bytes: Index and delete actions, as NDJSON lines 
+            when output_format is 'ndjson'.
+        """
+        ndjson = self.output_format == "ndjson"
+        document = self.documents.get(table_name)
+        op_type = document.op_type if document else "index"
+
+        # 3-4. Lookup: The registry maps the table to its model (e.g. 
+        # "users" -> UserRecord); None means the table has no schema.
+        model_class = self.registry.get(table_name)
+
+        # Columnar batches without a schema are cleaned column by column;
+        # with a schema, rows are needed for validation.
+        if self.is_columnar(rows):
+            if not model_class:
+                for action in self.transform_columnar(rows):
+                    if document:
+                        action = self.wrap(action["_source"], self.document_id(document, action["_source"]), op_type)
+                    yield encode_action(action) if ndjson else action
+                return
+            rows = rows.to_pylist()
+
+        # 5. Tombstones from the fingerprint stage become delete actions
+        live = []
+        for row in rows:
+            if row.get(TOMBSTONE_FIELD):
+                doc_id = row["_id"]
+                if document and document.id_strategy == "hash":
+                    doc_id = hash_key(doc_id)
+                action = {"_op_type": "delete", "_index": self.index_name, "_id": doc_id}
+                yield encode_action(action) if ndjson else action
+            else:
+                live.append(row)
+        if not live:
+            return
+
+        # 6. Validation: the whole batch is checked against the schema at
+        # once, according to the validation policy. Dirty rows are dropped.
+        planned = True
+        if model_class and self.validation != "off":
+            live, planned = self._validate(table_name, model_class, live)
+
+        # The NDJSON encoder handles Decimal and datetime itself, so rows skip
+        # the cleaning pass and go straight to bytes
+        if ndjson:
+            for row in live:
                 try:
-                    # 6. Strict Validation:
-                    # This line checks if the row has the right columns and types.
-                    # If "UserRecord" was found, it validates the row.
-                    if model_class:
-                        validated_data = model_class(**row).model_dump()
-                    else:
-                        # If no schema is found, we just use the raw row
-                        validated_data = row
-                    
-                    # 7. Formatting:
-                    # Calls 'transform' from base.py to turn Decimals into floats,
-                    # Dates into strings, and adds the "_index" wrapper.
-                    yield self.transform(validated_data)
-                    
+                    doc_id = self.document_id(document, row) if document else None
+                    yield encode_action(self.wrap(row, doc_id, op_type))
                 except Exception as e:
-                    # 8. Error Handling: 
-                    # If a row is "dirty" (missing columns), it logs and skips to the next row.
-                    logger.error(f"Validation failed for {table_name}: {e}")
-                    continue
\ No newline at end of file
+                    logger.error(f"Transformation failed for {table_name}: {e}")
+            return
+
+        # The plan is compiled once per table from the first batch. Batches
+        # validated only as a sample fallback may be reshaped, so they take
+        # the per-cell path instead.
+        plan = None
+        if planned:
+            plan = self.plans.get(table_name)
+            if plan is None:
+                plan = self.plans[table_name] = self.compile_plan(live)
+
+        # 7. Formatting:
+        # Calls 'transform' from base.py to turn Decimals into floats,
+        # Dates into strings, and adds the "_index" wrapper.
+        for row in live:
+            try:
+                if document:
+                    yield self.transform(row, plan, self.document_id(document, row), op_type)
+                else:
+                    yield self.transform(row, plan)
+            except Exception as e:
+                logger.error(f"Transformation failed for {table_name}: {e}")
+
+    @staticmethod
+    def document_id(document: DocumentTableConfig, row: Dict[str, Any]) -> str:
+        """
+        Derives a deterministic '_id', so reloads overwrite documents instead 
+        of duplicating them. Column ids match the keys of the fingerprint 
+        stage's tombstones.
+
+        Args:
+            document (DocumentTableConfig): The table's id settings.
+            row (Dict[str, Any]): The validated row.
+
+        Returns:
+            str: The document id.
+        """
+        if not document.id_columns:
+            return fingerprint(row)
+        key = compose_key(row, document.id_columns)
+        return hash_key(key) if document.id_strategy == "hash" else key
+
+    def _validate(self, table_name: str, model_class: Type[BaseModel], rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Applies the validation policy to one batch.
+
+        Args:
+            table_name (str): Table the batch belongs to (for logging).
+            model_class (Type[BaseModel]): The table's schema.
+            rows (List[Dict[str, Any]]): The batch.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: The rows to format, and whether 
+            they have the table's usual shape (False when a failed sample 
+            forced full validation).
+        """
+        if self.validation == "sample":
+            size = min(self.sample_size, len(rows))
+            sample = [rows[i] for i in sorted(random.sample(range(len(rows)), size))]
+            try:
+                batch_adapter(model_class).validate_python(sample)
+                return rows, True
+            except ValidationError:
+                logger.warning(f"Sample validation failed for {table_name}; validating the whole batch.")
+                return self._validate_batch(table_name, model_class, rows), False
+
+        return self._validate_batch(table_name, model_class, rows), True
+
+    @staticmethod
+    def _validate_batch(table_name: str, model_class: Type[BaseModel], rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Validates and dumps a whole batch with one TypeAdapter call. When 
+        some rows fail, they are logged and dropped, and the rest of the 
+        batch is validated again.
+        """
+        adapter = batch_adapter(model_class)
+        options = dump_options(model_class)
+        try:
+            return adapter.dump_python(adapter.validate_python(rows), **options)
+        except ValidationError as e:
+            failed: Dict[int, List[str]] = {}
+            for error in e.errors():
+                index = error["loc"][0] if error["loc"] else None
+                failed.setdefault(index, []).append(error["msg"])
+            if None in failed:
+                raise
+
+            for index, messages in failed.items():
+                logger.error(f"Validation failed for {table_name} row {index}: {'; '.join(messages)}")
+            valid = [row for i, row in enumerate(rows) if i not in failed]
+            return adapter.dump_python(adapter.validate_python(valid), **options) if valid else []
+
+def parse_validation(policy: str) -> Tuple[str, int]:
+    """
+    Parses a 'full' | 'sample(N)' | 'off' validation policy.
+
+    Returns:
+        Tuple[str, int]: The mode and the sample size (0 unless sampling).
+
+    Raises:
+        ValueError: If the policy is not recognized.
+    """
+    policy = str(policy).lower().replace(" ", "")
+    if policy in ("full", "off"):
+        return policy, 0
+    match = re.fullmatch(r"sample\((\d+)\)", policy)
+    if match and int(match.group(1)) > 0:
+        return "sample", int(match.group(1))
+    raise ValueError(f"Invalid validation policy '{policy}'. Use 'full', 'sample(N)' or 'off'.")
@@ -0,0 +1,85 @@
+"""
+Runs the JsonTransformer on a process pool, so validation and type 
+cleaning use every core of the worker instead of one.
+"""
+
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .schemas import ProcessPoolConfig
+
+logger = logging.getLogger(__name__)
+
+# The transformer of the current worker process, built by _init_worker
+_WORKER = None
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    """
+    Builds the worker's transformer and preloads every known schema model, 
+    so the first batches do not pay for model imports or validator builds.
+    """
+    global _WORKER
+    from .json_transformer import JsonTransformer
+
+    _WORKER = JsonTransformer(data=None, config=config)
+    _WORKER.registry.preload()
+
+def _transform_batch(table_name: str, rows: Any) -> List[Dict[str, Any]]:
+    return list(_WORKER.transform_batch(table_name, rows))
+
+def transform_in_processes(
+    batches: Iterable[Tuple[str, Any]],
+    config: Dict[str, Any],
+    settings: ProcessPoolConfig
+) -> Iterator[Dict[str, Any]]:
+    """
+    Sends (table_name, rows) batches to worker processes and yields the 
+    resulting actions. At most `max_in_flight` batches are submitted ahead 
+    of the consumer, so memory stays bounded on large extractions.
+
+    Args:
+        batches (Iterable[Tuple[str, Any]]): Extracted batches.
+        config (Dict[str, Any]): The transformer config, sent to every worker.
+        settings (ProcessPoolConfig): Pool size, ordering and bounds.
+
+    Yields:
+        Dict[str, Any]: Actions, batch by batch; in input order unless 
+        `ordered` is False.
+    """
+    max_in_flight = settings.max_in_flight or settings.workers * 2
+    context = multiprocessing.get_context(settings.start_method)
+    pool = ProcessPoolExecutor(
+        max_workers=settings.workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(config,),
+    )
+    logger.info(f"Transforming on {settings.workers} processes (ordered={settings.ordered}).")
+
+    pending: "deque" = deque()
+    try:
+        for table_name, rows in batches:
+            pending.append(pool.submit(_transform_batch, table_name, rows))
+            while len(pending) >= max_in_flight:
+                yield from _drain(pending, settings.ordered)
+        while pending:
+            yield from _drain(pending, settings.ordered)
+    finally:
+        # Also reached when the consumer stops early or a batch failed
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def _drain(pending: "deque", ordered: bool) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the actions of one finished batch: the oldest one when ordered, 
+    otherwise whichever finishes first.
+    """
+    if ordered:
+        future = pending.popleft()
+    else:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        future = next(iter(done))
+        pending.remove(future)
+    yield from future.result()
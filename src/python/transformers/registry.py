@@ -0,0 +1,229 @@
+"""
+Maps tables to the pydantic models that validate their rows.
+
+Models come from explicit "module:Class" entries in the config, or are 
+built from column specs reflected from the database. Reflected specs are 
+cached in a JSON file, so a table is reflected once and every later run 
+or task only rebuilds the model; built models (and their compiled 
+validators) are shared within a process.
+"""
+
+import datetime
+import decimal
+import json
+import logging
+import os
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, create_model
+
+from ..utils.registry import LazyRegistry
+from .schemas import SchemaRegistryConfig
+
+logger = logging.getLogger(__name__)
+
+# Models shipped with the package, used unless the config overrides them
+DEFAULT_MODELS = {
+    "users": ".schemas:UserRecord",
+    "orders": ".schemas:OrderRecord",
+    "products": ".schemas:ProductRecord",
+}
+
+# Python types of reflected columns, by spec name
+SPEC_TYPES = {
+    "int": int,
+    "float": float,
+    "decimal": decimal.Decimal,
+    "str": str,
+    "bool": bool,
+    "datetime": datetime.datetime,
+    "date": datetime.date,
+    "time": datetime.time,
+    "timedelta": datetime.timedelta,
+    "bytes": bytes,
+    "uuid": uuid.UUID,
+    "dict": dict,
+    "list": list,
+    "any": Any,
+}
+
+class ReflectedRecord(BaseModel):
+    """
+    Base of models built from reflection. Every field is optional, since an 
+    extraction may select only some of the table's columns; only the 
+    columns present in a row are dumped.
+    """
+    model_config = ConfigDict(extra="ignore", protected_namespaces=())
+
+class SchemaRegistry:
+    """
+    Resolves the model of a table once and remembers it.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config (dict): SchemaRegistryConfig fields ('models', 'reflection').
+        """
+        self.config = SchemaRegistryConfig(**(config or {}))
+        self._models = LazyRegistry("water_bottle.schemas", __package__, {**DEFAULT_MODELS, **self.config.models})
+        self._specs: Optional[Dict[str, Dict[str, Any]]] = None
+        self._resolved: Dict[str, Optional[Type[BaseModel]]] = {}
+
+    def get(self, table_name: str) -> Optional[Type[BaseModel]]:
+        """
+        Returns the model of a table, or None if the table has no schema.
+
+        Args:
+            table_name (str): The table name as it appears in the extracted data.
+        """
+        if table_name not in self._resolved:
+            self._resolved[table_name] = self._resolve(table_name)
+        return self._resolved[table_name]
+
+    def preload(self) -> None:
+        """
+        Resolves every configured and reflected table up front, e.g. in a 
+        freshly started worker process.
+        """
+        for table_name in set(self.config.models) | set(DEFAULT_MODELS) | set(self._reflected()):
+            model_class = self.get(table_name)
+            if model_class is not None:
+                batch_adapter(model_class)
+
+    def _resolve(self, table_name: str) -> Optional[Type[BaseModel]]:
+        if table_name in self._models:
+            return self._models.get(table_name)
+
+        spec = self._reflected().get(table_name)
+        if spec is not None:
+            extra = self.config.reflection.extra
+            return build_model(table_name, json.dumps(spec, sort_keys=True), extra)
+
+        logger.debug(f"No schema registered for table '{table_name}'.")
+        return None
+
+    def _reflected(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Loads the reflected specs once, if reflection is configured.
+        """
+        if self._specs is None:
+            reflection = self.config.reflection
+            self._specs = load_specs(reflection.path) if reflection else {}
+        return self._specs
+
+@lru_cache(maxsize=None)
+def build_model(table_name: str, spec: str, extra: str = "ignore") -> Type[BaseModel]:
+    """
+    Builds a model from a reflected column spec. Cached on the spec itself, 
+    so every transformer in the process reuses the same compiled validator.
+
+    Args:
+        table_name (str): Used for the model name.
+        spec (str): JSON of {column: {"type": ..., "nullable": ...}}.
+        extra (str): The pydantic 'extra' behaviour.
+
+    Returns:
+        Type[BaseModel]: A ReflectedRecord subclass.
+    """
+    fields = {}
+    for i, (column, info) in enumerate(json.loads(spec).items()):
+        kind = SPEC_TYPES.get(info.get("type"), Any)
+        if info.get("nullable", True):
+            kind = Optional[kind]
+        # Columns that are not valid field names keep their name as an alias
+        valid = column.isidentifier() and not column.startswith("_") and not hasattr(BaseModel, column)
+        name = column if valid else f"field_{i}"
+        fields[name] = (kind, Field(default=None, alias=column))
+
+    model_name = "".join(part.capitalize() for part in table_name.split("_")) + "Record"
+    return create_model(model_name, __base__=_base_for(extra), **fields)
+
+@lru_cache(maxsize=None)
+def _base_for(extra: str) -> Type[ReflectedRecord]:
+    """
+    Returns a ReflectedRecord base with the given 'extra' behaviour.
+    """
+    if extra == "ignore":
+        return ReflectedRecord
+    return type(f"ReflectedRecord_{extra}", (ReflectedRecord,), {"model_config": ConfigDict(extra=extra, protected_namespaces=())})
+
+@lru_cache(maxsize=None)
+def batch_adapter(model_class: Type[BaseModel]) -> TypeAdapter:
+    """
+    Returns the cached validator of a whole batch of rows of a model.
+    """
+    return TypeAdapter(List[model_class])
+
+def dump_options(model_class: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Returns the dump arguments for a model: reflected models only dump the 
+    columns a row actually had, under their database names.
+    """
+    if issubclass(model_class, ReflectedRecord):
+        return {"exclude_unset": True, "by_alias": True}
+    return {}
+
+def column_spec(column: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts a SQLAlchemy inspector column into a spec entry.
+    """
+    try:
+        python_type = column["type"].python_type
+    except NotImplementedError:
+        python_type = None
+    names = {kind: name for name, kind in SPEC_TYPES.items() if kind is not Any}
+    # Check subclasses too, e.g. a dialect's own datetime type
+    kind = names.get(python_type)
+    if kind is None and isinstance(python_type, type):
+        kind = next((names[base] for base in python_type.__mro__ if base in names), "any")
+    return {"type": kind or "any", "nullable": bool(column.get("nullable", True))}
+
+def load_specs(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Reads the reflected spec cache; a missing file means no specs.
+    """
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return {}
+
+def reflect_schemas(connection: Any, tables: Iterable[Dict[str, Any]], path: str, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Reflects the column specs of tables missing from the cache file and 
+    writes the file atomically. Runs where a database connection exists, 
+    e.g. the extraction task.
+
+    Args:
+        connection (Connection): An active SQLAlchemy connection.
+        tables (Iterable[dict]): Entries with 'table_name' and optional 'schema'.
+        path (str): The spec cache file.
+        refresh (bool): Reflect every table again, ignoring the cache.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The full spec cache.
+    """
+    from sqlalchemy import inspect
+
+    specs = {} if refresh else load_specs(path)
+    missing = [table for table in tables if table["table_name"] not in specs]
+    if not missing:
+        return specs
+
+    inspector = inspect(connection)
+    for table in missing:
+        columns = inspector.get_columns(table["table_name"], schema=table.get("schema"))
+        specs[table["table_name"]] = {column["name"]: column_spec(column) for column in columns}
+        logger.info(f"Reflected {len(columns)} columns of table '{table['table_name']}'.")
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp = target.with_suffix(target.suffix + ".tmp")
+    with open(temp, "w", encoding="utf-8") as handle:
+        json.dump(specs, handle, indent=2, sort_keys=True)
+    os.replace(temp, target)
+    return specs
@@ -1,3 +1,16 @@
 from .json_transformer import UserRecord, OrderRecord, ProductRecord
+from .chunking import TextChunkConfig
+from .documents import DocumentTableConfig
+from .processes import ProcessPoolConfig
+from .registry import ReflectionConfig, SchemaRegistryConfig
 
-__all__ = ["UserRecord", "OrderRecord", "ProductRecord"]
\ No newline at end of file
+__all__ = [
+    "UserRecord",
+    "OrderRecord",
+    "ProductRecord",
+    "DocumentTableConfig",
+    "TextChunkConfig",
+    "ProcessPoolConfig",
+    "ReflectionConfig",
+    "SchemaRegistryConfig",
+]
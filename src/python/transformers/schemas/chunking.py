@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+
+class TextChunkConfig(BaseModel):
+    """Schema for composing and chunking the text that gets embedded"""
+
+    # Source fields joined, in order, into the 'text' field
+    fields: List[str] = Field(min_length=1)
+    separator: str = "\n"
+    # Prefix each part with its field name, e.g. 'name: Ada'
+    labels: bool = False
+
+    # Chunk length and the tokens repeated between neighbouring chunks
+    max_tokens: int = Field(default=256, gt=0)
+    overlap: int = Field(default=32, ge=0)
+    # A Hugging Face tokenizer name; whitespace tokens when unset
+    tokenizer: Optional[str] = None
+
+    # Copy the parent's other fields onto every chunk
+    keep_source: bool = True
+
+    @model_validator(mode="after")
+    def check_overlap(self):
+        if self.overlap >= self.max_tokens:
+            raise ValueError("'overlap' must be smaller than 'max_tokens'.")
+        return self
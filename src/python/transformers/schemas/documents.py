@@ -0,0 +1,26 @@
+from pydantic import BaseModel, field_validator, model_validator
+from typing import List, Literal, Union
+
+class DocumentTableConfig(BaseModel):
+    """Schema for the document id and bulk operation of one table"""
+
+    # Column(s) the document id is derived from
+    id_columns: List[str] = []
+    # 'columns' uses the key values as the id; 'hash' a digest of them, or 
+    # of the whole row when no id_columns are given
+    id_strategy: Literal["columns", "hash"] = "columns"
+    # 'update' sends partial documents with doc_as_upsert
+    op_type: Literal["index", "create", "update", "delete"] = "index"
+
+    @field_validator("id_columns", mode="before")
+    @classmethod
+    def as_list(cls, value: Union[str, List[str]]):
+        return [value] if isinstance(value, str) else value
+
+    @model_validator(mode="after")
+    def check_id(self):
+        if self.id_strategy == "columns" and not self.id_columns:
+            raise ValueError("id_strategy 'columns' requires 'id_columns'.")
+        if self.op_type in ("update", "delete") and not self.id_columns:
+            raise ValueError(f"op_type '{self.op_type}' requires 'id_columns' to address existing documents.")
+        return self
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+class ProcessPoolConfig(BaseModel):
+    """Schema for running the transformer on a process pool"""
+
+    # 1 keeps the serial, in-process path
+    workers: int = Field(default=1, ge=1)
+    # False yields each batch as soon as its worker finishes
+    ordered: bool = True
+    # Batches submitted but not yet consumed; defaults to twice the workers
+    max_in_flight: Optional[int] = Field(default=None, gt=0)
+    # Platform default when unset
+    start_method: Optional[Literal["fork", "spawn", "forkserver"]] = None
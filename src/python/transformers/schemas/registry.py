@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Dict, Literal, Optional
+
+class ReflectionConfig(BaseModel):
+    """Schema for models built from database reflection"""
+
+    # JSON cache of reflected column specs, shared across runs and tasks
+    path: str = "schemas.json"
+    # How reflected models treat columns missing from the cache
+    extra: Literal["ignore", "forbid", "allow"] = "ignore"
+
+class SchemaRegistryConfig(BaseModel):
+    """Schema for the table to model mapping of the transformer"""
+
+    # Table name to "module:Class" model, e.g. "src.python.transformers.schemas:UserRecord"
+    models: Dict[str, str] = {}
+    reflection: Optional[ReflectionConfig] = None
@@ -0,0 +1,190 @@
+"""
+Builds the 'text' field the embedder reads from configured columns and
+splits long texts into overlapping, token-bounded chunks. Each chunk
+becomes its own document pointing back to its parent, which bounds the
+cost of each embedding call and gives long records several vectors.
+"""
+
+import logging
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+# Module-level Conditional Import
+try:
+    from tokenizers import Tokenizer
+    TOKENIZERS_AVAILABLE = True
+except ImportError:
+    TOKENIZERS_AVAILABLE = False
+
+from .schemas import TextChunkConfig
+from ..fingerprints import fingerprint
+
+logger = logging.getLogger(__name__)
+
+# A whitespace-delimited token
+_WORD = re.compile(r"\S+")
+
+# Parent ids per delete-by-query request; well below the terms query limit
+_DELETE_BATCH = 10000
+
+class TextChunkTransformer:
+    """
+    Turns index-ready actions (e.g. JsonTransformer output) into chunk
+    actions with 'text', 'parent_id', 'chunk_index' and character 'offsets'.
+
+    Writes cannot address the '<parent>#<n>' chunk documents of an earlier 
+    run: a deleted parent keeps all of them, a shorter text keeps the 
+    higher-numbered ones and a record that is now chunked keeps its whole 
+    '<parent>' document. `chunk_counts` records the chunks written per 
+    parent (0 for deletes and records left whole); run delete_chunks() 
+    after the load to remove everything beyond them.
+    """
+
+    def __init__(self, data: Iterable[Dict[str, Any]], config: Dict[str, Any]):
+        """
+        Args:
+            data (Iterable[Dict[str, Any]]): Actions in Elasticsearch format.
+            config (Dict[str, Any]): TextChunkConfig fields.
+
+        Raises:
+            ImportError: If a tokenizer is configured but 'tokenizers' is missing.
+        """
+        self.data = data
+        self.config = TextChunkConfig(**config)
+        self.tokenizer = None
+        if self.config.tokenizer:
+            if not TOKENIZERS_AVAILABLE:
+                raise ImportError(
+                    "tokenizers is not installed. Please install it with 'pip install tokenizers' "
+                    "or leave 'tokenizer' unset to chunk on whitespace."
+                )
+            self.tokenizer = Tokenizer.from_pretrained(self.config.tokenizer)
+        self.chunk_counts: Dict[str, int] = {}
+
+    def __call__(self) -> Iterator[Dict[str, Any]]:
+        for action in self.data:
+            if isinstance(action, (bytes, str)):
+                raise ValueError("TextChunkTransformer needs dict actions; chunk before NDJSON encoding.")
+
+            body_key = "doc" if action.get("_op_type") == "update" else "_source"
+            source = action.get(body_key)
+            # Deletes have no body; they still remove an unchunked parent, 
+            # while its chunks are left to delete_chunks()
+            if source is None:
+                if action.get("_id") is not None:
+                    self.chunk_counts[action["_id"]] = 0
+                yield action
+                continue
+
+            # Records without text to chunk (also whitespace only) stay whole
+            text = self.compose(source)
+            spans = list(self.split(text)) if text else []
+            if not spans:
+                logger.debug(f"No text to chunk for '{action.get('_id')}'; passing it through.")
+                if action.get("_id") is not None:
+                    self.chunk_counts[action["_id"]] = 0
+                yield action
+                continue
+
+            parent_id = action.get("_id") or fingerprint(source)
+            self.chunk_counts[parent_id] = len(spans)
+            base = source if self.config.keep_source else {}
+            for index, (start, end) in enumerate(spans):
+                chunk = dict(action)
+                chunk["_id"] = f"{parent_id}#{index}"
+                chunk[body_key] = {
+                    **base,
+                    "text": text[start:end],
+                    "parent_id": parent_id,
+                    "chunk_index": index,
+                    "offsets": {"start": start, "end": end},
+                }
+                yield chunk
+
+        if self.chunk_counts:
+            logger.warning(
+                f"{len(self.chunk_counts)} changed parent(s) may keep chunks of earlier runs; "
+                "call delete_chunks() after the load."
+            )
+
+    def delete_chunks(self, connection: Any, index: str) -> int:
+        """
+        Deletes what earlier runs left of every parent changed in this one: 
+        chunks from 'chunk_index' = chunk_counts[parent] on (all chunks of 
+        deleted or unchunked parents) and, for chunked parents, the whole 
+        '<parent>' document. Parents with the same count share one 
+        delete-by-query.
+
+        Args:
+            connection (Elasticsearch): The active ES client.
+            index (str): The index (or alias) holding the chunks.
+
+        Returns:
+            int: Number of documents deleted.
+        """
+        by_count: Dict[int, List[str]] = {}
+        for parent_id, count in self.chunk_counts.items():
+            by_count.setdefault(count, []).append(parent_id)
+
+        deleted = 0
+        for count, ids in sorted(by_count.items()):
+            for first in range(0, len(ids), _DELETE_BATCH):
+                parents = ids[first:first + _DELETE_BATCH]
+                response = connection.delete_by_query(
+                    index=index,
+                    query=_stale_query(parents, count),
+                    conflicts="proceed",
+                    refresh=True,
+                )
+                deleted += response.get("deleted", 0)
+        logger.info(f"Deleted {deleted} stale document(s) of {len(self.chunk_counts)} changed parent(s).")
+        return deleted
+
+    def compose(self, source: Dict[str, Any]) -> str:
+        """
+        Joins the configured fields into one text, skipping empty ones.
+        """
+        parts = []
+        for field in self.config.fields:
+            value = source.get(field)
+            if value is None or value == "":
+                continue
+            parts.append(f"{field}: {value}" if self.config.labels else str(value))
+        return self.config.separator.join(parts)
+
+    def spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Returns the (start, end) character span of every token.
+        """
+        if self.tokenizer is not None:
+            encoding = self.tokenizer.encode(text, add_special_tokens=False)
+            return [span for span in encoding.offsets if span[1] > span[0]]
+        return [match.span() for match in _WORD.finditer(text)]
+
+    def split(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the character span of each chunk: windows of max_tokens
+        tokens, each starting `overlap` tokens before the previous one ended.
+        """
+        spans = self.spans(text)
+        if not spans:
+            return
+        size, step = self.config.max_tokens, self.config.max_tokens - self.config.overlap
+        for first in range(0, len(spans), step):
+            window = spans[first:first + size]
+            yield window[0][0], window[-1][1]
+            if first + size >= len(spans):
+                break
+
+def _stale_query(parents: List[str], count: int) -> Dict[str, Any]:
+    """
+    Matches the chunks of `parents` numbered `count` and up and, once 
+    they are chunked (count > 0), their whole unchunked documents.
+    """
+    chunks = {"bool": {"filter": [
+        {"terms": {"parent_id": parents}},
+        {"range": {"chunk_index": {"gte": count}}},
+    ]}}
+    if count == 0:
+        return chunks
+    return {"bool": {"should": [chunks, {"ids": {"values": parents}}], "minimum_should_match": 1}}
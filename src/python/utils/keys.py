@@ -0,0 +1,39 @@
+"""
+Provides helpers for deriving stable document keys from row values.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List
+
+def compose_key(row: Dict[str, Any], columns: List[str]) -> str:
+    """
+    Builds a deterministic string key from one or more key columns.
+
+    Args:
+        row (Dict[str, Any]): The row holding the key columns.
+        columns (List[str]): Key column names, in order.
+
+    Returns:
+        str: The plain value for a single column, or a JSON array of the 
+        values for composite keys.
+
+    Raises:
+        KeyError: If a key column is missing from the row.
+    """
+    if len(columns) == 1:
+        return str(row[columns[0]])
+    return json.dumps([row[column] for column in columns], default=str, separators=(",", ":"))
+
+
+def hash_key(key: str) -> str:
+    """
+    Digests a composed key into a fixed-length hex id.
+
+    Args:
+        key (str): A key from compose_key().
+
+    Returns:
+        str: A 32 character hex digest.
+    """
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
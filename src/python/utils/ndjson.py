@@ -0,0 +1,63 @@
+"""
+Encodes bulk actions as ready-to-send NDJSON lines.
+
+Uses orjson when it is installed and the standard library otherwise. Both
+encode datetime, date, time and UUID like their isoformat()/str() forms and
+Decimal as a float, so cells need no cleaning before encoding.
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict
+
+# Module-level Conditional Import
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Bulk metadata keys that go on the action line rather than into the source
+META_FIELDS = ("_id", "_routing", "_version", "_version_type", "_if_seq_no", "_if_primary_term", "_pipeline")
+
+def _default(value: Any) -> Any:
+    """
+    Encodes the types neither encoder handles, matching BaseTransformer.clean_value().
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+def dumps(value: Any) -> bytes:
+    """
+    Encodes one JSON document without whitespace.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=_default)
+    return json.dumps(value, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def encode_action(action: Dict[str, Any]) -> bytes:
+    """
+    Turns a bulk action dict ('_op_type', metadata, '_source') into its
+    action line plus, except for deletes, its source line. '_index' is left
+    out: the loader sends the target index with the request.
+
+    Args:
+        action (Dict[str, Any]): An action as yielded by the transformers.
+
+    Returns:
+        bytes: One or two newline-terminated NDJSON lines.
+    """
+    op_type = action.get("_op_type", "index")
+    meta = {key: action[key] for key in META_FIELDS if key in action}
+    line = dumps({op_type: meta}) + b"\n"
+    if op_type == "delete":
+        return line
+    if op_type == "update":
+        source = {key: action[key] for key in ("doc", "doc_as_upsert", "script", "upsert") if key in action}
+    else:
+        source = action["_source"]
+    return line + dumps(source) + b"\n"
@@ -0,0 +1,128 @@
+"""
+A registry of lazily imported implementations used by the factories.
+
+Implementations are registered as "module:attribute" strings and imported
+only when first requested, so importing a factory stays cheap (the Airflow
+scheduler re-parses DAG files constantly). Third-party packages can add
+implementations through the `water_bottle.<group>` entry-point group.
+"""
+
+import importlib
+import logging
+import threading
+from importlib.metadata import entry_points
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+class LazyRegistry:
+    """
+    Maps type identifiers to implementations that are imported on first use.
+    """
+
+    def __init__(self, group: str, package: Optional[str] = None, builtins: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            group (str): Entry-point group searched for unknown names.
+            package (str): Anchor for relative targets such as ".rdbms:RDBMSConnector".
+            builtins (dict): Name to "module:attribute" target mapping.
+        """
+        self.group = group
+        self.package = package
+        self._targets: Dict[str, Union[str, Any]] = {}
+        self._loaded: Dict[str, Any] = {}
+        self._discovered = False
+        self._lock = threading.Lock()
+        for name, target in (builtins or {}).items():
+            self.register(name, target)
+
+    def register(self, name: str, target: Union[str, Any]) -> None:
+        """
+        Registers an implementation under a (case-insensitive) name.
+
+        Args:
+            name (str): Type identifier used by the factory.
+            target (str | type): A "module:attribute" string or the object itself.
+        """
+        name = name.lower().strip()
+        with self._lock:
+            self._targets[name] = target
+            self._loaded.pop(name, None)
+
+    def names(self) -> List[str]:
+        """
+        Returns:
+            List[str]: Every registered name, including entry points.
+        """
+        self._discover()
+        return sorted(self._targets)
+
+    def __contains__(self, name: str) -> bool:
+        name = name.lower().strip()
+        if name not in self._targets:
+            self._discover()
+        return name in self._targets
+
+    def get(self, name: str) -> Any:
+        """
+        Returns the implementation registered under `name`, importing it
+        on first use.
+
+        Raises:
+            KeyError: If nothing is registered under `name`.
+        """
+        name = name.lower().strip()
+        if name in self._loaded:
+            return self._loaded[name]
+        if name not in self._targets:
+            self._discover()
+        if name not in self._targets:
+            raise KeyError(name)
+
+        with self._lock:
+            if name not in self._loaded:
+                self._loaded[name] = self._resolve(self._targets[name])
+            return self._loaded[name]
+
+    def _resolve(self, target: Union[str, Any]) -> Any:
+        """
+        Imports a "module:attribute" target; other objects are returned as-is.
+        """
+        if not isinstance(target, str):
+            return target
+        module_name, _, attribute = target.partition(":")
+        logger.debug(f"Importing '{target}' for registry '{self.group}'.")
+        module = importlib.import_module(module_name, self.package)
+        return getattr(module, attribute) if attribute else module
+
+    def _discover(self) -> None:
+        """
+        Adds the entry points of `group` once. Built-in names take precedence.
+        """
+        if self._discovered:
+            return
+        with self._lock:
+            if self._discovered:
+                return
+            for entry_point in entry_points(group=self.group):
+                self._targets.setdefault(entry_point.name.lower(), entry_point.value)
+            self._discovered = True
+
+def lazy_exports(package: str, exports: Dict[str, str]):
+    """
+    Builds a module-level __getattr__ that imports a package's public names
+    from their submodules on first access.
+
+    Args:
+        package (str): The package name (`__name__` of its __init__).
+        exports (dict): Public name to relative submodule, e.g. {"RDBMSConnector": ".rdbms"}.
+
+    Returns:
+        Callable: The function to assign to the package's __getattr__.
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(importlib.import_module(exports[name], package), name)
+
+    return __getattr__
@@ -1,6 +1,11 @@
 import unittest
-from unittest.mock import MagicMock, patch
-from src.python.connectors.elasticsearch import ElasticsearchConnector
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.python.connectors import elasticsearch as es_module
+from src.python.connectors.elasticsearch import (
+    AsyncElasticsearchConnector,
+    ElasticsearchConnector,
+    close_async_clients,
+)
 
 class TestElasticsearchConnector(unittest.TestCase):
 
@@ -12,6 +17,11 @@ class TestElasticsearchConnector(unittest.TestCase):
             "port": 9200,
             "verify_certs": False
         }
+        # Clients are cached per config, so every test starts empty
+        es_module._CLIENTS.clear()
+
+    def tearDown(self):
+        es_module._CLIENTS.clear()
 
     @patch("src.python.connectors.elasticsearch.Elasticsearch")
     def test_connect_success(self, mock_es_class):
@@ -60,5 +70,89 @@ class TestElasticsearchConnector(unittest.TestCase):
 
         self.assertEqual(client, mock_instance)
 
+    @patch("src.python.connectors.elasticsearch.Elasticsearch")
+    def test_client_is_cached_per_config(self, mock_es_class):
+        """Test that the same config reuses one client and pings only once."""
+        mock_es_class.return_value.ping.return_value = True
+
+        first = ElasticsearchConnector(self.valid_config)()
+        second = ElasticsearchConnector(self.valid_config)()
+        other = ElasticsearchConnector(dict(self.valid_config, http_compress=True))()
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_es_class.call_count, 2)
+        self.assertEqual(mock_es_class.return_value.ping.call_count, 2)
+        self.assertIsNotNone(other)
+
+    @patch("src.python.connectors.elasticsearch.Elasticsearch")
+    def test_failed_client_is_not_cached(self, mock_es_class):
+        """Test that a client whose ping failed is retried on the next call."""
+        mock_es_class.return_value.ping.side_effect = [False, True]
+
+        with self.assertRaises(ConnectionError):
+            ElasticsearchConnector(self.valid_config).connect()
+        ElasticsearchConnector(self.valid_config).connect()
+
+        self.assertEqual(mock_es_class.call_count, 2)
+
+    @patch("src.python.connectors.elasticsearch.Elasticsearch")
+    def test_transport_options(self, mock_es_class):
+        """Test that multi-node and transport settings reach the client."""
+        mock_es_class.return_value.ping.return_value = True
+        config = dict(
+            self.valid_config,
+            hosts=["http://es-2:9200", "http://es-3:9200"],
+            connections_per_node=32,
+            http_compress=True,
+            request_timeout=60,
+            retry_on_timeout=True,
+            sniff_on_node_failure=True
+        )
+
+        ElasticsearchConnector(config).connect()
+
+        kwargs = mock_es_class.call_args[1]
+        self.assertEqual(kwargs["hosts"], ["http://localhost:9200", "http://es-2:9200", "http://es-3:9200"])
+        self.assertEqual(kwargs["connections_per_node"], 32)
+        self.assertTrue(kwargs["http_compress"])
+        self.assertEqual(kwargs["request_timeout"], 60)
+        self.assertTrue(kwargs["retry_on_timeout"])
+        self.assertTrue(kwargs["sniff_on_node_failure"])
+
+class TestAsyncElasticsearchConnector(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.valid_config = {"schema": "http", "host": "localhost", "port": 9200, "verify_certs": False}
+
+    async def asyncTearDown(self):
+        await close_async_clients()
+
+    @patch("src.python.connectors.elasticsearch.AsyncElasticsearch")
+    async def test_client_shared_within_loop(self, mock_es_class):
+        """Test that connectors on the same loop share one pinged client."""
+        mock_es_class.return_value.ping = AsyncMock(return_value=True)
+        mock_es_class.return_value.close = AsyncMock()
+
+        first = await AsyncElasticsearchConnector(self.valid_config)()
+        second = await AsyncElasticsearchConnector(self.valid_config)()
+
+        self.assertIs(first, second)
+        mock_es_class.assert_called_once()
+        self.assertEqual(mock_es_class.call_args[1]["hosts"], ["http://localhost:9200"])
+
+        await close_async_clients()
+        first.close.assert_awaited_once()
+
+    @patch("src.python.connectors.elasticsearch.AsyncElasticsearch")
+    async def test_failed_ping_closes_client(self, mock_es_class):
+        """Test that a failed ping raises and releases the client."""
+        mock_es_class.return_value.ping = AsyncMock(return_value=False)
+        mock_es_class.return_value.close = AsyncMock()
+
+        with self.assertRaises(ConnectionError):
+            await AsyncElasticsearchConnector(self.valid_config).connect()
+
+        mock_es_class.return_value.close.assert_awaited_once()
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
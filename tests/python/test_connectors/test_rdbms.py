@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import MagicMock, patch
-from src.python.connectors.rdbms import RDBMSConnector
+from src.python.connectors import rdbms
+from src.python.connectors.rdbms import RDBMSConnector, dispose_engines, pool_capacity
 
 class TestRDBMSConnector(unittest.TestCase):
 
@@ -14,10 +15,15 @@ class TestRDBMSConnector(unittest.TestCase):
             "port": 5432,
             "database": "test_db"
         }
+        # Every test starts with an empty engine registry
+        rdbms._ENGINES.clear()
+
+    def tearDown(self):
+        rdbms._ENGINES.clear()
 
     @patch("src.python.connectors.rdbms.create_engine")
     def test_connect_success(self, mock_create_engine):
-        """Test successful DB connection and verification."""
+        """Test that calling the connector checks out one pooled connection."""
         # 1. Setup the Mocks
         mock_engine = MagicMock()
         mock_connection = MagicMock()
@@ -28,37 +34,98 @@ class TestRDBMSConnector(unittest.TestCase):
         # This tells the mock: "Every time .connect() is called, 
         # return the mock_connection object."
         mock_engine.connect.return_value = mock_connection
-        
-        # This handles the 'with' block (the handshake)
-        # It says: "The object inside the 'with' block is also our mock_connection"
-        mock_connection.__enter__.return_value = mock_connection
 
         # 2. Run code
         connector = RDBMSConnector(self.config)
-        connector.connect()
+        connection = connector()
 
         # 3. Assertions
-        # Now this will pass because 'conn' inside the with block IS mock_connection
-        mock_connection.execute.assert_called()
+        # A single checkout, no throwaway 'SELECT 1' connection
+        self.assertIs(connection, mock_connection)
+        mock_engine.connect.assert_called_once()
+        mock_connection.execute.assert_not_called()
         self.assertIsNotNone(connector._connection)
-        print("\nTest Passed: RDBMS engine created and 'SELECT 1' executed!")
+
+        # Pool settings reach create_engine
+        kwargs = mock_create_engine.call_args[1]
+        self.assertEqual(kwargs["pool_size"], 5)
+        self.assertTrue(kwargs["pool_pre_ping"])
+        print("\nTest Passed: RDBMS engine created and connection checked out!")
 
     @patch("src.python.connectors.rdbms.create_engine")
     def test_connect_failure(self, mock_create_engine):
-        """Test that connector raises error if SELECT 1 fails."""
-        # Setup engine to return a connection that crashes on execute
+        """Test that connector raises error if no connection can be checked out."""
         mock_engine = MagicMock()
-        mock_connection = MagicMock()
-        mock_connection.execute.side_effect = Exception("DB Timeout")
-        
-        mock_engine.connect.return_value.__enter__.return_value = mock_connection
+        mock_engine.connect.side_effect = Exception("DB Timeout")
         mock_create_engine.return_value = mock_engine
 
         connector = RDBMSConnector(self.config)
         
         with self.assertRaises(Exception):
-            connector.connect()
+            connector()
         print("Test Passed: Correctly caught RDBMS connection failure.")
 
+    @patch("src.python.connectors.rdbms.create_engine")
+    def test_engine_is_shared_by_url(self, mock_create_engine):
+        """Test that connectors for the same URL and pool options reuse one engine."""
+        mock_create_engine.side_effect = lambda *args, **kwargs: MagicMock()
+        first = RDBMSConnector(self.config)
+        second = RDBMSConnector(self.config)
+        other = RDBMSConnector(dict(self.config, database="other_db"))
+
+        for connector in (first, second, other):
+            connector.connect()
+
+        self.assertIs(first._engine, second._engine)
+        self.assertIsNot(first._engine, other._engine)
+        self.assertEqual(mock_create_engine.call_count, 2)
+
+    @patch("src.python.connectors.rdbms.create_engine")
+    def test_pool_options_are_part_of_the_engine_key(self, mock_create_engine):
+        """Test that a different pool size gets its own engine instead of the first caller's."""
+        mock_create_engine.side_effect = lambda *args, **kwargs: MagicMock()
+        first = RDBMSConnector(self.config)
+        first.connect()
+
+        second = RDBMSConnector(dict(self.config, pool_size=20))
+        with self.assertLogs("src.python.connectors.rdbms", level="WARNING"):
+            second.connect()
+
+        self.assertIsNot(first._engine, second._engine)
+        self.assertEqual(mock_create_engine.call_args.kwargs["pool_size"], 20)
+
+    @patch("src.python.connectors.rdbms.create_engine")
+    def test_pool_capacity_from_the_configured_options(self, mock_create_engine):
+        """Test that the capacity is pool_size + max_overflow and a pool_size of 0 is unbounded."""
+        mock_create_engine.side_effect = lambda *args, **kwargs: MagicMock()
+        bounded = RDBMSConnector(dict(self.config, pool_size=4, max_overflow=2))
+        unbounded = RDBMSConnector(dict(self.config, database="other_db", pool_size=0))
+        bounded.connect()
+        unbounded.connect()
+
+        self.assertEqual(pool_capacity(bounded._engine), 6)
+        self.assertIsNone(pool_capacity(unbounded._engine))
+        self.assertIsNone(pool_capacity(MagicMock()))
+
+    @patch("src.python.connectors.rdbms.create_engine")
+    def test_connection_context_returns_to_pool(self, mock_create_engine):
+        """Test that the context manager closes (returns) the connection."""
+        mock_engine = mock_create_engine.return_value
+        pooled = mock_engine.connect.return_value.__enter__.return_value
+
+        connector = RDBMSConnector(self.config)
+        with connector.connection() as conn:
+            self.assertIs(conn, pooled)
+
+        mock_engine.connect.return_value.__exit__.assert_called_once()
+
+    @patch("src.python.connectors.rdbms.create_engine")
+    def test_dispose_engines(self, mock_create_engine):
+        RDBMSConnector(self.config).connect()
+        dispose_engines()
+
+        mock_create_engine.return_value.dispose.assert_called_once()
+        self.assertEqual(rdbms._ENGINES, {})
+
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,66 @@
+import threading
+import unittest
+from src.python.extractors.parallel import merge_streams
+
+class TestMergeStreams(unittest.TestCase):
+
+    def test_merges_all_items(self):
+        """Every producer's items arrive, in order within each producer."""
+        tasks = [(name, lambda name=name: iter([f"{name}1", f"{name}2", f"{name}3"])) for name in "abc"]
+
+        merged = list(merge_streams(tasks, max_workers=3, queue_size=1))
+
+        self.assertEqual(len(merged), 9)
+        for name in "abc":
+            self.assertEqual([item for label, item in merged if label == name], [f"{name}1", f"{name}2", f"{name}3"])
+
+    def test_producers_run_concurrently(self):
+        """Two producers waiting on each other only finish if they overlap."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def task():
+            barrier.wait()
+            yield "done"
+
+        merged = list(merge_streams([("a", task), ("b", task)], max_workers=2))
+        self.assertEqual(sorted(label for label, _ in merged), ["a", "b"])
+
+    def test_error_is_reraised(self):
+        def broken():
+            yield 1
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            list(merge_streams([("a", broken)], max_workers=1))
+
+    def test_error_handler_can_skip(self):
+        def broken():
+            raise RuntimeError("boom")
+            yield
+
+        failed = []
+        tasks = [("bad", broken), ("good", lambda: iter([1]))]
+        merged = list(merge_streams(tasks, max_workers=2, on_error=lambda label, e: failed.append(label)))
+
+        self.assertEqual(merged, [("good", 1)])
+        self.assertEqual(failed, ["bad"])
+
+    def test_early_close_releases_workers(self):
+        """Closing the consumer early must not leave producers blocked forever."""
+        closed = threading.Event()
+
+        def endless():
+            try:
+                while True:
+                    yield 1
+            finally:
+                closed.set()
+
+        stream = merge_streams([("a", endless)], max_workers=1, queue_size=1)
+        next(stream)
+        stream.close()
+
+        self.assertTrue(closed.wait(timeout=5))
+
+if __name__ == "__main__":
+    unittest.main()
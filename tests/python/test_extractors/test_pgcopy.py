@@ -0,0 +1,109 @@
+import unittest
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from uuid import UUID
+from unittest.mock import MagicMock
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.dialects.sqlite import dialect as SQLiteDialect
+from src.python.extractors.pgcopy import copy_batches, decode_line, supports_copy
+from src.python.extractors.rdbms import RDBMSExtractor
+
+class TestPgCopy(unittest.TestCase):
+
+    def setUp(self):
+        """Fake a psycopg2 connection whose COPY emits three text-format rows."""
+        self.copy_output = (
+            b"1\tAlice\t19.99\t2026-01-01 10:00:00\tt\n"
+            b"2\ttab\\there\t\\N\t2026-01-02 10:00:00\tf\n"
+            b"3\t\\\\N\t0.5\t\\N\t\\N\n"
+        )
+        self.cursor = MagicMock()
+        self.cursor.mogrify.side_effect = lambda sql, params: (sql % params).encode()
+        self.cursor.description = [("id", 23), ("name", 25), ("price", 1700), ("created_at", 1114), ("active", 16)]
+        self.cursor.copy_expert.side_effect = lambda sql, sink: sink.write(self.copy_output)
+
+        self.connection = MagicMock()
+        self.connection.dialect = PGDialect_psycopg2()
+        self.connection.connection.cursor.return_value = self.cursor
+
+    def test_decode_line_types_and_escapes(self):
+        converters = [int, None]
+        self.assertEqual(decode_line("7\\tline\\nbreak", [None]), ["7\tline\nbreak"])
+        self.assertEqual(decode_line("7\t\\N", converters), [7, None])
+        # A literal backslash-N string is escaped by COPY and must not become NULL
+        self.assertEqual(decode_line("7\t\\\\N", converters), [7, "\\N"])
+
+    def test_copy_batches(self):
+        batches = list(copy_batches(self.connection, "SELECT * FROM public.products", {}, batch_size=2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        first, second, third = batches[0] + batches[1]
+        self.assertEqual(first, {
+            "id": 1, "name": "Alice", "price": Decimal("19.99"),
+            "created_at": datetime(2026, 1, 1, 10, 0), "active": True
+        })
+        self.assertEqual(second["name"], "tab\there")
+        self.assertIsNone(second["price"])
+        self.assertEqual(third["name"], "\\N")
+        self.cursor.copy_expert.assert_called_once()
+        self.assertEqual(self.cursor.copy_expert.call_args[0][0], "COPY (SELECT * FROM public.products) TO STDOUT")
+
+    def test_copy_types_match_the_cursor_path(self):
+        """Arrays, bytea, time, interval, infinity and registered casters decode like psycopg2."""
+        self.copy_output = (
+            b"{1,2,NULL}\t{\"a b\",c}\t\\\\x4142\t10:30:00\t1 day 02:00:00\tinfinity\t"
+            b"00000000-0000-0000-0000-000000000001\tsad\n"
+        )
+        self.cursor.description = [
+            ("ids", 1007), ("tags", 1009), ("blob", 17), ("at", 1083),
+            ("took", 1186), ("until", 1082), ("uid", 2950), ("mood", 16999),
+        ]
+        # SQLAlchemy registers the uuid caster on the connection
+        self.cursor.connection.string_types = {2950: lambda raw, cursor: UUID(raw)}
+
+        row = list(copy_batches(self.connection, "SELECT * FROM t", {}, batch_size=10))[0][0]
+
+        self.assertEqual(row["ids"], [1, 2, None])
+        self.assertEqual(row["tags"], ["a b", "c"])
+        self.assertEqual(bytes(row["blob"]), b"AB")
+        self.assertEqual(row["at"], time(10, 30))
+        self.assertEqual(row["took"], timedelta(days=1, hours=2))
+        self.assertEqual(row["until"], date.max)
+        self.assertEqual(row["uid"], UUID(int=1))
+        # Types without a typecaster are strings on both paths
+        self.assertEqual(row["mood"], "sad")
+
+    def test_copy_inlines_bind_parameters(self):
+        list(copy_batches(self.connection, "SELECT * FROM t WHERE id > :lower", {"lower": 5}, batch_size=10))
+        self.assertEqual(self.cursor.copy_expert.call_args[0][0], "COPY (SELECT * FROM t WHERE id > 5) TO STDOUT")
+
+    def test_copy_error_is_raised(self):
+        self.cursor.copy_expert.side_effect = Exception("permission denied")
+        with self.assertRaises(Exception):
+            list(copy_batches(self.connection, "SELECT * FROM t", {}, batch_size=10))
+
+    def test_extractor_uses_copy_for_postgres(self):
+        config = {
+            "read_method": "copy",
+            "tables": [{"table_name": "products", "schema": "public", "columns": None}]
+        }
+        extractor = RDBMSExtractor(self.connection, config)
+        results = extractor.extract()
+
+        self.assertTrue(extractor.use_copy)
+        self.assertEqual(len(results["products"]), 3)
+        self.connection.execute.assert_not_called()
+
+    def test_extractor_falls_back_for_other_dialects(self):
+        self.connection.dialect = SQLiteDialect()
+        self.assertFalse(supports_copy(self.connection))
+
+        config = {"read_method": "copy", "tables": [{"table_name": "products", "schema": "main", "columns": None}]}
+        self.connection.execute.return_value.mappings.return_value = [{"id": 1}]
+
+        extractor = RDBMSExtractor(self.connection, config)
+        self.assertEqual(extractor.extract(), {"products": [{"id": 1}]})
+        self.cursor.copy_expert.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,9 @@
+import os
+import tempfile
+import threading
 import unittest
-from unittest.mock import MagicMock
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
 from src.python.extractors.rdbms import RDBMSExtractor
 
 class TestRDBMSExtractor(unittest.TestCase):
@@ -62,5 +66,371 @@ class TestRDBMSExtractor(unittest.TestCase):
             extractor.extract()
         print("Test Passed: Correctly handled database execution error.")
 
+    def test_stream_yields_batches(self):
+        """Test that streaming mode yields fixed-size batches from a server-side cursor."""
+        self.config["stream"] = True
+        self.config["tables"][0]["batch_size"] = 1
+
+        streaming_connection = self.mock_connection
+        mock_result_proxy = MagicMock()
+        mock_result_proxy.mappings.return_value.partitions.return_value = iter(
+            [[self.sample_users[0]], [self.sample_users[1]]]
+        )
+        streaming_connection.execute.return_value = mock_result_proxy
+
+        extractor = RDBMSExtractor(self.mock_connection, self.config)
+        batches = extractor()
+
+        # Nothing is executed until the generator is consumed
+        streaming_connection.execute.assert_not_called()
+
+        batches = list(batches)
+        self.assertEqual(batches, [("users", [self.sample_users[0]]), ("users", [self.sample_users[1]])])
+        # The streaming options only apply to this statement, not the caller's connection
+        self.assertEqual(
+            streaming_connection.execute.call_args.kwargs["execution_options"],
+            {"stream_results": True, "yield_per": 1}
+        )
+        self.mock_connection.execution_options.assert_not_called()
+        mock_result_proxy.mappings.return_value.partitions.assert_called_once_with(1)
+        print("Test Passed: Streaming extraction yielded row batches.")
+
+    def test_incremental_keyset_pages(self):
+        """Test that incremental mode pages by keyset and stages the mark without committing."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.config["watermarks"] = {"backend": "file", "path": os.path.join(tmp_dir, "wm.json")}
+            self.config["tables"][0].update(
+                extraction_mode="incremental",
+                incremental_column="updated_at",
+                primary_key="id",
+                batch_size=2
+            )
+            rows = [dict(user, updated_at=f"2026-01-0{user['id']}") for user in self.sample_users]
+
+            undated = [{"id": 3, "name": "Eve", "email": "eve@example.com", "updated_at": None}]
+
+            first_page, last_page, null_page = MagicMock(), MagicMock(), MagicMock()
+            first_page.mappings.return_value = rows
+            last_page.mappings.return_value = []
+            null_page.mappings.return_value = undated
+            self.mock_connection.execute.side_effect = [first_page, last_page, null_page]
+
+            extractor = RDBMSExtractor(self.mock_connection, self.config)
+            results = extractor.extract()
+
+            # The initial run also reads rows without an incremental value
+            self.assertEqual(results["users"], rows + undated)
+
+            first_call, second_call, null_call = self.mock_connection.execute.call_args_list
+            self.assertEqual(
+                str(first_call[0][0]),
+                "SELECT id, name, email, updated_at FROM public.users "
+                "WHERE updated_at IS NOT NULL ORDER BY updated_at, id LIMIT :batch_size"
+            )
+            self.assertIn("WHERE updated_at > :last_value OR (updated_at = :last_value AND id > :last_key)",
+                          str(second_call[0][0]))
+            self.assertEqual(second_call[0][1], {"batch_size": 2, "last_value": "2026-01-02", "last_key": 2})
+            self.assertEqual(
+                str(null_call[0][0]),
+                "SELECT id, name, email, updated_at FROM public.users "
+                "WHERE updated_at IS NULL ORDER BY id LIMIT :batch_size"
+            )
+
+            # Nothing is committed until the load succeeds
+            self.assertIsNone(extractor.watermarks.get("public.users"))
+            extractor.commit_watermarks()
+            self.assertEqual(extractor.watermarks.get("public.users"), {"value": "2026-01-02", "key": 2})
+
+    def test_incremental_logs_rows_without_a_mark(self):
+        """Test that later incremental runs count and log rows with a NULL incremental value."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.config["watermarks"] = {"backend": "file", "path": os.path.join(tmp_dir, "wm.json")}
+            self.config["tables"][0].update(
+                extraction_mode="incremental", incremental_column="updated_at", primary_key="id"
+            )
+            extractor = RDBMSExtractor(self.mock_connection, self.config)
+            extractor.watermarks.stage("public.users", {"value": "2026-01-02", "key": 2})
+            extractor.commit_watermarks()
+
+            page, count = MagicMock(), MagicMock()
+            page.mappings.return_value = []
+            count.scalar.return_value = 4
+            self.mock_connection.execute.side_effect = [page, count]
+
+            with self.assertLogs("src.python.extractors.rdbms", level="WARNING") as logs:
+                self.assertEqual(extractor.extract(), {"users": []})
+
+            self.assertIn("WHERE updated_at IS NULL", str(self.mock_connection.execute.call_args_list[1][0][0]))
+            self.assertIn("4 row(s) of public.users have a NULL updated_at", logs.output[0])
+
+    def test_incremental_requires_watermarks(self):
+        """Test that incremental tables are rejected without a watermark store."""
+        self.config["tables"][0].update(
+            extraction_mode="incremental",
+            incremental_column="updated_at",
+            primary_key="id"
+        )
+        with self.assertRaises(Exception):
+            RDBMSExtractor(self.mock_connection, self.config)
+
+    def test_parallel_extract_isolates_errors(self):
+        """Test that tables run on pooled connections and a failed table is skipped."""
+        self.config["tables"].append({"table_name": "missing", "schema": "public", "columns": None})
+        self.config.update(max_workers=2, on_error="skip")
+
+        def execute(query, *args):
+            if "missing" in str(query):
+                raise Exception("Table not found")
+            result_proxy = MagicMock()
+            result_proxy.mappings.return_value = self.sample_users
+            return result_proxy
+
+        pooled_connection = MagicMock()
+        pooled_connection.execute.side_effect = execute
+        self.mock_connection.engine.connect.return_value.__enter__.return_value = pooled_connection
+
+        extractor = RDBMSExtractor(self.mock_connection, self.config)
+        results = extractor.extract()
+
+        self.assertEqual(results, {"users": self.sample_users})
+        self.assertEqual(self.mock_connection.engine.connect.call_count, 2)
+        # The caller's own connection is not shared with the workers
+        self.mock_connection.execute.assert_not_called()
+        self.assertEqual(extractor.stats["users"]["rows"], 2)
+        self.assertNotIn("missing", extractor.stats)
+
+    def test_parallel_extract_drops_a_table_that_fails_partway(self):
+        """Test that a skipped table keeps none of the batches it read before failing."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.config["watermarks"] = {"backend": "file", "path": os.path.join(tmp_dir, "wm.json")}
+            self.config["tables"].append({
+                "table_name": "orders", "schema": "public", "columns": None, "batch_size": 1,
+                "extraction_mode": "incremental", "incremental_column": "updated_at", "primary_key": "id",
+            })
+            self.config.update(max_workers=2, on_error="skip")
+
+            def execute(query, *args, **kwargs):
+                result_proxy = MagicMock()
+                if "orders" not in str(query):
+                    result_proxy.mappings.return_value = self.sample_users
+                elif "last_key" in str(query):
+                    raise Exception("Connection lost")
+                else:
+                    # A full first page, so a second one is requested
+                    result_proxy.mappings.return_value = [{"id": 1, "updated_at": "2026-01-01"}]
+                return result_proxy
+
+            pooled_connection = MagicMock()
+            pooled_connection.execute.side_effect = execute
+            self.mock_connection.engine.connect.return_value.__enter__.return_value = pooled_connection
+
+            with self.assertLogs("src.python.extractors.rdbms", level="ERROR"):
+                results = RDBMSExtractor(self.mock_connection, self.config).extract()
+
+            self.assertEqual(results, {"users": self.sample_users})
+
+    def test_parallel_extract_raises_by_default(self):
+        """Test that a failed table aborts a parallel run unless 'skip' is set."""
+        self.config["max_workers"] = 2
+        pooled_connection = MagicMock()
+        pooled_connection.execute.side_effect = Exception("Table not found")
+        self.mock_connection.engine.connect.return_value.__enter__.return_value = pooled_connection
+
+        extractor = RDBMSExtractor(self.mock_connection, self.config)
+        with self.assertRaises(Exception):
+            extractor.extract()
+
+    def test_range_partitioned_read(self):
+        """Test that a partitioned table is split into disjoint ranges read on pooled connections."""
+        self.config["tables"][0].update(partition_column="id", num_partitions=3)
+        self.mock_connection.execute.return_value.one.return_value = (1, 100)
+
+        pooled_connection = MagicMock()
+        self.mock_connection.engine.connect.return_value.__enter__.return_value = pooled_connection
+        streaming_connection = pooled_connection
+        streaming_connection.execute.return_value.mappings.return_value.partitions.side_effect = (
+            lambda size: iter([[self.sample_users[0]]])
+        )
+
+        extractor = RDBMSExtractor(self.mock_connection, self.config)
+        results = extractor.extract()
+
+        self.assertEqual(len(results["users"]), 3)
+        self.assertEqual(
+            str(self.mock_connection.execute.call_args[0][0]),
+            "SELECT MIN(id), MAX(id) FROM public.users"
+        )
+
+        partition_calls = sorted(
+            (str(call[0][0]), tuple(sorted(call[0][1].items())))
+            for call in streaming_connection.execute.call_args_list
+        )
+        self.assertEqual(partition_calls, [
+            ("SELECT id, name, email FROM public.users WHERE id <= :upper OR id IS NULL", (("upper", 34),)),
+            ("SELECT id, name, email FROM public.users WHERE id > :lower AND id <= :upper", (("lower", 34), ("upper", 67))),
+            ("SELECT id, name, email FROM public.users WHERE id > :lower AND id <= :upper", (("lower", 67), ("upper", 100))),
+        ])
+
+    @patch("src.python.extractors.rdbms.pool_capacity", return_value=1)
+    def test_partitions_fall_back_to_the_callers_connection_when_the_pool_is_full(self, _):
+        """Test that partitions are read on the table's connection if the pool has none to spare."""
+        self.config["tables"][0].update(partition_column="id", num_partitions=3)
+        self.mock_connection.execute.return_value.one.return_value = (1, 100)
+        streaming_connection = self.mock_connection
+        streaming_connection.execute.return_value.mappings.return_value.partitions.side_effect = (
+            lambda size: iter([[self.sample_users[0]]])
+        )
+
+        extractor = RDBMSExtractor(self.mock_connection, self.config)
+        with self.assertLogs(level="WARNING"):
+            results = extractor.extract()
+
+        self.assertEqual(len(results["users"]), 3)
+        self.mock_connection.engine.connect.assert_not_called()
+
+    def test_workers_are_capped_at_the_pool_capacity(self):
+        """Test that table workers leave the caller's connection in the pool's budget."""
+        self.config.update(max_workers=8)
+        extractor = RDBMSExtractor(self.mock_connection, self.config)
+
+        with patch("src.python.extractors.rdbms.pool_capacity", return_value=3):
+            extractor._start_budget()
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(extractor._table_workers(), 2)
+
+        # An unbounded pool never caps the workers
+        with patch("src.python.extractors.rdbms.pool_capacity", return_value=None):
+            extractor._start_budget()
+        self.assertEqual(extractor._table_workers(), 8)
+
+    @patch("src.python.extractors.rdbms.pool_capacity", return_value=4)
+    def test_parallel_partitioned_tables_share_one_connection_budget(self, _):
+        """Test that tables and their partitions never check out more than the pool holds."""
+        self.config["tables"][0].update(partition_column="id", num_partitions=3)
+        self.config["tables"].append(dict(self.config["tables"][0], table_name="orders"))
+        self.config["max_workers"] = 4
+
+        pooled_connection = MagicMock()
+        pooled_connection.execute.return_value.one.return_value = (1, 100)
+        pooled_connection.execute.return_value.mappings.return_value.partitions.side_effect = (
+            lambda size: iter([[self.sample_users[0]]])
+        )
+        lock, active, peak = threading.Lock(), [0], [0]
+
+        @contextmanager
+        def connect():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            try:
+                yield pooled_connection
+            finally:
+                with lock:
+                    active[0] -= 1
+
+        self.mock_connection.engine.connect.side_effect = connect
+
+        with self.assertLogs(level="WARNING"):
+            results = RDBMSExtractor(self.mock_connection, self.config).extract()
+
+        self.assertEqual({name: len(rows) for name, rows in results.items()}, {"users": 3, "orders": 3})
+        # The caller's connection holds the fourth one
+        self.assertLessEqual(peak[0], 3)
+
+    def test_partitioning_rejects_incremental(self):
+        """Test that partitioning cannot be combined with incremental extraction."""
+        self.config["watermarks"] = {"backend": "file"}
+        self.config["tables"][0].update(
+            extraction_mode="incremental",
+            incremental_column="updated_at",
+            primary_key="id",
+            partition_column="id",
+            num_partitions=4
+        )
+        with self.assertRaises(Exception):
+            RDBMSExtractor(self.mock_connection, self.config)
+
+    def test_arrow_output_format(self):
+        """Test that 'arrow' output builds record batches from cursor tuples."""
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+
+        self.config.update(stream=True, output_format="arrow")
+        result_proxy = self.mock_connection.execute.return_value
+        result_proxy.keys.return_value = ["id", "name", "email"]
+        result_proxy.partitions.return_value = iter([[tuple(user.values()) for user in self.sample_users]])
+
+        batches = list(RDBMSExtractor(self.mock_connection, self.config)())
+
+        self.assertEqual(len(batches), 1)
+        name, batch = batches[0]
+        self.assertIsInstance(batch, pyarrow.RecordBatch)
+        self.assertEqual(batch.to_pylist(), self.sample_users)
+        # No dict rows are built on the way
+        result_proxy.mappings.assert_not_called()
+
+    def test_pushdown_filters_joins_and_limit(self):
+        """Test that where/joins/order_by/limit are pushed into the SQL with bound params."""
+        self.config["tables"] = [{
+            "table_name": "orders",
+            "schema": "public",
+            "alias": "o",
+            "columns": ["o.order_id", "o.total_amount", "u.email AS user_email"],
+            "joins": [{"table_name": "users", "schema": "public", "alias": "u", "on": "u.id = o.user_id"}],
+            "where": "o.status = :status",
+            "params": {"status": "paid"},
+            "order_by": ["o.order_id DESC"],
+            "limit": 100
+        }]
+        self.mock_connection.execute.return_value.mappings.return_value = []
+
+        RDBMSExtractor(self.mock_connection, self.config).extract()
+
+        query, params = self.mock_connection.execute.call_args[0]
+        self.assertEqual(
+            str(query),
+            "SELECT o.order_id, o.total_amount, u.email AS user_email "
+            "FROM public.orders AS o INNER JOIN public.users AS u ON u.id = o.user_id "
+            "WHERE o.status = :status ORDER BY o.order_id DESC LIMIT :row_limit"
+        )
+        self.assertEqual(params, {"status": "paid", "row_limit": 100})
+
+    def test_pushdown_raw_query_is_wrapped(self):
+        """Test that a raw query becomes a derived table and combines with 'where'."""
+        self.config["tables"] = [{
+            "table_name": "user_totals",
+            "schema": "public",
+            "columns": None,
+            "query": "SELECT user_id, SUM(total_amount) AS total FROM public.orders GROUP BY user_id",
+            "where": "total > :minimum",
+            "params": {"minimum": 10}
+        }]
+        self.mock_connection.execute.return_value.mappings.return_value = []
+
+        RDBMSExtractor(self.mock_connection, self.config).extract()
+
+        self.assertEqual(
+            str(self.mock_connection.execute.call_args[0][0]),
+            "SELECT * FROM (SELECT user_id, SUM(total_amount) AS total FROM public.orders GROUP BY user_id) "
+            "AS src WHERE total > :minimum"
+        )
+
+    def test_pushdown_rejects_unsafe_sql(self):
+        """Test that statement separators, comments and bad identifiers are rejected."""
+        bad_entries = [
+            {"where": "1 = 1; DROP TABLE users"},
+            {"where": "id = 1 -- comment"},
+            {"columns": ["id; DELETE FROM users"]},
+            {"order_by": ["id DESC, (SELECT 1)"]},
+            {"query": "DELETE FROM public.users"},
+            {"table_name": "users u"},
+        ]
+        for bad in bad_entries:
+            config = {"tables": [dict(self.config["tables"][0], **bad)]}
+            with self.assertRaises(Exception, msg=str(bad)):
+                RDBMSExtractor(self.mock_connection, config)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from uuid import UUID
+from src.python.extractors.watermarks import FileWatermarkStore, WatermarkStoreFactory
+
+class TestFileWatermarkStore(unittest.TestCase):
+
+    def setUp(self):
+        """Point the store at a fresh state file."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "state", "watermarks.json")
+        self.store = WatermarkStoreFactory.get_store({"backend": "file", "path": self.path})
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_first_run_has_no_mark(self):
+        self.assertIsInstance(self.store, FileWatermarkStore)
+        self.assertIsNone(self.store.get("public.users"))
+
+    def test_staged_mark_is_invisible_until_commit(self):
+        """A mark must only advance after commit(), i.e. after a successful load."""
+        mark = {"value": datetime(2026, 1, 1, 10, 30), "key": 42}
+        self.store.stage("public.users", mark)
+
+        self.assertIsNone(self.store.get("public.users"))
+
+        self.store.commit()
+        self.assertEqual(self.store.get("public.users"), mark)
+
+    def test_types_survive_round_trip(self):
+        mark = {"value": Decimal("10.50"), "key": "abc"}
+        self.store.stage("public.orders", mark)
+        self.store.commit()
+
+        # A new store instance reads the same file
+        reloaded = FileWatermarkStore(self.path)
+        self.assertEqual(reloaded.get("public.orders"), mark)
+
+        with open(self.path) as f:
+            state = json.load(f)
+        self.assertEqual(state["pending"], {})
+
+    def test_uuid_time_and_bytes_survive_round_trip(self):
+        marks = {
+            "public.a": {"value": time(12, 30, 5, 250), "key": UUID("12345678-1234-5678-1234-567812345678")},
+            "public.b": {"value": timedelta(days=1, microseconds=7), "key": b"\x00\xffkey"},
+        }
+        for key, mark in marks.items():
+            self.store.stage(key, mark)
+        self.store.commit()
+
+        reloaded = FileWatermarkStore(self.path)
+        for key, mark in marks.items():
+            self.assertEqual(reloaded.get(key), mark)
+
+    def test_unsupported_type_is_rejected_when_staged(self):
+        with self.assertRaisesRegex(TypeError, "type object"):
+            self.store.stage("public.users", {"value": object(), "key": 1})
+
+    def test_stage_none_clears_pending(self):
+        self.store.stage("public.users", {"value": 1, "key": 1})
+        self.store.stage("public.users", None)
+        self.store.commit()
+        self.assertIsNone(self.store.get("public.users"))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(Exception):
+            WatermarkStoreFactory.get_store({"backend": "redis"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import pytest
+from decimal import Decimal
+from src.python.fingerprints import FingerprintFilter, TOMBSTONE_FIELD, fingerprint
+from src.python.transformers.json_transformer import JsonTransformer
+
+@pytest.fixture
+def config(tmp_path):
+    return {
+        "path": str(tmp_path / "fingerprints.db"),
+        "tables": {"teachers": {"primary_key": "teacher_id", "detect_deletes": True}}
+    }
+
+@pytest.fixture
+def teachers():
+    return [
+        {"teacher_id": 1, "name": "Asha", "salary": Decimal("10.50")},
+        {"teacher_id": 2, "name": "Ravi", "salary": Decimal("12.00")},
+    ]
+
+def run(data, config, commit=True):
+    stage = FingerprintFilter(data=data, config=config)
+    batches = list(stage())
+    if commit:
+        stage.commit()
+    return batches, stage.stats
+
+def test_fingerprint_ignores_key_order():
+    assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+def test_first_run_passes_everything(config, teachers):
+    batches, stats = run({"teachers": teachers}, config)
+    assert batches == [("teachers", teachers)]
+    assert stats["teachers"]["new"] == 2
+
+def test_unchanged_rows_are_dropped(config, teachers):
+    run({"teachers": teachers}, config)
+
+    changed = dict(teachers[1], name="Ravi K")
+    batches, stats = run({"teachers": [teachers[0], changed]}, config)
+
+    assert batches == [("teachers", [changed])]
+    assert stats["teachers"] == {"new": 0, "changed": 1, "unchanged": 1, "deleted": 0}
+
+def test_deleted_keys_become_tombstones(config, teachers):
+    run({"teachers": teachers}, config)
+
+    batches, _ = run([("teachers", [teachers[0]])], config)
+
+    assert batches == [("teachers", [{TOMBSTONE_FIELD: True, "_id": "2"}])]
+
+    # Once committed, the delete is not repeated
+    batches, _ = run({"teachers": [teachers[0]]}, config)
+    assert batches == []
+
+def test_uncommitted_run_is_replayed(config, teachers):
+    """If the load fails (no commit), the next run sends the same rows again."""
+    run({"teachers": teachers}, config, commit=False)
+    batches, _ = run({"teachers": teachers}, config)
+    assert batches == [("teachers", teachers)]
+
+def test_unconfigured_tables_pass_through(config):
+    rows = [{"id": 1}]
+    batches, _ = run({"courses": rows}, config)
+    assert batches == [("courses", rows)]
+
+def test_tombstones_become_delete_actions(config, teachers):
+    run({"teachers": teachers}, config)
+    stage = FingerprintFilter(data={"teachers": [teachers[0]]}, config=config)
+
+    actions = list(JsonTransformer(data=stage(), config={"index_name": "college_data"})())
+
+    assert actions == [{"_op_type": "delete", "_index": "college_data", "_id": "2"}]
@@ -0,0 +1,510 @@
+import json
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from elasticsearch import helpers
+from src.python.loaders.elasticsearch import (
+    AsyncElasticsearchBulkIngestor,
+    ElasticsearchBulkIngestor,
+    ElasticsearchSingleIngestor,
+)
+from src.python.loaders.factory import LoaderFactory
+
+@pytest.fixture
+def mock_es_client():
+    return MagicMock()
+
+@pytest.fixture
+def sample_config():
+    return {
+        "index_name": "health_data",
+        "settings": {"number_of_shards": 1},
+        "mappings": {"properties": {"patient_id": {"type": "keyword"}}}
+    }
+
+## 1. Test Index Creation (Parent Logic)
+def test_create_index_if_not_exists(mock_es_client, sample_config):
+    # Setup: Mock exists to return False
+    mock_es_client.indices.exists.return_value = False
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, sample_config)
+    
+    ingestor.create()
+    
+    # Verify: .create() was called with correct body
+    mock_es_client.indices.create.assert_called_once_with(
+        index="health_data",
+        body={"settings": ingestor.config.settings, "mappings": ingestor.config.mappings}
+    )
+
+## 2. Test Bulk Ingestor (Success Path)
+def test_bulk_ingestor_success(mock_es_client, sample_config):
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, sample_config)
+    data = [{"_index": "health_data", "_source": {"patient_id": "1"}}]
+    
+    with patch("elasticsearch.helpers.bulk") as mock_bulk:
+        mock_bulk.return_value = (1, []) # (success count, failed list)
+        ingestor.load(data)
+        mock_bulk.assert_called_once()
+
+## 2b. Test Bulk Ingestor consumes a lazy stream
+def test_bulk_ingestor_accepts_generator(mock_es_client, sample_config):
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, sample_config)
+    data = ({"_index": "health_data", "_source": {"patient_id": str(i)}} for i in range(3))
+
+    with patch("elasticsearch.helpers.bulk") as mock_bulk:
+        mock_bulk.return_value = (3, [])
+        ingestor.load(data)
+        # The generator is handed over as-is, so helpers.bulk chunks it lazily
+        assert mock_bulk.call_args[0][1] is data
+
+## 3. Test The Error Loop (The i < 3 logic)
+def test_bulk_ingestor_error_logging(mock_es_client, sample_config, caplog):
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, sample_config)
+    data = [{"bad": "data"}]
+    
+    # Simulate a BulkIndexError with 5 errors
+    sample_errors = [{"error": "detail"}] * 5
+    bulk_error = helpers.BulkIndexError("Message", errors=sample_errors)
+    
+    with patch("elasticsearch.helpers.bulk", side_effect=bulk_error):
+        with pytest.raises(helpers.BulkIndexError):
+            ingestor.load(data)
+    
+    # Verify: Did we log exactly 3 samples?
+    # caplog captures log output so you can assert that specific warnings or errors were recorded by your application.
+    error_logs = [record for record in caplog.records if "Sample Failure" in record.message]
+    assert len(error_logs) == 3
+    assert "Sample Failure" in error_logs[0].message
+
+## 4. Test Single Ingestor
+def test_single_ingestor_load(mock_es_client, sample_config):
+    ingestor = ElasticsearchSingleIngestor(mock_es_client, sample_config)
+    data = [{"_index": "health_data", "_source": {"patient_id": "1"}}]
+    
+    ingestor.load(data)
+    
+    # Verify: .index() was called instead of bulk
+    mock_es_client.index.assert_called_once_with(
+        index="health_data",
+        document={"patient_id": "1"}
+    )
+
+## 5. Test Async Bulk Ingestor
+def _fake_streaming_bulk(calls, fail=()):
+    async def streaming_bulk(client, actions, **kwargs):
+        calls.append(list(actions))
+        for action in actions:
+            if action["_source"]["patient_id"] in fail:
+                yield False, {"index": {"error": "mapper_parsing_exception"}}
+            else:
+                yield True, {"index": {"status": 201}}
+    return streaming_bulk
+
+def test_async_bulk_ingestor_chunks_and_counts(sample_config):
+    config = dict(sample_config, chunk_size=2, concurrency=3)
+    client = MagicMock()
+    client.indices.exists = AsyncMock(return_value=True)
+    ingestor = LoaderFactory.get_loader("elasticsearch_async", client, config)
+    assert isinstance(ingestor, AsyncElasticsearchBulkIngestor)
+
+    async def data():
+        for i in range(5):
+            yield {"_index": "health_data", "_source": {"patient_id": str(i)}}
+
+    calls = []
+    with patch("elasticsearch.helpers.async_streaming_bulk", _fake_streaming_bulk(calls)):
+        success, failed = asyncio.run(ingestor(data()))
+
+    assert (success, failed) == (5, 0)
+    assert sorted(len(chunk) for chunk in calls) == [1, 2, 2]
+    client.indices.create.assert_not_called()
+
+def test_async_bulk_ingestor_raises_on_failures(sample_config, caplog):
+    ingestor = AsyncElasticsearchBulkIngestor(MagicMock(), dict(sample_config, chunk_size=1))
+    data = [{"_index": "health_data", "_source": {"patient_id": str(i)}} for i in range(5)]
+
+    calls = []
+    fake = _fake_streaming_bulk(calls, fail={"0", "1", "2", "3"})
+    with patch("elasticsearch.helpers.async_streaming_bulk", fake):
+        with pytest.raises(helpers.BulkIndexError) as exc:
+            asyncio.run(ingestor.load(data))
+
+    # Only sample failures are kept, like the sync streaming modes
+    assert str(exc.value).startswith("4 document(s) failed")
+    assert len(exc.value.errors) == 3
+    error_logs = [record for record in caplog.records if "Sample Failure" in record.message]
+    assert len(error_logs) == 3
+
+## 6. Test Pre-encoded NDJSON Actions
+def test_expand_action_passes_bytes_through():
+    from src.python.loaders.elasticsearch import expand_action
+
+    assert expand_action(b'{"index":{"_id":"1"}}\n{"a":1}\n') == (b'{"index":{"_id":"1"}}', b'{"a":1}')
+    assert expand_action(b'{"delete":{"_id":"1"}}\n') == (b'{"delete":{"_id":"1"}}', None)
+    assert expand_action({"_index": "x", "_source": {"a": 1}}) == ({"index": {"_index": "x"}}, {"a": 1})
+
+def test_bulk_ingestor_sends_ndjson_to_configured_index(mock_es_client, sample_config):
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, sample_config)
+    data = [b'{"index":{}}\n{"patient_id":"1"}\n']
+
+    with patch("elasticsearch.helpers.bulk") as mock_bulk:
+        mock_bulk.return_value = (1, [])
+        ingestor.load(data)
+
+    kwargs = mock_bulk.call_args[1]
+    assert kwargs["index"] == "health_data"
+    assert kwargs["expand_action_callback"](data[0]) == (b'{"index":{}}', b'{"patient_id":"1"}')
+
+def test_async_bulk_ingestor_ignores_configured_statuses(sample_config):
+    ingestor = AsyncElasticsearchBulkIngestor(MagicMock(), dict(sample_config, ignore_status=[404]))
+
+    async def streaming_bulk(client, actions, **kwargs):
+        assert kwargs["ignore_status"] == [404]
+        for _ in actions:
+            yield False, {"delete": {"_id": "1", "status": 404, "result": "not_found"}}
+
+    with patch("elasticsearch.helpers.async_streaming_bulk", streaming_bulk):
+        success, failed = asyncio.run(ingestor.load([{"_op_type": "delete", "_id": "1"}]))
+
+    assert (success, failed) == (1, 0)
+
+## 7. Test Streaming / Parallel Modes
+def _results(statuses):
+    for status in statuses:
+        yield 200 <= status < 300, {"index": {"status": status, "error": None if status < 300 else "bad"}}
+
+@pytest.mark.parametrize("mode, helper", [("streaming", "streaming_bulk"), ("parallel", "parallel_bulk")])
+def test_streaming_modes_report_without_collecting(mode, helper, mock_es_client, sample_config, caplog):
+    config = dict(sample_config, mode=mode, chunk_size=2, thread_count=3, max_chunk_bytes=1024)
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, config)
+
+    with patch(f"elasticsearch.helpers.{helper}", return_value=_results([201] * 5)) as mock_helper:
+        caplog.set_level("INFO")
+        assert ingestor.load(iter([])) == (5, 0)
+
+    kwargs = mock_helper.call_args[1]
+    assert kwargs["chunk_size"] == 2 and kwargs["max_chunk_bytes"] == 1024
+    assert kwargs["raise_on_error"] is False
+    if mode == "parallel":
+        assert kwargs["thread_count"] == 3
+    chunk_logs = [r for r in caplog.records if r.message.startswith("Bulk chunk")]
+    assert len(chunk_logs) == 3
+
+def test_streaming_mode_raises_with_sampled_errors(mock_es_client, sample_config):
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, dict(sample_config, mode="streaming"))
+
+    with patch("elasticsearch.helpers.streaming_bulk", return_value=_results([400] * 10 + [201])):
+        with pytest.raises(helpers.BulkIndexError) as exc:
+            ingestor.load(iter([]))
+
+    assert "10 document(s)" in str(exc.value)
+    assert len(exc.value.errors) == 3
+
+## 8. Test Adaptive Mode
+def _bulk_response(*statuses):
+    return {"items": [{"index": {"status": s, "error": None if s < 300 else "rejected"}} for s in statuses]}
+
+def test_adaptive_mode_retries_only_rejected_documents(mock_es_client, sample_config):
+    config = dict(sample_config, mode="adaptive", chunk_size=3, adaptive={"min_chunk_size": 1})
+    mock_es_client.bulk.side_effect = [_bulk_response(201, 429, 201), _bulk_response(201)]
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, config)
+    actions = [b'{"index":{"_id":"%d"}}\n{"n":%d}\n' % (i, i) for i in range(3)]
+
+    with patch("src.python.loaders.adaptive.time.sleep") as sleep:
+        assert ingestor.load(iter(actions)) == (3, 0)
+
+    sleep.assert_called_once()
+    retried = mock_es_client.bulk.call_args_list[1][1]
+    assert retried["operations"] == [b'{"index":{"_id":"1"}}', b'{"n":1}']
+    assert retried["index"] == "health_data"
+    assert ingestor.stats["retried"] == 1 and ingestor.stats["requests"] == 2
+    # The rejection halved the chunk size (3 -> 1), the clean retry grew it again
+    assert ingestor.stats["chunk_size"] == 2
+
+def test_adaptive_mode_gives_up_after_max_retries(mock_es_client, sample_config):
+    config = dict(sample_config, mode="adaptive", adaptive={"max_retries": 2})
+    mock_es_client.bulk.return_value = _bulk_response(429)
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, config)
+
+    with patch("src.python.loaders.adaptive.time.sleep"):
+        with pytest.raises(helpers.BulkIndexError) as exc:
+            ingestor.load(iter([{"_index": "health_data", "_source": {"n": 1}}]))
+
+    assert mock_es_client.bulk.call_count == 3
+    assert exc.value.errors[0]["index"]["status"] == 429
+
+def test_adaptive_chunk_size_grows_and_shrinks():
+    from src.python.loaders.adaptive import AdaptiveChunkSize
+
+    chunks = AdaptiveChunkSize(initial=100, minimum=10, maximum=115, target_latency=1.0)
+    assert chunks.update(0.2, sent=100, rejected=0) == 110
+    assert chunks.update(0.2, sent=110, rejected=0) == 115
+    # A partial chunk says nothing about headroom
+    assert chunks.update(0.2, sent=5, rejected=0) == 115
+    assert chunks.update(2.0, sent=115, rejected=0) == 57
+    assert chunks.update(0.2, sent=57, rejected=3) == 28
+
+## 9. Test Bulk Load Mode
+_ORIGINAL_SETTINGS = {"health_data": {"settings": {"index.number_of_replicas": "1"}}}
+
+def test_bulk_load_mode_suspends_and_restores_settings(mock_es_client, sample_config):
+    config = dict(sample_config, bulk_load_mode={"force_merge_segments": 1})
+    mock_es_client.indices.exists.return_value = True
+    mock_es_client.indices.get_settings.return_value = _ORIGINAL_SETTINGS
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, config)
+
+    with patch("elasticsearch.helpers.bulk", return_value=(1, [])):
+        ingestor([{"_index": "health_data", "_source": {"patient_id": "1"}}])
+
+    applied, restored = [c[1] for c in mock_es_client.indices.put_settings.call_args_list]
+    assert applied["settings"] == {"index.refresh_interval": -1, "index.number_of_replicas": 0}
+    # The refresh interval was never set explicitly, so it goes back to the default
+    assert restored == {"index": "health_data", "settings": {"index.refresh_interval": None, "index.number_of_replicas": "1"}}
+    mock_es_client.indices.forcemerge.assert_called_once_with(index="health_data", max_num_segments=1)
+
+def test_bulk_load_mode_restores_settings_on_failure(mock_es_client, sample_config):
+    mock_es_client.indices.get_settings.return_value = _ORIGINAL_SETTINGS
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, dict(sample_config, bulk_load_mode={}))
+
+    with patch("elasticsearch.helpers.bulk", side_effect=helpers.BulkIndexError("1 document(s) failed.", [])):
+        with pytest.raises(helpers.BulkIndexError):
+            ingestor([{"_index": "health_data", "_source": {}}])
+
+    assert mock_es_client.indices.put_settings.call_count == 2
+    mock_es_client.indices.forcemerge.assert_not_called()
+
+def test_async_bulk_load_mode_restores_settings(sample_config):
+    client = MagicMock()
+    client.indices = AsyncMock()
+    client.indices.exists.return_value = True
+    client.indices.get_settings.return_value = _ORIGINAL_SETTINGS
+    ingestor = AsyncElasticsearchBulkIngestor(client, dict(sample_config, bulk_load_mode={}))
+
+    calls = []
+    with patch("elasticsearch.helpers.async_streaming_bulk", _fake_streaming_bulk(calls)):
+        asyncio.run(ingestor([{"_index": "health_data", "_source": {"patient_id": "1"}}]))
+
+    restored = client.indices.put_settings.call_args_list[-1][1]
+    assert restored["settings"]["index.number_of_replicas"] == "1"
+    client.indices.refresh.assert_awaited_once_with(index="health_data")
+
+## 10. Test Blue/Green Reindex
+def _reindex_client(client, serving=("health_data_v20260101000000",), counts=(100, 95)):
+    client.indices.exists.return_value = False
+    client.indices.exists_alias.return_value = bool(serving)
+    client.indices.get_alias.side_effect = lambda name=None, index=None: (
+        {old: {} for old in serving} if name else
+        {"health_data_v20250101000000": {}, "health_data_v20260101000000": {}, "health_data_vectors": {}}
+    )
+    client.indices.get_settings.return_value = {}
+    client.count.side_effect = lambda index: {"count": counts[0] if index == "health_data" else counts[1]}
+    return client
+
+def test_reindex_loads_new_generation_and_swaps_alias(mock_es_client, sample_config):
+    client = _reindex_client(mock_es_client)
+    ingestor = ElasticsearchBulkIngestor(client, dict(sample_config, reindex={}))
+    actions = [{"_index": "health_data", "_source": {"patient_id": "1"}}]
+
+    with patch("elasticsearch.helpers.bulk", return_value=(1, [])) as bulk:
+        ingestor(actions, full_reload=True)
+
+    new = ingestor.index_name
+    assert new.startswith("health_data_v") and new != "health_data_v20260101000000"
+    client.indices.create.assert_called_once()
+    assert client.indices.create.call_args[1]["index"] == new
+    # Dict actions are pointed at the new generation too
+    assert bulk.call_args[1]["index"] == new
+    assert list(bulk.call_args[0][1])[0]["_index"] == new
+    client.indices.update_aliases.assert_called_once_with(actions=[
+        {"remove": {"index": "health_data_v20260101000000", "alias": "health_data"}},
+        {"add": {"index": new, "alias": "health_data"}},
+    ])
+    # keep=1 spares the previous generation and unrelated indices
+    client.indices.delete.assert_called_once_with(index="health_data_v20250101000000")
+
+def test_reindex_replaces_a_concrete_index_named_like_the_alias(mock_es_client, sample_config):
+    client = _reindex_client(mock_es_client, serving=())
+    client.indices.exists.side_effect = lambda index: index == "health_data"
+    ingestor = ElasticsearchBulkIngestor(client, dict(sample_config, reindex={"keep": 5}))
+
+    with patch("elasticsearch.helpers.bulk", return_value=(1, [])):
+        ingestor([], full_reload=True)
+
+    actions = client.indices.update_aliases.call_args[1]["actions"]
+    assert actions == [{"remove_index": {"index": "health_data"}}, {"add": {"index": ingestor.index_name, "alias": "health_data"}}]
+
+def test_reindex_refuses_to_swap_a_short_generation(mock_es_client, sample_config):
+    client = _reindex_client(mock_es_client, counts=(100, 50))
+    ingestor = ElasticsearchBulkIngestor(client, dict(sample_config, reindex={}))
+
+    with patch("elasticsearch.helpers.bulk", return_value=(1, [])):
+        with pytest.raises(ValueError, match="fewer than 90%"):
+            ingestor([], full_reload=True)
+
+    client.indices.update_aliases.assert_not_called()
+    client.indices.delete.assert_called_once_with(index=ingestor.index_name, ignore_unavailable=True)
+
+def test_reindex_requires_a_full_reload(mock_es_client, sample_config):
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, dict(sample_config, reindex={}))
+
+    with pytest.raises(ValueError, match="full_reload=True"):
+        ingestor([{"_index": "health_data", "_source": {"patient_id": "1"}}])
+
+    mock_es_client.indices.create.assert_not_called()
+    assert ingestor.index_name == "health_data"
+
+def test_async_reindex_swaps_alias(sample_config):
+    client = MagicMock()
+    client.indices = AsyncMock()
+    client.count = AsyncMock()
+    _reindex_client(client)
+    ingestor = AsyncElasticsearchBulkIngestor(client, dict(sample_config, reindex={}))
+
+    calls = []
+    with patch("elasticsearch.helpers.async_streaming_bulk", _fake_streaming_bulk(calls)):
+        asyncio.run(ingestor([{"_index": "health_data", "_source": {"patient_id": "1"}}], full_reload=True))
+
+    assert calls[0][0]["_index"] == ingestor.index_name
+    client.indices.update_aliases.assert_awaited_once()
+    client.indices.delete.assert_awaited_once_with(index="health_data_v20250101000000")
+
+## 11. Test Staged, Resumable Loads
+def _staged_bulk(sent, fail=()):
+    def streaming_bulk(client, actions, **kwargs):
+        for action in actions:
+            doc_id = json.loads(action.split(b"\n")[0])
+            doc_id = next(iter(doc_id.values()))["_id"]
+            sent.append(doc_id)
+            status = 500 if doc_id in fail else 201
+            yield status < 300, {"index": {"_id": doc_id, "status": status}}
+    return streaming_bulk
+
+@pytest.fixture
+def staged_run(tmp_path):
+    from src.python.staging import SegmentWriter
+    actions = [{"_id": str(i), "_source": {"patient_id": str(i)}} for i in range(1, 6)]
+    SegmentWriter(tmp_path, {"path": str(tmp_path), "segment_size": 3})(actions)
+    return tmp_path
+
+def test_staged_load_resumes_after_failure(mock_es_client, sample_config, staged_run):
+    first, second = [], []
+    ingestor = LoaderFactory.get_loader("elasticsearch_staged", mock_es_client, dict(sample_config, chunk_size=2))
+
+    with patch("elasticsearch.helpers.streaming_bulk", _staged_bulk(first, fail={"4"})):
+        with pytest.raises(helpers.BulkIndexError):
+            ingestor(str(staged_run))
+
+    # A fresh ingestor, as in a retried task
+    ingestor = LoaderFactory.get_loader("elasticsearch_staged", mock_es_client, dict(sample_config, chunk_size=2))
+    with patch("elasticsearch.helpers.streaming_bulk", _staged_bulk(second)):
+        assert ingestor(str(staged_run)) == (2, 0)
+
+    assert first == ["1", "2", "3", "4", "5"]
+    # Only the failed segment is sent again
+    assert second == ["4", "5"]
+    checkpoint = json.loads((staged_run / "checkpoint.json").read_text())
+    assert checkpoint["offsets"] == {"segment-00000.ndjson.gz": 3, "segment-00001.ndjson.gz": 2}
+
+def test_staged_reindex_resumes_into_the_same_generation(mock_es_client, sample_config, staged_run):
+    client = _reindex_client(mock_es_client, counts=(5, 5))
+    config = dict(sample_config, reindex={"delete_on_failure": False})
+
+    ingestor = LoaderFactory.get_loader("elasticsearch_staged", client, config)
+    with patch("elasticsearch.helpers.streaming_bulk", _staged_bulk([], fail={"5"})):
+        with pytest.raises(helpers.BulkIndexError):
+            ingestor(str(staged_run), full_reload=True)
+    generation = ingestor.index_name
+
+    client.indices.exists.side_effect = lambda index: index == generation
+    ingestor = LoaderFactory.get_loader("elasticsearch_staged", client, config)
+    with patch("elasticsearch.helpers.streaming_bulk", _staged_bulk([])):
+        ingestor(str(staged_run), full_reload=True)
+
+    assert ingestor.index_name == generation
+    assert client.indices.update_aliases.call_args[1]["actions"][-1] == {"add": {"index": generation, "alias": "health_data"}}
+
+## 12. Test Vector Mappings
+def _embedded(n, dims=3):
+    yield {"_op_type": "delete", "_index": "health_data", "_id": "gone"}
+    for i in range(n):
+        yield {"_index": "health_data", "_id": str(i), "_source": {"text": "t", "vector": [0.1] * dims}}
+
+def test_vector_mapping_is_derived_from_the_first_vector(mock_es_client, sample_config):
+    mock_es_client.indices.exists.return_value = False
+    config = dict(sample_config, vectors={"exclude_from_source": True, "index_options": {"m": 32}})
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, config)
+
+    with patch("elasticsearch.helpers.bulk", return_value=(3, [])) as bulk:
+        ingestor(_embedded(2, dims=384))
+
+    # Peeked records are still loaded
+    assert len(list(bulk.call_args[0][1])) == 3
+    mappings = mock_es_client.indices.create.call_args[1]["body"]["mappings"]
+    assert mappings["properties"]["patient_id"] == {"type": "keyword"}
+    assert mappings["properties"]["vector"] == {
+        "type": "dense_vector",
+        "dims": 384,
+        "index": True,
+        "similarity": "cosine",
+        "index_options": {"type": "int8_hnsw", "m": 32, "ef_construction": 100},
+    }
+    assert mappings["_source"] == {"excludes": ["vector"]}
+    # The configured mappings are not modified
+    assert "vector" not in ingestor.config.mappings["properties"]
+
+def test_vector_dims_from_ndjson_and_flat_index_options(mock_es_client, sample_config):
+    config = dict(sample_config, vectors={"field": "embedding", "index_options": {"type": "int8_flat"}})
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, config)
+
+    ingestor.detect_vectors([b'{"update":{"_id":"1"}}\n{"doc":{"embedding":[1.0,2.0]},"doc_as_upsert":true}\n'])
+
+    assert ingestor.dims == 2
+    assert ingestor.mappings()["properties"]["embedding"]["index_options"] == {"type": "int8_flat"}
+
+def test_confidence_interval_only_for_int8_and_int4_types(mock_es_client, sample_config):
+    config = dict(sample_config, vectors={"index_options": {"type": "int4_hnsw", "confidence_interval": 0.9}})
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, config)
+    ingestor.dims = 4
+
+    assert ingestor.mappings()["properties"]["vector"]["index_options"]["confidence_interval"] == 0.9
+    for index_type in ("hnsw", "bbq_hnsw", "flat"):
+        config = dict(sample_config, vectors={"index_options": {"type": index_type, "confidence_interval": 0.9}})
+        with pytest.raises(ValueError, match="confidence_interval"):
+            ElasticsearchBulkIngestor(mock_es_client, config)
+
+def test_no_vectors_leaves_mappings_as_configured(mock_es_client, sample_config, caplog):
+    ingestor = ElasticsearchBulkIngestor(mock_es_client, dict(sample_config, vectors={}))
+
+    data = ingestor.detect_vectors(iter([{"_index": "health_data", "_source": {"patient_id": "1"}}]))
+
+    assert len(list(data)) == 1
+    assert ingestor.mappings() == sample_config["mappings"]
+    assert "No 'vector' vectors found" in caplog.text
+
+def test_async_ingestor_peeks_async_iterables(sample_config):
+    ingestor = AsyncElasticsearchBulkIngestor(MagicMock(), dict(sample_config, vectors={}))
+
+    async def data():
+        for record in _embedded(2, dims=8):
+            yield record
+
+    async def run():
+        peeked = await ingestor.detect_vectors(data())
+        return [record async for record in peeked]
+
+    assert len(asyncio.run(run())) == 3
+    assert ingestor.mappings()["properties"]["vector"]["dims"] == 8
+
+def test_staged_adaptive_mode_retries_and_checkpoints_segments(mock_es_client, sample_config, staged_run):
+    responses = iter([_bulk_response(201, 429, 201)])
+    mock_es_client.bulk.side_effect = lambda operations, index: next(
+        responses, _bulk_response(*[201] * sum(line.startswith(b'{"index"') for line in operations))
+    )
+    ingestor = LoaderFactory.get_loader("elasticsearch_staged", mock_es_client, dict(sample_config, mode="adaptive"))
+
+    with patch("src.python.loaders.adaptive.time.sleep"):
+        assert ingestor(str(staged_run)) == (5, 0)
+
+    assert ingestor.stats["retried"] == 1 and ingestor.stats["documents"] == 5
+    checkpoint = json.loads((staged_run / "checkpoint.json").read_text())
+    assert checkpoint["offsets"] == {"segment-00000.ndjson.gz": 3, "segment-00001.ndjson.gz": 2}
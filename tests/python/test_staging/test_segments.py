@@ -0,0 +1,61 @@
+import pytest
+
+from src.python.staging import Checkpoint, SegmentReader, SegmentWriter
+
+ACTIONS = [
+    {"_op_type": "index", "_index": "college_data", "_id": "1", "_source": {"name": "Ada"}},
+    {"_op_type": "delete", "_index": "college_data", "_id": "2"},
+    b'{"index":{"_id":"3"}}\n{"name":"Grace"}\n',
+    {"_op_type": "update", "_id": "4", "doc": {"name": "Linus"}, "doc_as_upsert": True},
+    {"_op_type": "index", "_id": "5", "_source": {"name": "Barbara"}},
+]
+
+@pytest.mark.parametrize("compression", ["gzip", "none"])
+def test_segments_round_trip(tmp_path, compression):
+    manifest = SegmentWriter(tmp_path, {"path": str(tmp_path), "segment_size": 2, "compression": compression})(ACTIONS)
+
+    reader = SegmentReader(tmp_path)
+    assert [segment.documents for segment in reader.segments] == [2, 2, 1]
+    assert reader.run_id == manifest["run_id"]
+    actions = list(reader)
+    assert actions[0] == b'{"index":{"_id":"1"}}\n{"name":"Ada"}\n'
+    # Deletes have no source line
+    assert actions[1] == b'{"delete":{"_id":"2"}}\n'
+    assert actions[2] == ACTIONS[2]
+    assert actions[3] == b'{"update":{"_id":"4"}}\n{"doc":{"name":"Linus"},"doc_as_upsert":true}\n'
+
+def test_line_framing_does_not_depend_on_the_encoding(tmp_path):
+    actions = [b'{ "delete": {"_id": "1"}}', b'{"_id": "2", "index": {}}\n{"n": 2}\n', b'{"delete":{"_id":"3"}}\n']
+    SegmentWriter(tmp_path, {"path": str(tmp_path)})(actions)
+
+    assert list(SegmentReader(tmp_path)) == [actions[0] + b"\n", actions[1], actions[2]]
+
+def test_malformed_actions_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        SegmentWriter(tmp_path, {"path": str(tmp_path)})([b'{"index":{}}\n{"a":1}\n{"b":2}\n'])
+
+def test_read_skips_acknowledged_documents(tmp_path):
+    SegmentWriter(tmp_path, {"path": str(tmp_path), "segment_size": 3})(ACTIONS)
+    reader = SegmentReader(tmp_path)
+
+    assert list(reader.read(reader.segments[0], start=2)) == [ACTIONS[2]]
+
+def test_unfinished_staging_is_not_readable(tmp_path):
+    SegmentWriter(tmp_path, {"path": str(tmp_path)})(ACTIONS)
+    (tmp_path / "manifest.json").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        SegmentReader(tmp_path)
+
+def test_checkpoint_persists_and_discards_other_runs(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    checkpoint = Checkpoint(path, "run-1")
+    checkpoint.reset("college_data_v1")
+    checkpoint.update("segment-00000.ndjson.gz", 500)
+
+    resumed = Checkpoint(path, "run-1")
+    assert resumed.index == "college_data_v1"
+    assert resumed.offset("segment-00000.ndjson.gz") == 500
+
+    other = Checkpoint(path, "run-2")
+    assert other.index is None and other.offset("segment-00000.ndjson.gz") == 0
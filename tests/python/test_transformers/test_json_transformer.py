@@ -1,7 +1,9 @@
 import pytest
 from decimal import Decimal
-from datetime import datetime
+from datetime import date, datetime
 from unittest.mock import MagicMock
+from uuid import UUID
+from src.python.transformers.base import BaseTransformer
 from src.python.transformers.json_transformer import JsonTransformer
 
 @pytest.fixture
@@ -82,4 +84,181 @@ def test_transform_no_schema_fallback(mock_config):
     results = list(transformer())
 
     assert len(results) == 1
-    assert results[0]["_source"]["some_key"] == "some_value"
\ No newline at end of file
+    assert results[0]["_source"]["some_key"] == "some_value"
+
+def test_transform_streamed_batches(sample_data, mock_config):
+    """Verifies that (table_name, rows) batches from a streaming extractor are accepted."""
+    batches = ((table, [row]) for table, rows in sample_data.items() for row in rows)
+
+    transformer = JsonTransformer(data=batches, config=mock_config)
+    results = list(transformer())
+
+    assert len(results) == 2
+    assert results[0]["_source"]["username"] == "jdoe"
+    assert results[1]["_source"]["price"] == 19.99
+
+def test_transform_columnar_matches_row_path(mock_config):
+    """Verifies that columnar batches are cleaned exactly like dict rows."""
+    pa = pytest.importorskip("pyarrow")
+    rows = [
+        {"sku": "A-1", "price": Decimal("19.99"), "created_at": datetime(2023, 1, 1, 10, 0)},
+        {"sku": None, "price": None, "created_at": datetime(2023, 1, 1, 10, 0, 0, 5)},
+    ]
+
+    columnar = list(JsonTransformer(data={"inventory": pa.RecordBatch.from_pylist(rows)}, config=mock_config)())
+    row_wise = list(JsonTransformer(data={"inventory": rows}, config=mock_config)())
+
+    assert columnar == row_wise
+    assert columnar[0]["_source"] == {"sku": "A-1", "price": 19.99, "created_at": "2023-01-01T10:00:00"}
+
+def test_transform_columnar_with_schema_validates_rows(sample_data, mock_config):
+    """Verifies that columnar batches of tables with a schema still go through validation."""
+    pa = pytest.importorskip("pyarrow")
+    data = {"products": pa.Table.from_pylist(sample_data["products"])}
+
+    results = list(JsonTransformer(data=data, config=mock_config)())
+
+    assert len(results) == 1
+    assert results[0]["_source"]["price"] == 19.99
+
+
+def test_compile_plan_skips_json_ready_columns():
+    """Verifies that only columns needing conversion get a converter."""
+    rows = [
+        {"id": 1, "name": "a", "price": None, "born": date(2000, 1, 2)},
+        {"id": 2, "name": "b", "price": Decimal("1.5"), "born": None},
+    ]
+
+    plan = dict(BaseTransformer.compile_plan(rows))
+
+    assert set(plan) == {"price", "born"}
+    assert plan["price"] is float
+
+def test_plan_formats_mixed_temporal_columns_per_value(mock_config):
+    """Verifies that a date in a column sampled as datetime is neither dropped nor mangled."""
+    rows = [
+        {"id": 1, "at": datetime(2023, 1, 1, 10, 0), "on": date(2023, 1, 1)},
+        {"id": 2, "at": date(2023, 1, 2), "on": datetime(2023, 1, 2, 11, 30)},
+    ]
+    transformer = JsonTransformer(data={"inventory": rows}, config=mock_config)
+    transformer.plans["inventory"] = BaseTransformer.compile_plan(rows[:1])
+
+    results = list(transformer())
+
+    assert len(results) == 2
+    assert results[1]["_source"]["at"] == "2023-01-02"
+    assert results[1]["_source"]["on"] == "2023-01-02T11:30:00"
+
+def test_plan_matches_clean_value(mock_config):
+    """Verifies that planned rows are cleaned exactly like the per-cell path."""
+    rows = [
+        {"id": 1, "uid": UUID(int=1), "price": Decimal("19.99"), "at": datetime(2023, 1, 1, 10, 0), "note": None},
+        {"id": 2, "uid": None, "price": None, "at": None, "note": Decimal("2")},
+    ]
+    transformer = JsonTransformer(data={"inventory": rows}, config=mock_config)
+
+    planned = list(transformer())
+    per_cell = [transformer.transform(row) for row in rows]
+
+    assert planned == per_cell
+    assert planned[1]["_source"]["note"] == 2.0
+    assert "inventory" in transformer.plans
+
+def _users(count, dirty=()):
+    rows = []
+    for i in range(count):
+        row = {
+            "id": i,
+            "username": f"user{i}",
+            "email": f"user{i}@example.com",
+            "created_at": datetime(2023, 1, 1, 10, 0),
+            "updated_at": datetime(2023, 1, 1, 10, 0)
+        }
+        if i in dirty:
+            row["extra_column"] = "not allowed"
+        rows.append(row)
+    return rows
+
+def test_batch_validation_drops_only_dirty_rows(mock_config):
+    """Verifies that one bad row does not reject the rest of its batch."""
+    transformer = JsonTransformer(data={"users": _users(5, dirty={1, 3})}, config=mock_config)
+
+    results = list(transformer())
+
+    assert [r["_source"]["id"] for r in results] == [0, 2, 4]
+
+def test_validation_off_trusts_rows(mock_config):
+    """Verifies that 'off' formats rows without checking the schema."""
+    config = dict(mock_config, validation="off")
+
+    results = list(JsonTransformer(data={"users": _users(3, dirty={1})}, config=config)())
+
+    assert len(results) == 3
+    assert results[1]["_source"]["extra_column"] == "not allowed"
+
+def test_validation_sample_falls_back_to_full(mock_config):
+    """Verifies that a failing sample validates the whole batch."""
+    config = dict(mock_config, validation="sample(10)")
+
+    clean = list(JsonTransformer(data={"users": _users(3)}, config=config)())
+    dirty = list(JsonTransformer(data={"users": _users(3, dirty={2})}, config=config)())
+
+    assert len(clean) == 3
+    assert [r["_source"]["id"] for r in dirty] == [0, 1]
+
+def test_invalid_validation_policy(mock_config):
+    with pytest.raises(ValueError):
+        JsonTransformer(data={}, config=dict(mock_config, validation="sometimes"))
+
+def test_ndjson_output(sample_data, mock_config):
+    """Verifies that ndjson output encodes the same documents as the dict path."""
+    import json
+    config = dict(mock_config, output_format="ndjson")
+
+    encoded = list(JsonTransformer(data=sample_data, config=config)())
+    dicts = list(JsonTransformer(data=sample_data, config=mock_config)())
+
+    assert all(isinstance(item, bytes) for item in encoded)
+    assert [json.loads(item.splitlines()[1]) for item in encoded] == [d["_source"] for d in dicts]
+    assert json.loads(encoded[0].splitlines()[0]) == {"index": {}}
+
+def _teachers():
+    return [
+        {"teacher_id": 7, "name": "Ada", "dept": "math"},
+        {"teacher_id": 8, "name": "Alan", "dept": "cs"},
+    ]
+
+def test_document_ids_from_columns_are_stable(mock_config):
+    """Verifies that reloading the same rows targets the same documents."""
+    config = dict(mock_config, documents={"teachers": {"id_columns": "teacher_id"}})
+
+    first = list(JsonTransformer(data={"teachers": _teachers()}, config=config)())
+    second = list(JsonTransformer(data={"teachers": _teachers()}, config=config)())
+
+    assert [a["_id"] for a in first] == ["7", "8"] == [a["_id"] for a in second]
+    assert "_op_type" not in first[0]
+
+def test_document_update_and_hashed_ids(mock_config):
+    """Verifies partial updates with upsert and hashed composite ids."""
+    documents = {"teachers": {"id_columns": ["dept", "teacher_id"], "id_strategy": "hash", "op_type": "update"}}
+    rows = _teachers() + [{"_deleted": True, "_id": '["math",7]'}]
+
+    actions = list(JsonTransformer(data={"teachers": rows}, config=dict(mock_config, documents=documents))())
+
+    assert actions[0]["_op_type"] == "delete"
+    assert actions[0]["_id"] == actions[1]["_id"]
+    assert len(actions[1]["_id"]) == 32
+    assert actions[1]["doc"] == _teachers()[0]
+    assert actions[1]["doc_as_upsert"] is True
+
+def test_document_delete_table_in_ndjson(mock_config):
+    """Verifies that a delete table becomes bare delete lines."""
+    config = dict(mock_config, output_format="ndjson", documents={"teachers": {"id_columns": "teacher_id", "op_type": "delete"}})
+
+    encoded = list(JsonTransformer(data={"teachers": _teachers()}, config=config)())
+
+    assert encoded == [b'{"delete":{"_id":"7"}}\n', b'{"delete":{"_id":"8"}}\n']
+
+def test_document_config_requires_columns_for_updates(mock_config):
+    with pytest.raises(ValueError):
+        JsonTransformer(data={}, config=dict(mock_config, documents={"teachers": {"id_strategy": "hash", "op_type": "update"}}))
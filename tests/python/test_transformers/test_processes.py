@@ -0,0 +1,42 @@
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+from src.python.transformers.json_transformer import JsonTransformer
+
+def _batches(count, size=3):
+    return [
+        ("products", [
+            {
+                "id": batch * size + i,
+                "name": f"item{i}",
+                "price": Decimal("1.25"),
+                "stock": i,
+                "created_at": datetime(2023, 1, 1, 10, 0),
+                "updated_at": datetime(2023, 1, 1, 10, 0)
+            }
+            for i in range(size)
+        ])
+        for batch in range(count)
+    ]
+
+def _config(**processes):
+    return {"index_name": "health_data", "processes": dict(workers=2, **processes)}
+
+def test_process_pool_matches_serial_order():
+    serial = list(JsonTransformer(data=_batches(6), config={"index_name": "health_data"})())
+    pooled = list(JsonTransformer(data=iter(_batches(6)), config=_config(max_in_flight=2))())
+
+    assert pooled == serial
+    assert pooled[0]["_source"]["price"] == 1.25
+
+def test_process_pool_unordered_yields_every_batch():
+    pooled = list(JsonTransformer(data=iter(_batches(6)), config=_config(ordered=False))())
+
+    assert sorted(r["_source"]["id"] for r in pooled) == list(range(18))
+
+def test_process_pool_surfaces_worker_errors():
+    batches = _batches(2) + [("products", [None])]
+
+    with pytest.raises(AttributeError):
+        list(JsonTransformer(data=iter(batches), config=_config())())
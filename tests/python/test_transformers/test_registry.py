@@ -0,0 +1,66 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.python.transformers.json_transformer import JsonTransformer
+from src.python.transformers.registry import SchemaRegistry, build_model, reflect_schemas
+from src.python.transformers.schemas import UserRecord
+
+@pytest.fixture
+def spec_path(tmp_path):
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        connection.execute(text(
+            "CREATE TABLE teachers (teacher_id INTEGER NOT NULL, name VARCHAR(50), "
+            "salary NUMERIC(10, 2), updated_at DATETIME, _rev INTEGER)"
+        ))
+        path = tmp_path / "schemas.json"
+        reflect_schemas(connection, [{"table_name": "teachers"}], str(path))
+    return path
+
+def test_reflect_schemas_writes_specs(spec_path):
+    specs = json.loads(spec_path.read_text())
+
+    assert specs["teachers"]["teacher_id"] == {"type": "int", "nullable": False}
+    assert specs["teachers"]["salary"]["type"] == "decimal"
+    assert specs["teachers"]["updated_at"]["type"] == "datetime"
+
+def test_reflect_schemas_skips_cached_tables(spec_path):
+    # No connection is touched when every table is already cached
+    specs = reflect_schemas(None, [{"table_name": "teachers"}], str(spec_path))
+    assert "teachers" in specs
+
+def test_registry_defaults_and_explicit_models():
+    registry = SchemaRegistry({"models": {"members": "src.python.transformers.schemas:UserRecord"}})
+
+    assert registry.get("users") is UserRecord
+    assert registry.get("members") is UserRecord
+    assert registry.get("teachers") is None
+
+def test_reflected_model_validates_selected_columns(spec_path):
+    config = {
+        "index_name": "college_data",
+        "schemas": {"reflection": {"path": str(spec_path)}}
+    }
+    rows = [
+        {"teacher_id": "1", "name": "Ada", "_rev": 2},
+        {"teacher_id": None, "name": "Bad"},
+        {"teacher_id": 3, "salary": Decimal("10.50"), "updated_at": datetime(2024, 1, 1)},
+    ]
+
+    results = list(JsonTransformer(data={"teachers": rows}, config=config)())
+
+    # Coerced, null primary key rejected, unselected columns not added
+    assert [r["_source"] for r in results] == [
+        {"teacher_id": 1, "name": "Ada", "_rev": 2},
+        {"teacher_id": 3, "salary": 10.5, "updated_at": "2024-01-01T00:00:00"},
+    ]
+
+def test_built_models_are_shared(spec_path):
+    specs = json.loads(spec_path.read_text())
+    spec = json.dumps(specs["teachers"], sort_keys=True)
+
+    assert build_model("teachers", spec) is build_model("teachers", spec)
@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import MagicMock
+
+from src.python.transformers.factory import TransformerFactory
+from src.python.transformers.text_chunker import TextChunkTransformer
+
+def _action(body, **meta):
+    return {"_index": "college_data", **meta, "_source": body}
+
+def test_short_text_is_one_chunk():
+    data = [_action({"name": "Ada", "bio": "Wrote the first program.", "age": 36}, _id="7")]
+    config = {"fields": ["name", "bio"], "labels": True}
+
+    chunks = list(TransformerFactory.get_transformer("text_chunks", data, config)())
+
+    assert len(chunks) == 1
+    source = chunks[0]["_source"]
+    assert chunks[0]["_id"] == "7#0"
+    assert source["text"] == "name: Ada\nbio: Wrote the first program."
+    assert (source["parent_id"], source["chunk_index"], source["age"]) == ("7", 0, 36)
+
+def test_long_text_is_split_with_overlap():
+    words = [f"w{i}" for i in range(10)]
+    data = [_action({"bio": " ".join(words)}, _id="1")]
+
+    chunks = list(TextChunkTransformer(data, {"fields": ["bio"], "max_tokens": 4, "overlap": 1, "keep_source": False})())
+
+    texts = [c["_source"]["text"] for c in chunks]
+    assert texts == ["w0 w1 w2 w3", "w3 w4 w5 w6", "w6 w7 w8 w9"]
+    start, end = chunks[1]["_source"]["offsets"].values()
+    assert " ".join(words)[start:end] == texts[1]
+    assert set(chunks[0]["_source"]) == {"text", "parent_id", "chunk_index", "offsets"}
+
+def test_updates_deletes_and_empty_text():
+    update = {"_index": "x", "_id": "2", "_op_type": "update", "doc": {"bio": "a b"}, "doc_as_upsert": True}
+    delete = {"_index": "x", "_id": "3", "_op_type": "delete"}
+    empty = _action({"bio": None}, _id="4")
+
+    chunks = list(TextChunkTransformer([update, delete, empty], {"fields": ["bio"]})())
+
+    assert chunks[0]["_op_type"] == "update" and chunks[0]["doc"]["text"] == "a b"
+    assert chunks[0]["doc_as_upsert"] is True
+    assert chunks[1:] == [delete, empty]
+
+def test_whitespace_only_text_passes_through():
+    blank = _action({"name": "   "}, _id="5")
+
+    assert list(TextChunkTransformer([blank], {"fields": ["name"]})()) == [blank]
+
+def test_parent_deletes_remove_chunks_by_query(caplog):
+    delete = {"_index": "x", "_id": "3", "_op_type": "delete"}
+    transformer = TextChunkTransformer([delete], {"fields": ["bio"]})
+    assert list(transformer()) == [delete]
+    assert "1 changed parent(s) may keep chunks of earlier runs" in caplog.text
+
+    client = MagicMock()
+    client.delete_by_query.return_value = {"deleted": 4}
+    assert transformer.delete_chunks(client, "x") == 4
+    client.delete_by_query.assert_called_once_with(
+        index="x",
+        query={"bool": {"filter": [{"terms": {"parent_id": ["3"]}}, {"range": {"chunk_index": {"gte": 0}}}]}},
+        conflicts="proceed",
+        refresh=True,
+    )
+
+def test_shrunk_text_deletes_higher_numbered_chunks_and_the_whole_parent():
+    config = {"fields": ["bio"], "max_tokens": 4, "overlap": 1}
+    def update(text):
+        return {"_index": "x", "_id": "1", "_op_type": "update", "doc": {"bio": text}, "doc_as_upsert": True}
+
+    # The earlier run wrote three chunks; the text now fits one
+    earlier = list(TextChunkTransformer([update(" ".join(f"w{i}" for i in range(10)))], config)())
+    assert [chunk["_id"] for chunk in earlier] == ["1#0", "1#1", "1#2"]
+    transformer = TextChunkTransformer([update("w0 w1")], config)
+
+    assert [chunk["_id"] for chunk in transformer()] == ["1#0"]
+    assert transformer.chunk_counts == {"1": 1}
+
+    client = MagicMock()
+    client.delete_by_query.return_value = {"deleted": 2}
+    assert transformer.delete_chunks(client, "x") == 2
+    stale = {"bool": {"filter": [{"terms": {"parent_id": ["1"]}}, {"range": {"chunk_index": {"gte": 1}}}]}}
+    assert client.delete_by_query.call_args.kwargs["query"] == {
+        "bool": {"should": [stale, {"ids": {"values": ["1"]}}], "minimum_should_match": 1}
+    }
+
+def test_overlap_must_be_smaller_than_chunk():
+    with pytest.raises(ValueError):
+        TextChunkTransformer([], {"fields": ["bio"], "max_tokens": 4, "overlap": 4})
@@ -0,0 +1,43 @@
+import json
+import unittest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import UUID
+
+from src.python.transformers.base import BaseTransformer
+from src.python.utils import ndjson
+
+ROW = {
+    "id": 1,
+    "name": "Ada",
+    "price": Decimal("19.99"),
+    "born": date(1815, 12, 10),
+    "at": datetime(2024, 1, 1, 10, 0, 0, 5, tzinfo=timezone.utc),
+    "uid": UUID(int=1),
+    "tags": ["a"],
+    "missing": None,
+}
+
+class TestNdjson(unittest.TestCase):
+
+    def test_index_action_matches_cleaned_source(self):
+        action, source = ndjson.encode_action({"_id": "1", "_index": "x", "_source": ROW}).splitlines()
+
+        self.assertEqual(json.loads(action), {"index": {"_id": "1"}})
+        self.assertEqual(json.loads(source), BaseTransformer({}).transform(ROW)["_source"])
+
+    def test_delete_action_has_no_source(self):
+        encoded = ndjson.encode_action({"_op_type": "delete", "_id": "7"})
+
+        self.assertEqual(encoded, b'{"delete":{"_id":"7"}}\n')
+
+    def test_stdlib_fallback_matches_orjson(self):
+        encoded = ndjson.encode_action({"_source": ROW})
+        with patch.object(ndjson, "ORJSON_AVAILABLE", False):
+            fallback = ndjson.encode_action({"_source": ROW})
+
+        self.assertEqual(json.loads(fallback.splitlines()[1]), json.loads(encoded.splitlines()[1]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import ast
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.python.utils.registry import LazyRegistry
+
+ROOT = Path(__file__).resolve().parents[3]
+
+def dag_imports(path=ROOT / "dags" / "rdbms" / "rdbms.py"):
+    """
+    Returns import statements for the project modules the DAG file imports 
+    at parse time (credentials needs airflow itself), read from its source 
+    so new DAG imports are covered automatically.
+    """
+    modules = []
+    for node in ast.parse(path.read_text()).body:
+        if isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+        elif isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+    return "".join(
+        f"import {module}\n" for module in modules
+        if module.startswith("src.python.") and not module.startswith("src.python.credentials")
+    )
+
+DAG_IMPORTS = dag_imports()
+
+HEAVY_MODULES = ("sqlalchemy", "elasticsearch", "txtai", "torch", "pyarrow")
+
+def import_profile(code):
+    """
+    Runs `code` under `python -X importtime` and returns the cumulative
+    import time (microseconds) of every top-level package it loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        root = name.split(".")[0]
+        profile[root] = max(profile.get(root, 0), int(cumulative))
+    return profile
+
+class TestLazyRegistry(unittest.TestCase):
+
+    def test_import_on_first_use(self):
+        registry = LazyRegistry("water_bottle.test", builtins={"Json": "json:dumps"})
+
+        self.assertIn("json", registry)
+        self.assertIs(registry.get("JSON"), json.dumps)
+
+    def test_relative_target_and_objects(self):
+        registry = LazyRegistry("water_bottle.test", "src.python.utils", {"keys": ".keys:compose_key"})
+        registry.register("custom", dict)
+
+        self.assertEqual(registry.get("keys").__name__, "compose_key")
+        self.assertIs(registry.get("custom"), dict)
+        self.assertEqual(registry.names(), ["custom", "keys"])
+
+    def test_entry_points_are_discovered_once(self):
+        entry_point = MagicMock(value="json:loads")
+        entry_point.name = "Plugin"
+        registry = LazyRegistry("water_bottle.test")
+
+        with patch("src.python.utils.registry.entry_points", return_value=[entry_point]) as mock_eps:
+            self.assertIs(registry.get("plugin"), json.loads)
+            self.assertNotIn("missing", registry)
+            with self.assertRaises(KeyError):
+                registry.get("missing")
+
+        mock_eps.assert_called_once_with(group="water_bottle.test")
+
+    def test_factory_unknown_type(self):
+        from src.python.connectors.factory import ConnectorFactory
+
+        with self.assertRaises(ValueError):
+            ConnectorFactory.get_connector("mongodb", config={})
+
+class TestImportTime(unittest.TestCase):
+
+    def test_dag_imports_skip_heavy_modules(self):
+        """Benchmark: the DAG's parse-time imports must not load any heavy client library."""
+        profile = import_profile(DAG_IMPORTS)
+
+        top = sorted(profile.items(), key=lambda item: -item[1])[:5]
+        print("\nDAG import time (us):", ", ".join(f"{name}={us}" for name, us in top))
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, profile)
+
+    def test_factory_loads_implementation_on_demand(self):
+        profile = import_profile(
+            "from src.python.loaders.factory import LOADERS\n"
+            "LOADERS.get('elasticsearch')"
+        )
+        self.assertIn("elasticsearch", profile)
+
+if __name__ == "__main__":
+    unittest.main()